@@ -3,315 +3,58 @@ Abhi Vyakti Festival - Optimal Itinerary Planner
 A dynamic programming-based tool to generate optimal festival schedules.
 """
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-from datetime import datetime
 from collections import defaultdict
-from typing import Dict, List, Tuple, FrozenSet, Optional, Set
+from typing import Dict, List
 import os
 
 # Import configuration
 from config import (
-    POINTS_PER_PERFORMANCE,
-    POINTS_PER_NEW_CATEGORY,
     DATE_FORMAT,
-    TIME_FORMAT
+    TIME_FORMAT,
+    NUM_ALTERNATIVE_ITINERARIES,
+    PREFERENCE_VOTE_POINTS,
+    VENUE_LOCK_IN,
+    RESULT_CACHE_SIZE,
+    SOLVE_TIME_BUDGET_SECONDS,
+    MAX_ALTERNATIVE_TRANSITIONS,
+    MAX_EXACT_TRANSITIONS
+)
+
+# Import data loading and optimization engine
+from optimizer import (
+    EventTable,
+    PerformanceOptimizer,
+    ResultCache,
+    ScoringModel,
+    load_festival_data,
+    profile_exclusions
 )
 
-# Import visualization module
-try:
-    from visualizations import PerformanceVisualizer, display_visualization_dashboard
-except ImportError:
-    PerformanceVisualizer = None
-    display_visualization_dashboard = None
 
 # ==============================================================================
-# SECTION 1: DATA LOADING AND PREPROCESSING
+# SECTION 1: UTILITY FUNCTIONS FOR DISPLAY
 # ==============================================================================
 
-def load_performances_data(csv_path: str) -> pd.DataFrame:
+def load_visualization_module():
     """
-    Load performances data from CSV file.
+    Import the visualization module on first use.
     
-    Args:
-        csv_path: Path to the performances.csv file
-        
-    Returns:
-        DataFrame with performances data
-    """
-    df = pd.read_csv(csv_path)
-    return df
-
-
-def preprocess_performances(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
-    """
-    Preprocess the performances data:
-    - Convert Date to datetime objects
-    - Sort by Date and Time
-    - Group performances by date and time slot
+    plotly is only needed by the Network Visualization tab, so it is not
+    loaded until that tab is opened.
     
-    Args:
-        df: Raw DataFrame from CSV
-        
     Returns:
-        Tuple of (processed DataFrame, day-by-day schedule dictionary)
+        The visualizations module, or None if its dependencies are missing
     """
-    # Convert Date to datetime
-    df['Date'] = pd.to_datetime(df['Date'], format='%d-%m-%Y')
-    
-    # Convert Time to datetime.time for better handling
-    df['Time_obj'] = pd.to_datetime(df['Time'], format='%H:%M').dt.time
-    
-    # Sort by Date and Time
-    df = df.sort_values(by=['Date', 'Time_obj'])
-    
-    # Create time slot classification (early: before 8 PM, late: 8 PM and after)
-    def classify_slot(time_obj):
-        hour = time_obj.hour
-        minute = time_obj.minute
-        time_in_minutes = hour * 60 + minute
-        
-        if time_in_minutes < 20 * 60:  # Before 8 PM (20:00)
-            return "early"
-        else:
-            return "late"
-    
-    df['Slot'] = df['Time_obj'].apply(classify_slot)
-    
-    # Extract main venue (first part before comma)
-    df['Main_Venue'] = df['Venue'].str.split(',').str[0]
-    
-    # Group by date to create a day-by-day schedule
-    schedule_dict = defaultdict(lambda: {"early": [], "late": []})
-    
-    for idx, row in df.iterrows():
-        date_key = row['Date'].strftime('%Y-%m-%d')
-        slot = row['Slot']
-        
-        schedule_dict[date_key][slot].append({
-            'event_id': row['Event_ID'],
-            'date': date_key,  # Add date to track it with the event
-            'category': row['Category'],
-            'sub_category': row['Sub_Category'],
-            'event_name': row['Event_Name'],
-            'venue': row['Venue'],
-            'main_venue': row['Main_Venue'],
-            'time': row['Time'],
-            'description': row['Description']
-        })
-    
-    # Sort dates
-    sorted_dates = sorted(schedule_dict.keys())
-    schedule_dict = {date: schedule_dict[date] for date in sorted_dates}
-    
-    return df, dict(schedule_dict)
-
-
-def get_all_dates(schedule_dict: Dict) -> List[str]:
-    """Get sorted list of all festival dates."""
-    return sorted(list(schedule_dict.keys()))
-
-
-def load_exhibition_data(csv_path: str) -> pd.DataFrame:
-    """
-    Load exhibition data from CSV file.
-    
-    Args:
-        csv_path: Path to the exhibition.csv file
-        
-    Returns:
-        DataFrame with exhibition data
-    """
-    df = pd.read_csv(csv_path)
-    return df
-
-
-# ==============================================================================
-# SECTION 2: DYNAMIC PROGRAMMING OPTIMIZATION ENGINE
-# ==============================================================================
-
-class PerformanceOptimizer:
-    """
-    Dynamic programming solver for finding the optimal festival itinerary.
-    
-    Constraints:
-    - No repeated performances (tracked by event_id)
-    - No overlapping times on the same day
-    - All performances on one day must be at the same venue
-    """
-    
-    def __init__(self, schedule_dict: Dict, dates: List[str]):
-        """
-        Initialize the optimizer.
-        
-        Args:
-            schedule_dict: Day-by-day schedule dictionary
-            dates: Sorted list of all festival dates
-        """
-        self.schedule_dict = schedule_dict
-        self.dates = dates
-        self.memo = {}
-        self.best_path_memo = {}
-    
-    def get_performances_for_day(self, date: str) -> Dict:
-        """Get all performances available on a specific date."""
-        return self.schedule_dict.get(date, {"early": [], "late": []})
-    
-    def extract_categories(self, performances: List) -> FrozenSet:
-        """Extract unique categories from a list of performances."""
-        categories = set()
-        for perf in performances:
-            categories.add(perf['category'])
-        return frozenset(categories)
-    
-    def get_valid_combinations(self, date: str) -> List[List[Dict]]:
-        """
-        Generate all valid combinations of performances for a single day.
-        
-        Constraints:
-        - Maximum one performance per time slot (early/late)
-        - All performances must be at the same main venue
-        
-        Returns:
-            List of valid performance combinations
-        """
-        performances = self.get_performances_for_day(date)
-        early = performances['early']
-        late = performances['late']
-        
-        combinations = []
-        
-        # Option 1: Skip the day (empty combination)
-        combinations.append([])
-        
-        # Option 2: Attend only early slot
-        for perf in early:
-            combinations.append([perf])
-        
-        # Option 3: Attend only late slot
-        for perf in late:
-            combinations.append([perf])
-        
-        # Option 4: Attend both early and late (same venue only)
-        for early_perf in early:
-            for late_perf in late:
-                if early_perf['main_venue'] == late_perf['main_venue']:
-                    combinations.append([early_perf, late_perf])
-        
-        return combinations
-    
-    def calculate_score(self, performances: List, categories_before: FrozenSet) -> Tuple[int, FrozenSet]:
-        """
-        Calculate score for a combination of performances.
-        
-        Scoring:
-        - +1 point per performance (from POINTS_PER_PERFORMANCE)
-        - +bonus points for each new category discovered (from POINTS_PER_NEW_CATEGORY)
-        
-        Args:
-            performances: List of performances
-            categories_before: Categories already covered
-            
-        Returns:
-            Tuple of (score, new_categories_set)
-        """
-        if not performances:
-            return 0, categories_before
-        
-        # Base score: POINTS_PER_PERFORMANCE per performance
-        base_score = len(performances) * POINTS_PER_PERFORMANCE
-        
-        # Extract new categories
-        new_cats = self.extract_categories(performances)
-        new_categories_found = new_cats - categories_before
-        category_bonus = len(new_categories_found) * POINTS_PER_NEW_CATEGORY
-        
-        total_score = base_score + category_bonus
-        updated_categories = categories_before | new_cats
-        
-        return total_score, updated_categories
-    
-    def find_best_itinerary(
-        self,
-        day_index: int = 0,
-        categories_seen: FrozenSet = frozenset(),
-        events_seen: FrozenSet = frozenset()
-    ) -> Tuple[int, List[Dict]]:
-        """
-        Recursively find the best itinerary using dynamic programming.
-        
-        This function prevents duplicate performances by tracking event_ids.
-        
-        Args:
-            day_index: Current day index in the festival
-            categories_seen: Set of categories already covered
-            events_seen: Set of event_ids already scheduled (NEW: prevents duplicates)
-            
-        Returns:
-            Tuple of (best_score, list_of_performances)
-        """
-        # Base case: reached the end of the festival
-        if day_index >= len(self.dates):
-            return 0, []
-        
-        # Check memo (includes events_seen in state)
-        state = (day_index, categories_seen, events_seen)
-        if state in self.memo:
-            return self.memo[state], self.best_path_memo[state]
-        
-        current_date = self.dates[day_index]
-        
-        # Option 1: Skip this day
-        skip_score, skip_path = self.find_best_itinerary(
-            day_index + 1,
-            categories_seen,
-            events_seen
-        )
-        
-        best_score = skip_score
-        best_path = skip_path
-        
-        # Option 2: Try all valid combinations for this day
-        valid_combinations = self.get_valid_combinations(current_date)
-        
-        for combination in valid_combinations:
-            if combination:  # Only process non-empty combinations
-                # CHECK: None of the events in this combination have been scheduled before
-                combination_event_ids = frozenset(perf['event_id'] for perf in combination)
-                if combination_event_ids & events_seen:
-                    # Skip this combination - it contains duplicate events
-                    continue
-                
-                day_score, updated_categories = self.calculate_score(combination, categories_seen)
-                
-                # Update events_seen with this combination's event_ids
-                updated_events_seen = events_seen | combination_event_ids
-                
-                # Recursively solve for the rest of the festival
-                future_score, future_path = self.find_best_itinerary(
-                    day_index + 1,
-                    updated_categories,
-                    updated_events_seen
-                )
-                
-                total_score = day_score + future_score
-                
-                # Update if this is better
-                if total_score > best_score:
-                    best_score = total_score
-                    best_path = combination + future_path
-        
-        # Store in memo
-        self.memo[state] = best_score
-        self.best_path_memo[state] = best_path
-        
-        return best_score, best_path
+    try:
+        import visualizations
+    except ImportError:
+        return None
+    return visualizations
 
 
-# ==============================================================================
-# SECTION 3: UTILITY FUNCTIONS FOR DISPLAY
-# ==============================================================================
-
 def group_performances_by_date(performances: List[Dict]) -> Dict[str, List[Dict]]:
     """
     Group performances by date for display.
@@ -343,7 +86,7 @@ def format_performance_for_display(perf: Dict) -> str:
     """
 
 
-def calculate_statistics(performances: List[Dict]) -> Dict:
+def calculate_statistics(performances: List[int], events: EventTable) -> Dict:
     """
     Calculate summary statistics about the itinerary and verify correctness.
     
@@ -351,6 +94,10 @@ def calculate_statistics(performances: List[Dict]) -> Dict:
     - No duplicate event_ids (no repeated performances)
     - Categories covered
     - Unique days attended
+    
+    Args:
+        performances: Itinerary as a list of event indices
+        events: EventTable the indices refer to
     """
     if not performances:
         return {
@@ -366,38 +113,32 @@ def calculate_statistics(performances: List[Dict]) -> Dict:
             'duplicate_events': []
         }
     
-    categories = set()
-    venues = set()
-    dates = set()
-    event_ids = []
+    rows = np.asarray(performances, dtype=np.int64)
     
-    for perf in performances:
-        categories.add(perf.get('category', 'Unknown'))
-        venues.add(perf.get('main_venue', 'Unknown'))
-        dates.add(perf.get('date', 'Unknown'))
-        event_ids.append(perf.get('event_id', None))
+    categories = {events.categories[code] for code in np.unique(events.category_codes[rows])}
+    venues = {events.main_venues[code] for code in np.unique(events.main_venue_codes[rows])}
+    num_days = len(np.unique(events.date_codes[rows]))
     
     # Check for duplicates
-    unique_event_ids = set(event_ids)
-    has_duplicates = len(unique_event_ids) < len(event_ids)
-    duplicate_events = [eid for eid in event_ids if event_ids.count(eid) > 1]
+    unique_event_ids, occurrences = np.unique(events.event_ids[rows], return_counts=True)
+    duplicate_events = unique_event_ids[occurrences > 1].tolist()
     
     return {
         'total_performances': len(performances),
         'unique_performances': len(unique_event_ids),
-        'total_days': len(dates),
+        'total_days': num_days,
         'categories_covered': categories,
         'num_categories': len(categories),
         'venues': venues,
         'num_venues': len(venues),
-        'num_days': len(dates),
-        'has_duplicates': has_duplicates,
-        'duplicate_events': list(set(duplicate_events))  # Unique list of duplicated event_ids
+        'num_days': num_days,
+        'has_duplicates': bool(duplicate_events),
+        'duplicate_events': duplicate_events  # Unique list of duplicated event_ids
     }
 
 
 # ==============================================================================
-# SECTION 4: STREAMLIT UI
+# SECTION 2: STREAMLIT UI
 # ==============================================================================
 
 def main():
@@ -468,27 +209,32 @@ def main():
         - ATIRA
         - Shreyas Foundation
         """)
+        
+        st.header("⚙️ Settings")
+        allow_venue_switch = st.checkbox(
+            "Allow venue switches within a day",
+            value=not VENUE_LOCK_IN,
+            help="Plan around travel times between venues instead of staying at one venue per day."
+        )
+    
+    @st.cache_resource
+    def get_result_cache() -> ResultCache:
+        """Process-wide solver result cache, shared across sessions and reruns."""
+        return ResultCache(RESULT_CACHE_SIZE)
     
     # Load data
-    @st.cache_data
-    def load_data():
-        """Load and preprocess data (cached)."""
+    # Shared as-is rather than pickled per rerun: the loaded data is only read,
+    # never modified, by the app
+    @st.cache_resource
+    def load_data(venue_lock_in: bool):
+        """Load and preprocess data and solve the optimal itinerary (cached per venue lock-in setting)."""
         base_path = os.path.dirname(os.path.abspath(__file__))
-        
-        # Load performances
-        performances_path = os.path.join(base_path, 'performances.csv')
-        df = load_performances_data(performances_path)
-        df_processed, schedule_dict = preprocess_performances(df)
-        dates = get_all_dates(schedule_dict)
-        
-        # Load exhibitions
-        exhibition_path = os.path.join(base_path, 'exhibition.csv')
-        df_exhibition = load_exhibition_data(exhibition_path)
-        
-        return df_processed, schedule_dict, dates, df_exhibition
+        return load_festival_data(base_path, venue_lock_in)
     
     try:
-        df_processed, schedule_dict, dates, df_exhibition = load_data()
+        (fingerprint, df_processed, events, schedule_dict, dates, combination_index,
+         best_itinerary, df_exhibition) = load_data(not allow_venue_switch)
+        result_cache = get_result_cache()
         
         # Initialize session state for itinerary
         if 'generated_itinerary' not in st.session_state:
@@ -516,23 +262,144 @@ def main():
                 st.metric("Festival Days", len(dates))
                 st.metric("Total Venues", df_processed['Main_Venue'].nunique())
             
+            # Preferences: upvoted/downvoted sub-categories and venues adjust each show's points
+            with st.expander("🎚️ Preferences"):
+                st.caption(
+                    f"Upvoted choices earn {PREFERENCE_VOTE_POINTS} extra points per show; "
+                    f"downvoted ones cost {PREFERENCE_VOTE_POINTS} points."
+                )
+                pref_cols = st.columns(2)
+                with pref_cols[0]:
+                    upvoted_sub_categories = st.multiselect("👍 Sub-categories", sorted(events.sub_categories))
+                    upvoted_venues = st.multiselect("👍 Venues", sorted(events.main_venues))
+                with pref_cols[1]:
+                    downvoted_sub_categories = st.multiselect("👎 Sub-categories", sorted(events.sub_categories))
+                    downvoted_venues = st.multiselect("👎 Venues", sorted(events.main_venues))
+            
+            # What-if: pin or rule out shows and dates; re-solves reuse this session's DP tables
+            with st.expander("📌 What-if"):
+                event_labels = {
+                    event_id: f"{event_id} · {events.names[name_code]} ({events.dates[date_code]} {events.times[time_code]})"
+                    for event_id, name_code, date_code, time_code in zip(
+                        events.event_ids.tolist(),
+                        events.name_codes.tolist(),
+                        events.date_codes.tolist(),
+                        events.time_codes.tolist()
+                    )
+                }
+                must_see_ids = st.multiselect("📌 Must see", list(event_labels), format_func=event_labels.get)
+                skipped_ids = st.multiselect("🙈 Skip", list(event_labels), format_func=event_labels.get)
+                unavailable_dates = st.multiselect(
+                    "🚫 Can't make",
+                    dates,
+                    format_func=lambda x: pd.to_datetime(x).strftime('%A, %B %d, %Y')
+                )
+            
+            must_see = frozenset(must_see_ids)
+            events_seen = profile_exclusions(
+                {"excluded_events": skipped_ids, "excluded_dates": unavailable_dates},
+                events
+            )
+            
+            scoring = ScoringModel(
+                sub_category_weights={
+                    **{sub_category: PREFERENCE_VOTE_POINTS for sub_category in upvoted_sub_categories},
+                    **{sub_category: -PREFERENCE_VOTE_POINTS for sub_category in downvoted_sub_categories},
+                },
+                venue_weights={
+                    **{venue: PREFERENCE_VOTE_POINTS for venue in upvoted_venues},
+                    **{venue: -PREFERENCE_VOTE_POINTS for venue in downvoted_venues},
+                },
+            )
+            
             # Generate button
             if st.button("🚀 Generate Optimal Itinerary", key="generate_btn", use_container_width=True):
                 with st.spinner("🔄 Optimizing your itinerary..."):
-                    # Initialize optimizer
-                    optimizer = PerformanceOptimizer(schedule_dict, dates)
-                    
-                    # Find best itinerary
-                    best_score, best_performances = optimizer.find_best_itinerary()
+                    def solve():
+                        # Keep one optimizer per session and scoring, so what-if edits only
+                        # recompute the days up to the last edited one
+                        optimizer_key = (fingerprint, scoring.cache_key())
+                        if st.session_state.get('optimizer_key') != optimizer_key:
+                            st.session_state.optimizer = PerformanceOptimizer(
+                                events, schedule_dict, dates, combination_index, scoring
+                            )
+                            st.session_state.optimizer_key = optimizer_key
+                        optimizer = st.session_state.optimizer
+                        optimizer.stats.reset()
+                        
+                        index = optimizer.index
+                        transitions = index.num_masks * sum(
+                            len(day_combinations) for day_combinations in index.combinations
+                        )
+                        alternatives = []
+                        
+                        if transitions <= MAX_ALTERNATIVE_TRANSITIONS:
+                            # Small festival: the exact k-best pass also gives the best
+                            # itinerary (its first entry), so nothing else is solved
+                            ranked = optimizer.find_top_k_itineraries(
+                                NUM_ALTERNATIVE_ITINERARIES + 1, events_seen, must_see
+                            )
+                            if not ranked:
+                                raise ValueError("No valid itinerary includes all must-see events")
+                            best, alternatives = ranked[0], ranked[1:]
+                            upper_bound = best[0]
+                        elif scoring.is_default() and not events_seen and not must_see:
+                            # Solved when the data was loaded
+                            best = best_itinerary
+                            upper_bound = best[0]
+                        elif optimizer.pending_transitions(events_seen, must_see) <= MAX_EXACT_TRANSITIONS:
+                            # Exact DP; after a what-if edit only the days up to the
+                            # last edited one are recomputed
+                            best = optimizer.find_best_itinerary(events_seen=events_seen, must_see=must_see)
+                            upper_bound = best[0]
+                        else:
+                            # Too much DP work: search within the time budget, which may
+                            # stop before proving optimality
+                            best_score, best_indices, upper_bound = optimizer.find_best_itinerary_anytime(
+                                SOLVE_TIME_BUDGET_SECONDS, events_seen, must_see
+                            )
+                            best = (best_score, best_indices)
+                        
+                        st.session_state.solver_stats = optimizer.stats.as_dict()
+                        return best, upper_bound, alternatives
                     
-                    # Store in session state for visualization tab
-                    st.session_state.generated_itinerary = best_performances
+                    # Identical requests from any session are answered from the shared cache
+                    result_key = (
+                        fingerprint,
+                        scoring.cache_key(),
+                        (not allow_venue_switch, NUM_ALTERNATIVE_ITINERARIES, events_seen, must_see),
+                    )
+                    st.session_state.solver_stats = None
+                    try:
+                        # An itinerary the time budget cut short is not cached, so a later
+                        # solve gets the chance to improve on it
+                        result = result_cache.get_or_compute(
+                            result_key, solve, store_if=lambda solved: solved[0][0] >= solved[1]
+                        )
+                    except ValueError as e:
+                        result = None
+                        st.error(f"⚠️ {e}. Remove a must-see event or free up its date.")
+                
+                if result is not None:
+                    (best_score, best_indices), upper_bound, alternatives = result
                     
                     # Calculate statistics
-                    stats = calculate_statistics(best_performances)
+                    stats = calculate_statistics(best_indices, events)
+                    
+                    # Build display records once; also stored for the visualization tab
+                    best_performances = events.records(best_indices)
+                    st.session_state.generated_itinerary = best_performances
                     
                     # Display results
                     st.success("✅ Itinerary Generated Successfully!")
+                    if best_score < upper_bound:
+                        gap = upper_bound - best_score
+                        gap_text = f"{gap / upper_bound:.1%}" if upper_bound > 0 else f"{gap} points"
+                        st.warning(
+                            f"⏱️ The search stopped after {SOLVE_TIME_BUDGET_SECONDS:g} s. This itinerary scores "
+                            f"{best_score}; the best possible is at most {upper_bound} "
+                            f"(gap {gap_text})."
+                        )
                     
                     # Summary statistics
                     st.subheader("📊 Summary Statistics")
@@ -604,6 +471,49 @@ def main():
                                 perf_counter += 1
                     else:
                         st.warning("No performances could be scheduled.")
+                    
+                    # Runner-up itineraries from the k-best DP pass
+                    if alternatives:
+                        st.subheader("🔀 Alternative Itineraries")
+                        
+                        for rank, (alt_score, alt_indices) in enumerate(alternatives, start=2):
+                            alt_stats = calculate_statistics(alt_indices, events)
+                            alt_performances = events.records(alt_indices)
+                            with st.expander(
+                                f"#{rank} — Score {alt_score} · {alt_stats['total_performances']} performances "
+                                f"over {alt_stats['num_days']} days"
+                            ):
+                                for date_str, perfs_on_date in group_performances_by_date(alt_performances).items():
+                                    st.markdown(f"**{pd.to_datetime(date_str).strftime('%A, %B %d, %Y')}**")
+                                    for perf in perfs_on_date:
+                                        st.write(f"• {perf['event_name']} ({perf['category']}) @ {perf['time']} — {perf['main_venue']}")
+                    
+                    # Work done by the solver for this request (best plus alternatives)
+                    with st.expander("🔬 Solver diagnostics"):
+                        solver_stats = st.session_state.solver_stats
+                        if solver_stats is None:
+                            st.caption("Answered from the shared result cache; the solver did not run.")
+                        else:
+                            diagnostics_cols = st.columns(4)
+                            with diagnostics_cols[0]:
+                                st.metric("States Visited", f"{solver_stats['states_visited']:,}")
+                                st.metric("Peak Table Entries", f"{solver_stats['peak_table_entries']:,}")
+                            with diagnostics_cols[1]:
+                                st.metric("Combinations Evaluated", f"{solver_stats['combinations_evaluated']:,}")
+                                st.metric("Combinations Pruned", f"{solver_stats['combinations_pruned']:,}")
+                            with diagnostics_cols[2]:
+                                st.metric("Table Hits", solver_stats['table_hits'])
+                                st.metric("Table Misses", solver_stats['table_misses'])
+                            with diagnostics_cols[3]:
+                                st.metric("Hit Rate", f"{solver_stats['hit_rate']:.0%}")
+                                st.metric("Solve Time", f"{sum(solver_stats['day_seconds'].values()) * 1000:.1f} ms")
+                            
+                            if solver_stats['day_seconds']:
+                                st.caption("Time spent per festival day (ms)")
+                                st.bar_chart(pd.DataFrame(
+                                    {'ms': [seconds * 1000 for seconds in solver_stats['day_seconds'].values()]},
+                                    index=[dates[day_index] for day_index in solver_stats['day_seconds']]
+                                ))
         
         with tab2:
             st.header("📅 Full Festival Schedule")
@@ -634,7 +544,7 @@ def main():
                 st.subheader(f"Performances on {pd.to_datetime(selected_date).strftime('%A, %B %d, %Y')}")
                 
                 # Early slot
-                early_perfs = [p for p in day_schedule['early'] if p['category'] in category_filter]
+                early_perfs = [p for p in events.records(day_schedule['early']) if p['category'] in category_filter]
                 if early_perfs:
                     st.subheader("🌅 Early Slot")
                     for perf in early_perfs:
@@ -645,7 +555,7 @@ def main():
                             st.write(f"**Description:** {perf['description']}")
                 
                 # Late slot
-                late_perfs = [p for p in day_schedule['late'] if p['category'] in category_filter]
+                late_perfs = [p for p in events.records(day_schedule['late']) if p['category'] in category_filter]
                 if late_perfs:
                     st.subheader("🌙 Late Slot")
                     for perf in late_perfs:
@@ -674,7 +584,16 @@ def main():
         with tab4:
             st.header("🌐 Network Visualization")
             
-            if display_visualization_dashboard is not None:
+            show_visualizations = st.checkbox(
+                "Show network visualizations",
+                key="show_visualizations",
+                help="Loads the graph libraries and builds the network views."
+            )
+            visualizations = load_visualization_module() if show_visualizations else None
+            
+            if not show_visualizations:
+                st.info("Tick the box above to explore the festival as an interactive network graph.")
+            elif visualizations is not None:
                 st.info("""
                 Explore the festival as an interactive network graph! 
                 See how performances connect through categories, venues, and dates.
@@ -684,18 +603,28 @@ def main():
                 """)
                 
                 # Display visualization dashboard with generated itinerary if available
-                display_visualization_dashboard(
+                visualizations.display_visualization_dashboard(
                     df_processed, 
                     schedule_dict, 
-                    st.session_state.generated_itinerary
+                    st.session_state.generated_itinerary,
+                    fingerprint
                 )
             else:
                 st.warning("""
                 ⚠️ Visualization module not available. 
-                Please ensure that networkx and plotly are installed:
+                Please ensure that plotly is installed:
                 `pip install -r requirements.txt`
                 """)
     
+        # Shown last so the counters include this run's Generate click
+        with st.sidebar:
+            st.header("🗄️ Result Cache")
+            cache_stats = result_cache.stats()
+            cache_cols = st.columns(3)
+            cache_cols[0].metric("Hits", cache_stats['hits'])
+            cache_cols[1].metric("Misses", cache_stats['misses'])
+            cache_cols[2].metric("Entries", cache_stats['size'])
+    
     except FileNotFoundError as e:
         st.error(f"❌ Error: Could not find data file. {str(e)}")
         st.info("Please ensure performances.csv and exhibition.csv are in the same directory as this script.")
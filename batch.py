@@ -0,0 +1,89 @@
+"""
+Multi-process batch solving of many preference profiles.
+The festival is loaded once in the parent; worker processes inherit it through
+fork (or receive it once per worker elsewhere) instead of once per profile.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from optimizer import PerformanceOptimizer, solve_profile
+
+# Chunks per worker; more chunks stream results sooner, fewer cut IPC overhead
+CHUNKS_PER_WORKER = 4
+
+# Optimizer used by the worker processes (set before forking or by _init_worker)
+_worker_optimizer = None
+
+
+def _init_worker(optimizer: PerformanceOptimizer) -> None:
+    """Receive the optimizer once per worker when fork is not available."""
+    global _worker_optimizer
+    _worker_optimizer = optimizer
+
+
+def _solve_chunk(chunk: List[Tuple[int, Dict]]) -> List[Dict]:
+    """Solve (position, profile) pairs with the worker's optimizer."""
+    return [_solve_one(_worker_optimizer, position, profile) for position, profile in chunk]
+
+
+def _solve_one(optimizer: PerformanceOptimizer, position: int, profile: Dict) -> Dict:
+    """Solve one profile, reporting an invalid or infeasible profile as an error."""
+    name = profile.get("name", f"profile-{position + 1}")
+    try:
+        score, indices = solve_profile(optimizer, profile)
+    except ValueError as e:
+        return {"position": position, "profile": name, "error": str(e)}
+    return {"position": position, "profile": name, "score": score, "indices": indices}
+
+
+def solve_profiles(
+    optimizer: PerformanceOptimizer,
+    profiles: List[Dict],
+    max_workers: Optional[int] = None
+) -> Iterator[Dict]:
+    """
+    Solve many preference profiles in parallel, yielding results as they complete.
+    
+    Profiles are split into chunks that are solved by a ProcessPoolExecutor. On
+    platforms with fork, the workers share the parent's optimizer (schedule and
+    combination index) copy-on-write, so only the profiles are pickled; otherwise
+    the optimizer is sent once to each worker.
+    
+    Args:
+        optimizer: PerformanceOptimizer for the festival
+        profiles: Preference profiles (see optimizer.profile_exclusions)
+        max_workers: Number of worker processes (default: number of CPUs);
+            1 solves in this process
+            
+    Yields:
+        Dictionaries with position (index into profiles), profile (name) and
+        either score and indices (event indices) or error, in completion order
+    """
+    global _worker_optimizer
+    
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(profiles) <= 1:
+        for position, profile in enumerate(profiles):
+            yield _solve_one(optimizer, position, profile)
+        return
+    
+    numbered = list(enumerate(profiles))
+    chunk_size = max(1, -(-len(numbered) // (max_workers * CHUNKS_PER_WORKER)))
+    chunks = [numbered[start:start + chunk_size] for start in range(0, len(numbered), chunk_size)]
+    
+    if "fork" in multiprocessing.get_all_start_methods():
+        _worker_optimizer = optimizer
+        pool_options = {"mp_context": multiprocessing.get_context("fork")}
+    else:
+        pool_options = {"initializer": _init_worker, "initargs": (optimizer,)}
+    
+    try:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks)), **pool_options) as pool:
+            futures = [pool.submit(_solve_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
+    finally:
+        _worker_optimizer = None
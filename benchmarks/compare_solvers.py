@@ -0,0 +1,134 @@
+"""
+Compare the exact DP solver with the greedy and beam-search baselines.
+Reports wall time, peak memory and the score gap to the optimum on the real
+festival and on synthetic ones:
+
+    python benchmarks/compare_solvers.py --beam-widths 2,4,16 --json solvers.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+
+from optimizer import (
+    BeamSearchOptimizer,
+    CombinationIndex,
+    GreedyOptimizer,
+    PerformanceOptimizer,
+    get_all_dates,
+    load_performances_data,
+    preprocess_performances
+)
+from synthetic import generate_festival
+
+# Festival name -> generate_festival arguments (None: the real performances.csv)
+FESTIVALS = {
+    "real": None,
+    "synthetic-60d": {"num_days": 60},
+    "synthetic-365d": {"num_days": 365, "num_venues": 4},
+    "synthetic-sparse": {"num_days": 60, "num_categories": 6, "fill_rate": 0.3},
+    "synthetic-10cat": {"num_days": 30, "num_categories": 10, "fill_rate": 0.3},
+}
+
+
+def build_festival(params: Optional[Dict], seed: int) -> Dict:
+    """Preprocess a festival and build its combination index."""
+    if params is None:
+        df = load_performances_data(os.path.join(os.path.dirname(BENCHMARKS_DIR), 'performances.csv'))
+    else:
+        df = generate_festival(seed=seed, **params)
+    
+    _, events, schedule_dict = preprocess_performances(df)
+    dates = get_all_dates(schedule_dict)
+    return {
+        "events": events,
+        "schedule_dict": schedule_dict,
+        "dates": dates,
+        "index": CombinationIndex(events, schedule_dict, dates),
+    }
+
+
+def measure(make_solver, repeat: int) -> Dict:
+    """
+    Time find_best_itinerary on fresh solvers and record its peak memory.
+    
+    Wall time is the best of repeat runs; peak memory comes from one extra run
+    under tracemalloc, so tracing does not distort the timing.
+    """
+    best_seconds = float('inf')
+    for _ in range(repeat):
+        solver = make_solver()
+        start = time.perf_counter()
+        score, _ = solver.find_best_itinerary()
+        best_seconds = min(best_seconds, time.perf_counter() - start)
+    
+    solver = make_solver()
+    tracemalloc.start()
+    solver.find_best_itinerary()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {"score": score, "seconds": best_seconds, "peak_kib": peak_bytes / 1024}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run every solver on every festival and print (and optionally save) the results."""
+    parser = argparse.ArgumentParser(description="Compare DP, greedy and beam-search itinerary solvers.")
+    parser.add_argument("--beam-widths", default="2,4,16", help="Comma-separated beam widths")
+    parser.add_argument("--festivals", default=",".join(FESTIVALS), help="Comma-separated festival names")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per solver (best is kept)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic festivals")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+    
+    beam_widths = [int(width) for width in args.beam_widths.split(",") if width]
+    
+    results = []
+    print(f"{'festival':<18} {'events':>7} {'solver':<12} {'score':>9} {'gap %':>7} {'ms':>10} {'peak KiB':>10}")
+    for name in args.festivals.split(","):
+        festival = build_festival(FESTIVALS[name], args.seed)
+        arguments = (festival["events"], festival["schedule_dict"], festival["dates"], festival["index"])
+        
+        solvers = {
+            "dp": lambda: PerformanceOptimizer(*arguments),
+            "greedy": lambda: GreedyOptimizer(*arguments),
+        }
+        for width in beam_widths:
+            solvers[f"beam-{width}"] = lambda width=width: BeamSearchOptimizer(*arguments, beam_width=width)
+        
+        optimum = None
+        for solver_name, make_solver in solvers.items():
+            result = measure(make_solver, args.repeat)
+            if optimum is None:
+                optimum = result["score"]
+            gap = 100.0 * (optimum - result["score"]) / optimum if optimum else 0.0
+            
+            results.append({
+                "festival": name,
+                "events": len(festival["events"]),
+                "days": len(festival["dates"]),
+                "solver": solver_name,
+                "gap_percent": gap,
+                **result,
+            })
+            print(
+                f"{name:<18} {len(festival['events']):>7} {solver_name:<12} {result['score']:>9} "
+                f"{gap:>7.2f} {result['seconds'] * 1000:>10.2f} {result['peak_kib']:>10.1f}"
+            )
+    
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
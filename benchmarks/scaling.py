@@ -0,0 +1,192 @@
+"""
+Scaling benchmark for the festival planner pipeline.
+Times every stage (preprocessing, combination index, solving, top-k, figures) on
+synthetic festivals 1x, 10x, 100x, ... the size of the real one, records peak
+memory, and saves the results as JSON so runs can be diffed between versions:
+
+    python benchmarks/scaling.py --scales 1,10,100 --json scaling.json
+    python benchmarks/scaling.py --scales 1,10,100 --baseline scaling.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARKS_DIR)
+sys.path.insert(0, REPO_DIR)
+
+import numpy as np
+import pandas as pd
+
+from config import NUM_ALTERNATIVE_ITINERARIES
+from optimizer import CombinationIndex, PerformanceOptimizer, get_all_dates, preprocess_performances
+from synthetic import scaled_festival
+
+# Figure kind -> PerformanceVisualizer method
+FIGURES = {
+    "hierarchical": "create_hierarchical_network",
+    "category": "create_category_network",
+    "venue": "create_venue_network",
+    "date": "create_date_network",
+    "sunburst": "create_subcategory_sunburst",
+    "itinerary": "create_itinerary_highlighted_network",
+}
+
+# Network figures that are also timed at the count-bubble overview level
+OVERVIEW_FIGURES = ("hierarchical", "category", "venue", "date", "itinerary")
+
+
+def run_stage(function: Callable, track_memory: bool) -> Tuple[object, float, Optional[float]]:
+    """
+    Run one pipeline stage.
+    
+    The timed run is untraced; with track_memory the stage runs a second time
+    under tracemalloc to get its peak allocation.
+    
+    Returns:
+        Tuple of (stage output, seconds, peak KiB or None)
+    """
+    start = time.perf_counter()
+    output = function()
+    seconds = time.perf_counter() - start
+    
+    peak_kib = None
+    if track_memory:
+        tracemalloc.start()
+        function()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_kib = peak_bytes / 1024
+    
+    return output, seconds, peak_kib
+
+
+def benchmark_scale(scale: int, seed: int, track_memory: bool, max_figure_events: int) -> List[Dict]:
+    """Run every pipeline stage on one festival size and return one record per stage."""
+    df = scaled_festival(scale, seed)
+    records = []
+    
+    def record(stage: str, function: Callable):
+        output, seconds, peak_kib = run_stage(function, track_memory)
+        records.append({
+            "scale": scale,
+            "events": len(df),
+            "stage": stage,
+            "seconds": seconds,
+            "peak_kib": peak_kib,
+        })
+        print(
+            f"{scale:>6} {len(df):>8} {stage:<24} {seconds * 1000:>11.1f} "
+            f"{'-' if peak_kib is None else f'{peak_kib:.0f}':>11}"
+        )
+        return output
+    
+    df_processed, events, schedule_dict = record("preprocess", lambda: preprocess_performances(df.copy()))
+    dates = get_all_dates(schedule_dict)
+    index = record("combination_index", lambda: CombinationIndex(events, schedule_dict, dates))
+    _, best_indices = record(
+        "solve",
+        lambda: PerformanceOptimizer(events, schedule_dict, dates, index).find_best_itinerary()
+    )
+    record(
+        "top_k",
+        lambda: PerformanceOptimizer(events, schedule_dict, dates, index).find_top_k_itineraries(
+            NUM_ALTERNATIVE_ITINERARIES + 1
+        )
+    )
+    
+    if len(df) <= max_figure_events:
+        from visualizations import FestivalGraph, PerformanceVisualizer
+        
+        itinerary = events.records(best_indices)
+        graph = record("festival_graph", lambda: FestivalGraph(df_processed))
+        # Figures share the graph; the first figure of each view also computes its layout
+        visualizer = PerformanceVisualizer(df_processed, schedule_dict, itinerary, graph)
+        for kind, method in FIGURES.items():
+            record(f"figure:{kind}", getattr(visualizer, method))
+        for kind in OVERVIEW_FIGURES:
+            record(f"overview:{kind}", lambda: getattr(visualizer, FIGURES[kind])(overview=True))
+    
+    return records
+
+
+def environment() -> Dict:
+    """Versions and commit the results were produced with."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    
+    return {
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+    }
+
+
+def compare(results: List[Dict], baseline_path: str) -> None:
+    """Print time and memory ratios against a previous run for matching (scale, stage)."""
+    with open(baseline_path) as f:
+        baseline = {(r["scale"], r["stage"]): r for r in json.load(f)["results"]}
+    
+    print(f"\nCompared with {baseline_path} (ratio > 1: slower / more memory now)")
+    print(f"{'scale':>6} {'stage':<24} {'time x':>8} {'memory x':>9}")
+    for result in results:
+        previous = baseline.get((result["scale"], result["stage"]))
+        if previous is None:
+            continue
+        time_ratio = result["seconds"] / previous["seconds"] if previous["seconds"] else float('nan')
+        memory_ratio = (
+            result["peak_kib"] / previous["peak_kib"]
+            if result["peak_kib"] is not None and previous.get("peak_kib") else float('nan')
+        )
+        print(f"{result['scale']:>6} {result['stage']:<24} {time_ratio:>8.2f} {memory_ratio:>9.2f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the scaling benchmark and print (and optionally save or compare) the results."""
+    parser = argparse.ArgumentParser(description="Benchmark each pipeline stage as the festival grows.")
+    parser.add_argument("--scales", default="1,10,100", help="Comma-separated size factors")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic festivals")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc runs")
+    parser.add_argument(
+        "--max-figure-events",
+        type=int,
+        default=25000,
+        help="Skip the visualization stages above this many events"
+    )
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Previous JSON results to compare against")
+    args = parser.parse_args(argv)
+    
+    print(f"{'scale':>6} {'events':>8} {'stage':<24} {'ms':>11} {'peak KiB':>11}")
+    results = []
+    for scale in (int(scale) for scale in args.scales.split(",") if scale):
+        results.extend(benchmark_scale(scale, args.seed, not args.no_memory, args.max_figure_events))
+    
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+    
+    if args.baseline:
+        compare(results, args.baseline)
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+Synthetic festival generator for benchmarks.
+Produces DataFrames with the same columns as performances.csv, so they go through
+the normal preprocess_performances / CombinationIndex pipeline.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Sequence
+
+# Size of the real festival in performances.csv, for scale factors
+REAL_FESTIVAL_DAYS = 15
+REAL_FESTIVAL_VENUES = 3
+
+
+def generate_festival(
+    num_days: int = REAL_FESTIVAL_DAYS,
+    num_venues: int = REAL_FESTIVAL_VENUES,
+    shows_per_slot: int = 3,
+    num_categories: int = 3,
+    sub_categories_per_category: int = 4,
+    slot_times: Sequence[str] = ("19:15", "21:30"),
+    fill_rate: float = 0.8,
+    weekend_fill_rate: float = 0.95,
+    duration_rate: float = 0.3,
+    seed: int = 0,
+    start_date: str = "2025-11-14"
+) -> pd.DataFrame:
+    """
+    Generate a random festival schedule.
+    
+    Each venue has shows_per_slot stages. Every stage gets a show in each time slot
+    of each day with probability fill_rate (weekend_fill_rate on Saturdays and
+    Sundays). Categories are drawn with uneven popularity, sub-categories uniformly
+    within their category, and a duration_rate share of shows has an explicit
+    duration (the rest are "N/A", like most of the real data).
+    
+    Args:
+        num_days: Number of consecutive festival days
+        num_venues: Number of venues (campuses)
+        shows_per_slot: Parallel shows per slot at each venue (one per stage)
+        num_categories: Number of distinct categories
+        sub_categories_per_category: Distinct sub-categories within each category
+        slot_times: Show start times (HH:MM) of each day
+        fill_rate: Probability that a stage has a show in a weekday slot
+        weekend_fill_rate: Probability that a stage has a show in a weekend slot
+        duration_rate: Share of shows with an explicit Duration_Minutes
+        seed: Random seed; the same arguments always give the same festival
+        start_date: First festival day (YYYY-MM-DD)
+        
+    Returns:
+        DataFrame with the performances.csv columns
+    """
+    rng = np.random.default_rng(seed)
+    
+    day_range = pd.date_range(start_date, periods=num_days)
+    days = day_range.strftime('%d-%m-%Y').to_numpy()
+    day_fill_rates = np.where(day_range.dayofweek >= 5, weekend_fill_rate, fill_rate)
+    venues = np.array([
+        f"Stage {stage + 1}, Venue {venue + 1}"
+        for venue in range(num_venues)
+        for stage in range(shows_per_slot)
+    ])
+    times = np.asarray(slot_times)
+    
+    # One row per (day, stage, slot), then drop the empty slots
+    day_index, venue_index, time_index = np.meshgrid(
+        np.arange(len(days)), np.arange(len(venues)), np.arange(len(times)), indexing='ij'
+    )
+    day_index = day_index.ravel()
+    keep = rng.random(day_index.size) < day_fill_rates[day_index]
+    day_index = day_index[keep]
+    venue_index = venue_index.ravel()[keep]
+    time_index = time_index.ravel()[keep]
+    
+    num_events = len(day_index)
+    event_ids = np.arange(1, num_events + 1)
+    
+    # Popularity falls off with the category rank (Zipf-like)
+    categories = np.array([f"Category {code + 1}" for code in range(num_categories)])
+    popularity = 1.0 / np.arange(1, num_categories + 1)
+    category_index = rng.choice(num_categories, size=num_events, p=popularity / popularity.sum())
+    sub_category_index = rng.integers(0, sub_categories_per_category, num_events)
+    sub_categories = np.char.add(
+        np.char.add(categories[category_index], " / Style "),
+        (sub_category_index + 1).astype(str)
+    )
+    
+    durations = np.full(num_events, "N/A", dtype=object)
+    has_duration = rng.random(num_events) < duration_rate
+    durations[has_duration] = (rng.integers(3, 11, has_duration.sum()) * 15).astype(str)
+    
+    return pd.DataFrame({
+        'Event_ID': event_ids,
+        'Category': categories[category_index],
+        'Sub_Category': sub_categories,
+        'Event_Name': [f"Artist {event_id} - Show {event_id}" for event_id in event_ids],
+        'Venue': venues[venue_index],
+        'City': "Synthetic City",
+        'Date': days[day_index],
+        'Time': times[time_index],
+        'Duration_Minutes': durations,
+        'Description': "A synthetic performance",
+    })
+
+
+def scaled_festival(scale: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Festival about scale times the size of the real one.
+    
+    Days grow with the scale and venues with its square root, so both the number
+    of days and the number of combinations per day increase.
+    
+    Args:
+        scale: Size factor relative to performances.csv (1, 10, 100, ...)
+        seed: Random seed
+        
+    Returns:
+        DataFrame with the performances.csv columns
+    """
+    num_venues = max(1, round(REAL_FESTIVAL_VENUES * scale ** 0.5))
+    num_days = max(1, round(REAL_FESTIVAL_DAYS * scale * REAL_FESTIVAL_VENUES / num_venues))
+    return generate_festival(num_days=num_days, num_venues=num_venues, seed=seed)
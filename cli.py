@@ -0,0 +1,133 @@
+"""
+Command-line entry point for the Abhi Vyakti Festival Planner.
+Solves itineraries without starting the Streamlit UI, e.g. for nightly batch runs:
+
+    python -m cli --profiles profiles.json --format csv --output itineraries.csv --workers 8
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+from batch import solve_profiles
+from config import VENUE_LOCK_IN
+from optimizer import PerformanceOptimizer, load_festival_data
+
+CSV_COLUMNS = [
+    "profile", "score", "event_id", "date", "time", "event_name",
+    "category", "sub_category", "venue", "main_venue", "duration_minutes"
+]
+
+
+def load_profiles(profiles_path: Optional[str]) -> List[Dict]:
+    """
+    Load preference profiles from a JSON file.
+    
+    The file holds a list of profile objects (see optimizer.profile_exclusions).
+    Without a file, a single unconstrained "default" profile is used.
+    
+    Args:
+        profiles_path: Path to the JSON file, or None
+        
+    Returns:
+        List of profile dictionaries, each with a name
+    """
+    if profiles_path is None:
+        return [{"name": "default"}]
+    
+    with open(profiles_path) as f:
+        profiles = json.load(f)
+    
+    if not isinstance(profiles, list):
+        raise ValueError("Profiles file must contain a JSON list of profile objects")
+    
+    return [
+        {"name": f"profile-{number}", **profile}
+        for number, profile in enumerate(profiles, start=1)
+    ]
+
+
+def write_json(results: List[Dict], out) -> None:
+    """Write one object per profile with its score and performances (or error)."""
+    json.dump(results, out, indent=2)
+    out.write("\n")
+
+
+def write_csv(results: List[Dict], out) -> None:
+    """Write one row per scheduled performance, tagged with its profile and score."""
+    writer = csv.DictWriter(out, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+    writer.writeheader()
+    for result in results:
+        for performance in result.get("performances", []):
+            writer.writerow({"profile": result["profile"], "score": result["score"], **performance})
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse arguments, solve every profile and write the itineraries; returns the exit code."""
+    parser = argparse.ArgumentParser(
+        prog="python -m cli",
+        description="Solve optimal festival itineraries for one or more preference profiles."
+    )
+    parser.add_argument(
+        "--profiles",
+        help="JSON file with a list of profiles (see optimizer.PROFILE_FIELDS)"
+    )
+    parser.add_argument("--format", choices=["json", "csv"], default="json", help="Output format")
+    parser.add_argument("--output", default="-", help="Output file (default: stdout)")
+    parser.add_argument(
+        "--data-dir",
+        default=os.path.dirname(os.path.abspath(__file__)),
+        help="Directory containing performances.csv and exhibition.csv"
+    )
+    parser.add_argument(
+        "--allow-venue-switch",
+        action="store_true",
+        default=not VENUE_LOCK_IN,
+        help="Plan around travel times between venues instead of staying at one venue per day"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for solving profiles (0: one per CPU)"
+    )
+    args = parser.parse_args(argv)
+    
+    try:
+        profiles = load_profiles(args.profiles)
+        (_, _, events, schedule_dict, dates, combination_index,
+         _, _) = load_festival_data(args.data_dir, not args.allow_venue_switch)
+        
+        optimizer = PerformanceOptimizer(events, schedule_dict, dates, combination_index)
+        solved = sorted(solve_profiles(optimizer, profiles, args.workers or None), key=lambda r: r["position"])
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    
+    results = []
+    for result in solved:
+        if "error" in result:
+            print(f"error: profile {result['profile']}: {result['error']}", file=sys.stderr)
+            results.append({"profile": result["profile"], "error": result["error"]})
+        else:
+            results.append({
+                "profile": result["profile"],
+                "score": result["score"],
+                "performances": events.records(result["indices"]),
+            })
+    
+    write = write_csv if args.format == "csv" else write_json
+    if args.output == "-":
+        write(results, sys.stdout)
+    else:
+        with open(args.output, "w", newline="") as out:
+            write(results, out)
+    
+    return 1 if len(results) != sum("score" in result for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,9 +23,24 @@ EARLY_SLOT_END_TIME = 20.0  # 8:00 PM (20:00 in 24-hour format)
 EARLY_SLOT_NAME = "early"
 LATE_SLOT_NAME = "late"
 
+# Day Model
+# "slots": at most one early and one late show per day (the classic model)
+# "intervals": any number of non-overlapping shows per day, from Time + duration
+# "travel" (venue switches planned around travel_times.csv) is not a DAY_MODEL value:
+# it is used when VENUE_LOCK_IN = False, "Allow venue switches" or --allow-venue-switch
+DAY_MODEL = "slots"
+DEFAULT_DURATION_MINUTES = 60  # Used when Duration_Minutes is N/A
+
+# Heuristic Solvers
+BEAM_WIDTH = 4  # Partial itineraries kept per day by BeamSearchOptimizer
+SOLVE_TIME_BUDGET_SECONDS = 0.5  # Anytime search budget for the interactive solve
+MAX_ALTERNATIVE_TRANSITIONS = 500000  # Skip alternatives above this many category masks x combinations
+MAX_EXACT_TRANSITIONS = 1000000  # Solve exactly (reusing DP rows) up to this many transitions, else use the anytime search
+
 # Scoring Configuration
 POINTS_PER_PERFORMANCE = 1
 POINTS_PER_NEW_CATEGORY = 10
+PREFERENCE_VOTE_POINTS = 3  # Extra (or fewer) points per show for an upvoted (downvoted) preference
 
 # UI Configuration
 PAGE_TITLE = "Abhi Vyakti Festival Planner"
@@ -41,13 +56,25 @@ ERROR_COLOR = "#f8d7da"  # Light red
 # Display Configuration
 PERFORMANCES_PER_PAGE = 10
 EXPANDABLE_PERFORMANCE_CARDS = True
+NUM_ALTERNATIVE_ITINERARIES = 10  # Runner-up itineraries shown on the Generate tab
 
 # Data Files
 PERFORMANCES_CSV = "performances.csv"
 EXHIBITION_CSV = "exhibition.csv"
+TRAVEL_TIMES_CSV = "travel_times.csv"
+
+# Disk Cache
+CACHE_DIR = ".cache"  # Parsed schedule, combination index and optimal itinerary
+CACHE_FORMAT_VERSION = 5  # Bump when the cached data structures change
+RESULT_CACHE_SIZE = 128  # Solver results kept in memory, shared across sessions
+FIGURE_CACHE_SIZE = 32  # Visualization figures kept in memory, shared across sessions
+
+# Network Visualization
+WEBGL_NODE_THRESHOLD = 2000  # Draw performance nodes and edges with WebGL (Scattergl) above this many
+OVERVIEW_NODE_THRESHOLD = 5000  # Network views open at the count-bubble overview above this many performances
 
 # Constraints
-VENUE_LOCK_IN = True  # All performances on a day must be at same venue
+VENUE_LOCK_IN = True  # All performances on a day must be at same venue (False: use travel times)
 ONE_SHOW_PER_SLOT = True  # Maximum one performance per time slot
 
 # Display Format
@@ -0,0 +1,169 @@
+"""
+Vectorized node layouts for the festival network views.
+Positions are computed for all nodes of a type at once from group codes, so
+layouts stay fast for full-season catalogs. Layouts depend only on the graph
+structure, not on styling, and return plain NumPy arrays that can be cached.
+"""
+
+import numpy as np
+from typing import Dict, Tuple
+
+# Hierarchical layout: y of each layer, and the band below the venues that
+# performance grids are packed into
+CATEGORY_LAYER_Y = 1.0
+VENUE_LAYER_Y = 0.5
+PERFORMANCE_TOP_Y = -0.1
+PERFORMANCE_BAND_HEIGHT = 1.0
+MAX_GRID_STEP = 0.1  # Largest distance between neighbouring performances in a grid
+GRID_FILL = 0.8  # Share of the space between venues a venue's grid may use
+
+# Hub-and-spoke layout: hubs on a ring up to MAX_RING_HUBS (else on a grid), and
+# leaves on a ring around their hub up to MAX_RING_LEAVES (else packed in a disc)
+HUB_RING_RADIUS = 0.3
+LEAF_RADIUS = 0.15
+MAX_RING_HUBS = 12
+MAX_RING_LEAVES = 24
+GOLDEN_ANGLE = np.pi * (3 - np.sqrt(5))
+
+Positions = Tuple[np.ndarray, np.ndarray]
+
+
+def ranks_within_groups(codes: np.ndarray, num_groups: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Position of every item within its group, in order of appearance.
+    
+    Args:
+        codes: Group code (0..num_groups-1) of every item
+        num_groups: Number of groups
+    
+    Returns:
+        Tuple of (rank of each item within its group, size of each group)
+    """
+    sizes = np.bincount(codes, minlength=num_groups)
+    order = np.argsort(codes, kind='stable')
+    starts = np.cumsum(sizes) - sizes
+    ranks = np.empty(len(codes), dtype=np.int64)
+    ranks[order] = np.arange(len(codes)) - np.repeat(starts, sizes)
+    return ranks, sizes
+
+
+def spread(count: int) -> np.ndarray:
+    """Spread count positions evenly over [0, 1] (0.5 for a single node)."""
+    if count == 1:
+        return np.array([0.5])
+    return np.arange(count) / max(count - 1, 1)
+
+
+def edge_coordinates(x0: np.ndarray, y0: np.ndarray, x1: np.ndarray, y1: np.ndarray) -> Positions:
+    """
+    Line coordinates for drawing all edges as one trace.
+    
+    Each edge becomes (start, end, NaN); the NaN breaks the line between edges.
+    
+    Returns:
+        Tuple of (x, y) coordinate arrays
+    """
+    gaps = np.full(len(x0), np.nan)
+    edge_x = np.column_stack([x0, x1, gaps]).ravel()
+    edge_y = np.column_stack([y0, y1, gaps]).ravel()
+    return edge_x, edge_y
+
+
+def grid_offsets(ranks: np.ndarray, group_sizes: np.ndarray, width: float, height: float) -> Positions:
+    """
+    Pack every group into a near-square grid centred on 0, starting at the top.
+    
+    A group of n items gets ceil(sqrt(n)) columns. Grid steps are at most
+    MAX_GRID_STEP and shrink so that the grid fits in width x height.
+    
+    Args:
+        ranks: Rank of every item within its group (see ranks_within_groups)
+        group_sizes: Size of every item's group
+        width: Largest width of a grid
+        height: Largest height of a grid
+    
+    Returns:
+        Tuple of (x offsets from the group centre, y offsets downwards from 0)
+    """
+    columns = np.ceil(np.sqrt(group_sizes)).astype(np.int64)
+    columns = np.maximum(columns, 1)
+    rows = -(-group_sizes // columns)
+    
+    x_step = np.minimum(MAX_GRID_STEP, width / columns)
+    y_step = np.minimum(MAX_GRID_STEP, height / np.maximum(rows, 1))
+    
+    column = ranks % columns
+    row = ranks // columns
+    return (column - (columns - 1) / 2) * x_step, -row * y_step
+
+
+def hierarchical_layout(num_categories: int, num_venues: int, perf_venue_codes: np.ndarray) -> Dict[str, Positions]:
+    """
+    Layered layout: categories on top, venues in the middle and the performances
+    of each venue packed in a grid below it.
+    
+    Grids are limited to GRID_FILL of the space between neighbouring venues and
+    to PERFORMANCE_BAND_HEIGHT, so the layout stays bounded however many
+    performances a venue has.
+    
+    Args:
+        num_categories: Number of category nodes
+        num_venues: Number of venue nodes
+        perf_venue_codes: Venue node index of every performance
+    
+    Returns:
+        Dictionary mapping 'category', 'venue' and 'performance' to (x, y) arrays
+    """
+    category_x = spread(num_categories)
+    venue_x = spread(num_venues)
+    venue_spacing = 1.0 / max(num_venues - 1, 1)
+    
+    ranks, sizes = ranks_within_groups(perf_venue_codes, num_venues)
+    x_offsets, y_offsets = grid_offsets(
+        ranks, sizes[perf_venue_codes], GRID_FILL * venue_spacing, PERFORMANCE_BAND_HEIGHT
+    )
+    
+    return {
+        'category': (category_x, np.full(num_categories, CATEGORY_LAYER_Y)),
+        'venue': (venue_x, np.full(num_venues, VENUE_LAYER_Y)),
+        'performance': (venue_x[perf_venue_codes] + x_offsets, PERFORMANCE_TOP_Y + y_offsets),
+    }
+
+
+def hub_and_spoke_layout(hub_codes: np.ndarray, num_hubs: int) -> Dict[str, Positions]:
+    """
+    Hub-and-spoke layout: hubs on a ring (or a grid when there are many) with
+    their leaves around them.
+    
+    Small groups of leaves sit on a ring around their hub; larger ones are packed
+    into a disc with a sunflower pattern, so leaves never pile up on one circle.
+    
+    Args:
+        hub_codes: Hub index of every leaf
+        num_hubs: Number of hub nodes
+    
+    Returns:
+        Dictionary mapping 'hub' and 'leaf' to (x, y) arrays
+    """
+    if num_hubs <= MAX_RING_HUBS:
+        hub_angles = 2 * np.pi * np.arange(num_hubs) / max(num_hubs, 1)
+        hub_x = 0.5 + HUB_RING_RADIUS * np.cos(hub_angles)
+        hub_y = 0.5 + HUB_RING_RADIUS * np.sin(hub_angles)
+        leaf_radius = LEAF_RADIUS
+    else:
+        columns = int(np.ceil(np.sqrt(num_hubs)))
+        cell = 1.0 / columns
+        hub_x = (np.arange(num_hubs) % columns + 0.5) * cell
+        hub_y = 1.0 - (np.arange(num_hubs) // columns + 0.5) * cell
+        leaf_radius = 0.4 * cell
+    
+    ranks, sizes = ranks_within_groups(hub_codes, num_hubs)
+    group_sizes = np.maximum(sizes[hub_codes], 1)
+    on_ring = group_sizes <= MAX_RING_LEAVES
+    leaf_angles = np.where(on_ring, 2 * np.pi * ranks / group_sizes, ranks * GOLDEN_ANGLE)
+    leaf_radii = np.where(on_ring, leaf_radius, leaf_radius * np.sqrt((ranks + 0.5) / group_sizes))
+    
+    return {
+        'hub': (hub_x, hub_y),
+        'leaf': (hub_x[hub_codes] + leaf_radii * np.cos(leaf_angles), hub_y[hub_codes] + leaf_radii * np.sin(leaf_angles)),
+    }
@@ -0,0 +1,2089 @@
+"""
+Data loading and optimization engine for the Abhi Vyakti Festival Planner.
+Parses the festival CSVs and solves optimal itineraries; has no UI dependencies,
+so it can be used from the Streamlit app, the command line or batch jobs.
+"""
+
+import numpy as np
+from collections import OrderedDict, defaultdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Tuple, FrozenSet, Optional, Set
+import bisect
+import copy
+import heapq
+import os
+import hashlib
+import pickle
+import threading
+import time
+from array import array
+
+# Import configuration
+from config import (
+    POINTS_PER_PERFORMANCE,
+    POINTS_PER_NEW_CATEGORY,
+    EARLY_SLOT_END_TIME,
+    DAY_MODEL,
+    DEFAULT_DURATION_MINUTES,
+    PERFORMANCES_CSV,
+    EXHIBITION_CSV,
+    TRAVEL_TIMES_CSV,
+    CACHE_DIR,
+    CACHE_FORMAT_VERSION,
+    BEAM_WIDTH
+)
+
+# pandas is imported inside the functions that parse CSVs, so importing the
+# engine (e.g. to solve from a cached schedule) stays cheap
+if TYPE_CHECKING:
+    import pandas as pd
+
+# ==============================================================================
+# SECTION 1: DATA LOADING AND PREPROCESSING
+# ==============================================================================
+
+def load_performances_data(csv_path: str) -> 'pd.DataFrame':
+    """
+    Load performances data from CSV file.
+    
+    Args:
+        csv_path: Path to the performances.csv file
+        
+    Returns:
+        DataFrame with performances data
+    """
+    import pandas as pd
+    
+    df = pd.read_csv(csv_path)
+    return df
+
+
+class EventTable:
+    """
+    Columnar store of all performances.
+    
+    Events are referred to by their row index into the table (rows are sorted by
+    date and time). Text columns are interned: each one is stored as a NumPy array
+    of small integer codes plus a list of distinct values, so e.g.
+    categories[category_codes[i]] is the category of event i. Performance dicts are
+    only built at display time by record() / records().
+    """
+    
+    # Slot code -> slot name
+    SLOTS = ("early", "late")
+    
+    def __init__(self, df: 'pd.DataFrame', time_in_minutes: np.ndarray):
+        """
+        Build the table from a preprocessed DataFrame.
+        
+        Args:
+            df: DataFrame sorted by date and time, with Slot, Main_Venue and Duration
+            time_in_minutes: Start time of each row in minutes since midnight
+        """
+        self.event_ids = df['Event_ID'].to_numpy(dtype=np.int64)
+        self.start_minutes = np.asarray(time_in_minutes, dtype=np.int32)
+        self.durations = df['Duration'].to_numpy(dtype=np.int32)
+        self.slot_codes = (df['Slot'].to_numpy() == "late").astype(np.int8)
+        
+        self.date_codes, self.dates = self._intern(df['Date'].dt.strftime('%Y-%m-%d'))
+        self.category_codes, self.categories = self._intern(df['Category'])
+        self.sub_category_codes, self.sub_categories = self._intern(df['Sub_Category'])
+        self.name_codes, self.names = self._intern(df['Event_Name'])
+        self.venue_codes, self.venues = self._intern(df['Venue'])
+        self.main_venue_codes, self.main_venues = self._intern(df['Main_Venue'])
+        self.time_codes, self.times = self._intern(df['Time'])
+        self.description_codes, self.descriptions = self._intern(df['Description'])
+    
+    @staticmethod
+    def _intern(column: 'pd.Series') -> Tuple[np.ndarray, List]:
+        """Factorize a column into (int32 codes, distinct values in first-seen order)."""
+        import pandas as pd
+        
+        codes, uniques = pd.factorize(column, sort=False)
+        return codes.astype(np.int32), list(uniques)
+    
+    def __len__(self) -> int:
+        return len(self.event_ids)
+    
+    def record(self, index: int) -> Dict:
+        """Build the display dict of one event."""
+        return {
+            'event_id': int(self.event_ids[index]),
+            'date': self.dates[self.date_codes[index]],
+            'category': self.categories[self.category_codes[index]],
+            'sub_category': self.sub_categories[self.sub_category_codes[index]],
+            'event_name': self.names[self.name_codes[index]],
+            'venue': self.venues[self.venue_codes[index]],
+            'main_venue': self.main_venues[self.main_venue_codes[index]],
+            'time': self.times[self.time_codes[index]],
+            'duration_minutes': int(self.durations[index]),
+            'description': self.descriptions[self.description_codes[index]]
+        }
+    
+    def records(self, indices) -> List[Dict]:
+        """Build the display dicts of several events, in the given order."""
+        return [self.record(index) for index in indices]
+    
+    def indices_of(self, event_ids) -> np.ndarray:
+        """Row indices of the events with the given event_ids."""
+        return np.flatnonzero(np.isin(self.event_ids, list(event_ids)))
+
+
+def preprocess_performances(df: 'pd.DataFrame') -> Tuple['pd.DataFrame', EventTable, Dict]:
+    """
+    Preprocess the performances data:
+    - Convert Date to datetime objects
+    - Sort by Date and Time
+    - Build the columnar EventTable
+    - Group performances (as event indices) by date and time slot
+    
+    Args:
+        df: Raw DataFrame from CSV
+        
+    Returns:
+        Tuple of (processed DataFrame, EventTable, day-by-day schedule dictionary
+        mapping date -> {"early": [event indices], "late": [event indices]})
+    """
+    import pandas as pd
+    
+    # Convert Date to datetime
+    df['Date'] = pd.to_datetime(df['Date'], format='%d-%m-%Y')
+    
+    # Parse Time once; keep datetime.time for display and minutes for computation
+    parsed_times = pd.to_datetime(df['Time'], format='%H:%M')
+    df['Time_obj'] = parsed_times.dt.time
+    time_in_minutes = (parsed_times.dt.hour * 60 + parsed_times.dt.minute).to_numpy()
+    
+    # Sort by Date and Time (stable, so same-time shows keep their CSV order)
+    order = np.lexsort((time_in_minutes, df['Date'].to_numpy()))
+    df = df.iloc[order].reset_index(drop=True)
+    time_in_minutes = time_in_minutes[order]
+    
+    # Create time slot classification (early: before 8 PM, late: 8 PM and after)
+    df['Slot'] = np.where(time_in_minutes < EARLY_SLOT_END_TIME * 60, "early", "late").astype(object)
+    
+    # Extract main venue (first part before comma)
+    df['Main_Venue'] = df['Venue'].str.split(',').str[0]
+    
+    # Duration in minutes (DEFAULT_DURATION_MINUTES where the CSV says N/A)
+    df['Duration'] = (
+        pd.to_numeric(df['Duration_Minutes'], errors='coerce')
+        .fillna(DEFAULT_DURATION_MINUTES)
+        .astype(int)
+    )
+    
+    # Columnar event store; the schedule refers to events by row index
+    events = EventTable(df, time_in_minutes)
+    
+    # Group by date (sorted) and slot to create a day-by-day schedule
+    groups = pd.Series(np.arange(len(events))).groupby(
+        [events.date_codes, events.slot_codes]
+    ).indices
+    
+    schedule_dict = {}
+    for date_code, slot_code in sorted(groups):
+        day_schedule = schedule_dict.setdefault(events.dates[date_code], {"early": [], "late": []})
+        day_schedule[EventTable.SLOTS[slot_code]] = groups[(date_code, slot_code)].tolist()
+    
+    return df, events, schedule_dict
+
+
+def get_all_dates(schedule_dict: Dict) -> List[str]:
+    """Get sorted list of all festival dates."""
+    return sorted(list(schedule_dict.keys()))
+
+
+def load_exhibition_data(csv_path: str) -> 'pd.DataFrame':
+    """
+    Load exhibition data from CSV file.
+    
+    Args:
+        csv_path: Path to the exhibition.csv file
+        
+    Returns:
+        DataFrame with exhibition data
+    """
+    import pandas as pd
+    
+    df = pd.read_csv(csv_path)
+    return df
+
+
+def load_travel_times(csv_path: str) -> Dict[Tuple[str, str], int]:
+    """
+    Load the travel-time matrix between main venues from CSV.
+    
+    Each row gives From_Venue, To_Venue and Minutes. Travel is assumed symmetric,
+    so a pair only needs to be listed in one direction. A venue paired with itself
+    gives the time to walk between two stages of the same venue.
+    
+    Args:
+        csv_path: Path to the travel_times.csv file
+        
+    Returns:
+        Dictionary mapping (from_venue, to_venue) to minutes
+    """
+    import pandas as pd
+    
+    df = pd.read_csv(csv_path)
+    
+    travel_times = {}
+    for from_venue, to_venue, minutes in zip(df['From_Venue'], df['To_Venue'], df['Minutes']):
+        travel_times[(from_venue, to_venue)] = int(minutes)
+        travel_times.setdefault((to_venue, from_venue), int(minutes))
+    
+    return travel_times
+
+
+def compute_data_fingerprint(file_paths: List[str], settings: Dict) -> str:
+    """
+    Hash the input CSVs and the settings that affect the solved result.
+    
+    The fingerprint changes whenever a data file's contents or any scoring or
+    day-model setting changes, so it can be used as a key for on-disk caches.
+    
+    Args:
+        file_paths: Paths of the data files (order matters)
+        settings: Scoring and constraint settings, e.g. points and day model
+        
+    Returns:
+        Hex digest identifying this dataset and configuration
+    """
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_FORMAT_VERSION}".encode())
+    
+    for path in file_paths:
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    
+    for key in sorted(settings):
+        digest.update(f"{key}={settings[key]!r}".encode())
+    
+    return digest.hexdigest()
+
+
+def load_disk_cache(cache_dir: str, fingerprint: str) -> Optional[Dict]:
+    """
+    Load a previously saved payload for this fingerprint, if there is one.
+    
+    A missing, truncated or incompatible cache file counts as a miss.
+    
+    Args:
+        cache_dir: Directory holding the cache files
+        fingerprint: Key returned by compute_data_fingerprint
+        
+    Returns:
+        The cached payload dictionary, or None on a miss
+    """
+    cache_path = os.path.join(cache_dir, f"{fingerprint}.pkl")
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+
+
+def save_disk_cache(cache_dir: str, fingerprint: str, payload: Dict) -> None:
+    """
+    Save a payload under this fingerprint.
+    
+    The file is written to a temporary name and then renamed, so concurrent
+    readers never see a partial file. Failures (e.g. a read-only deploy) are
+    ignored; the app simply recomputes next time.
+    
+    Args:
+        cache_dir: Directory holding the cache files
+        fingerprint: Key returned by compute_data_fingerprint
+        payload: Picklable data to store
+    """
+    cache_path = os.path.join(cache_dir, f"{fingerprint}.pkl")
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+# ==============================================================================
+# SECTION 2: DYNAMIC PROGRAMMING OPTIMIZATION ENGINE
+# ==============================================================================
+
+# Score of a DP state from which the must-see events cannot all be attended
+UNREACHABLE = float('-inf')
+
+class CombinationIndex:
+    """
+    Per-day table of valid performance combinations, precomputed once per dataset.
+    
+    With the "slots" day model, combinations are enumerated venue by venue
+    (same-venue constraint) in the same order get_valid_combinations has always
+    produced them, without the empty "skip" combination. With the "intervals" day
+    model, each venue contributes its highest-scoring set of non-overlapping shows
+    for every category mask it can cover ("travel" likewise, across venues). Those
+    two models therefore depend on the event weights the index is built with. For
+    day d and combination c the parallel arrays hold:
+    
+    - combinations[d][c]: tuple of event indices (rows of the EventTable)
+    - masks[d][c]: category bitmask (see category_bits)
+    - counts[d][c]: number of performances
+    - base_scores[d][c]: sum of the event weights of the combination (by default
+      counts[d][c] * POINTS_PER_PERFORMANCE, the classic scoring)
+    
+    All combinations are also stored back to back in flat_events (CSR layout with
+    combination_starts and day_starts), so a ScoringModel's per-event weights can
+    be summed per combination in one NumPy call (see combination_scores).
+    
+    popcounts[mask] is the number of categories in mask, so the solver's inner loop
+    only does integer lookups.
+    
+    frontiers[d] lists the combinations on the Pareto frontier over (day score,
+    category set): a combination is dropped when another one scores at least as
+    much and covers a superset of its categories. Since covering more categories
+    never lowers the total score, the solver loses nothing by only trying the
+    frontier.
+    """
+    
+    def __init__(
+        self,
+        events: EventTable,
+        schedule_dict: Dict,
+        dates: List[str],
+        day_model: str = DAY_MODEL,
+        travel_times: Optional[Dict[Tuple[str, str], int]] = None,
+        event_weights: Optional[np.ndarray] = None
+    ):
+        """
+        Build the index.
+        
+        Args:
+            events: EventTable the schedule's event indices refer to
+            schedule_dict: Day-by-day schedule of event indices
+            dates: Sorted list of all festival dates
+            day_model: "slots" for at most one early and one late show per day,
+                "intervals" for any number of non-overlapping shows per day
+                (using each show's time and duration), or "travel" to also allow
+                switching venues within a day
+            travel_times: (from_venue, to_venue) -> minutes, required for "travel"
+            event_weights: Score of each event, indexed by event index
+                (default: POINTS_PER_PERFORMANCE each, the classic scoring)
+        """
+        if day_model not in ("slots", "intervals", "travel"):
+            raise ValueError(f"Unknown day model: {day_model}")
+        if day_model == "travel" and travel_times is None:
+            raise ValueError("The travel day model needs a travel-time matrix")
+        
+        self.dates = list(dates)
+        self.day_model = day_model
+        self.travel_times = travel_times
+        
+        if event_weights is None:
+            event_weights = np.full(len(events), POINTS_PER_PERFORMANCE, dtype=np.int64)
+        self.day_positions = {date: day_index for day_index, date in enumerate(self.dates)}
+        
+        # One bit per category code (codes are assigned in first-seen order)
+        self.category_bits = {category: 1 << code for code, category in enumerate(events.categories)}
+        
+        # Plain per-event lists for the enumeration loops (kept for constrained_combinations)
+        self.columns = {
+            'bit': np.left_shift(1, events.category_codes.astype(np.int64)).tolist(),
+            'venue': events.venue_codes.tolist(),
+            'main_venue': events.main_venue_codes.tolist(),
+            'start': events.start_minutes.tolist(),
+            'end': (events.start_minutes + events.durations).tolist()
+        }
+        if day_model == "travel":
+            # Travel times are between main venues: the part after the last comma
+            locations = [venue.split(',')[-1].strip() for venue in events.venues]
+            self.columns['location'] = [locations[code] for code in self.columns['venue']]
+        
+        # Event indices of each day, early slot first
+        self.day_events = []
+        for date in self.dates:
+            day_schedule = schedule_dict.get(date, {"early": [], "late": []})
+            self.day_events.append((list(day_schedule['early']), list(day_schedule['late'])))
+        
+        self.combinations = []
+        self.masks = []
+        self.counts = []
+        self.base_scores = []
+        
+        columns = dict(self.columns, weight=event_weights.tolist())
+        for day_index in range(len(self.dates)):
+            day_combinations = self._enumerate(day_index, columns)
+            self.combinations.append(day_combinations)
+            self.masks.append(array('q', (self._mask(combination) for combination in day_combinations)))
+            self.counts.append(array('q', (len(combination) for combination in day_combinations)))
+        
+        # Flat CSR layout of all combinations: day d owns combinations
+        # day_starts[d]:day_starts[d + 1], combination c owns flat_events[combination_starts[c]:...]
+        day_sizes = [len(day_combinations) for day_combinations in self.combinations]
+        self.day_starts = np.concatenate(([0], np.cumsum(day_sizes, dtype=np.int64)))
+        combination_sizes = np.fromiter(
+            (count for day_counts in self.counts for count in day_counts),
+            dtype=np.int64,
+            count=int(self.day_starts[-1])
+        )
+        self.combination_starts = np.concatenate(([0], np.cumsum(combination_sizes)[:-1])).astype(np.int64)
+        self.flat_events = np.fromiter(
+            (event for day_combinations in self.combinations for combination in day_combinations for event in combination),
+            dtype=np.int64,
+            count=int(combination_sizes.sum())
+        )
+        
+        self.base_scores = self.combination_scores(event_weights)
+        
+        self.num_masks = 1 << len(self.category_bits)
+        self.popcounts = array('q', (bin(mask).count('1') for mask in range(self.num_masks)))
+        
+        self.frontiers = [
+            self.pareto_frontier(day_index, range(len(day_combinations)))
+            for day_index, day_combinations in enumerate(self.combinations)
+        ]
+    
+    def combination_scores(self, event_weights: np.ndarray) -> List[array]:
+        """
+        Sum per-event weights over every combination of every day.
+        
+        Args:
+            event_weights: Score of each event, indexed by event index
+            
+        Returns:
+            One array of combination scores per day, parallel to combinations[d]
+        """
+        typecode = 'q' if event_weights.dtype.kind in 'iu' else 'd'
+        if len(self.flat_events) == 0:
+            return [array(typecode) for _ in self.dates]
+        
+        scores = np.add.reduceat(event_weights[self.flat_events], self.combination_starts)
+        return [
+            array(typecode, scores[start:end].tolist())
+            for start, end in zip(self.day_starts[:-1].tolist(), self.day_starts[1:].tolist())
+        ]
+    
+    def _mask(self, combination: Tuple[int, ...]) -> int:
+        """Category bitmask of a combination."""
+        bits = self.columns['bit']
+        mask = 0
+        for event in combination:
+            mask |= bits[event]
+        return mask
+    
+    def _enumerate(
+        self,
+        day_index: int,
+        columns: Dict[str, List],
+        excluded: FrozenSet = frozenset(),
+        required: FrozenSet = frozenset(),
+        keep: int = 1
+    ) -> List[Tuple[int, ...]]:
+        """Run the day model's enumeration for one day, without the excluded events."""
+        early, late = (
+            [event for event in slot_events if event not in excluded]
+            for slot_events in self.day_events[day_index]
+        )
+        if self.day_model == "slots":
+            return self._enumerate_day(early, late, columns)
+        if self.day_model == "intervals":
+            return self._enumerate_day_intervals(early + late, columns, required, keep)
+        return self._enumerate_day_travel(early + late, columns, self.travel_times, required, keep)
+    
+    def constrained_combinations(
+        self,
+        day_index: int,
+        event_weights: np.ndarray,
+        excluded: FrozenSet,
+        required: FrozenSet,
+        keep: int = 1
+    ) -> List[Tuple[int, ...]]:
+        """
+        Re-run one day's enumeration under what-if constraints.
+        
+        The "intervals" and "travel" models keep only the best combination per
+        category mask, so filtering the stored combinations would lose the
+        second-best ones that avoid an excluded event or include a required one.
+        Ranking K itineraries needs the runner-ups too, hence keep.
+        
+        Args:
+            day_index: Day index
+            event_weights: Score of each event, indexed by event index
+            excluded: Event indices that must not be attended
+            required: Event indices that must all be attended
+            keep: Number of combinations kept per category mask
+            
+        Returns:
+            Up to keep best combinations per category mask among those meeting
+            the constraints
+        """
+        columns = dict(self.columns, weight=event_weights.tolist())
+        return self._enumerate(day_index, columns, excluded, required, keep)
+    
+    def copy(self) -> 'CombinationIndex':
+        """Copy whose per-day lists can be extended by add_combinations without touching this index."""
+        index = copy.copy(self)
+        index.combinations = [list(day_combinations) for day_combinations in self.combinations]
+        index.masks = [array('q', day_masks) for day_masks in self.masks]
+        index.counts = [array('q', day_counts) for day_counts in self.counts]
+        index.base_scores = [array(day_scores.typecode, day_scores) for day_scores in self.base_scores]
+        return index
+    
+    def add_combinations(
+        self,
+        day_index: int,
+        combinations: List[Tuple[int, ...]],
+        event_weights: np.ndarray
+    ) -> List[int]:
+        """
+        Append combinations to a day, skipping ones it already has.
+        
+        Existing combination indices stay valid, and the added ones come after the
+        day's enumerated combinations (day_starts still counts only those). The
+        flat CSR arrays and the frontiers are not extended, so only use this on a
+        copy() owned by one optimizer.
+        
+        Args:
+            day_index: Day index
+            combinations: Combinations (tuples of event indices, in time order)
+            event_weights: Score of each event, used for base_scores
+            
+        Returns:
+            Combination indices of the given combinations, in order
+        """
+        day_combinations = self.combinations[day_index]
+        positions = {combination: choice for choice, combination in enumerate(day_combinations)}
+        base_scores = self.base_scores[day_index]
+        
+        choices = []
+        for combination in combinations:
+            if combination not in positions:
+                positions[combination] = len(day_combinations)
+                day_combinations.append(combination)
+                self.masks[day_index].append(self._mask(combination))
+                self.counts[day_index].append(len(combination))
+                base_scores.append(event_weights[list(combination)].sum().item())
+            choices.append(positions[combination])
+        
+        return choices
+    
+    def pareto_frontier(self, day_index: int, choices, base_scores: Optional[array] = None) -> array:
+        """
+        Keep the non-dominated combinations among choices on a day.
+        
+        Combinations with the same (day score, category mask) are interchangeable,
+        so only the first one is kept. Order of the survivors is preserved, and the
+        solver returns the same itinerary with or without pruning.
+        
+        Args:
+            day_index: Day index
+            choices: Candidate combination indices, in order
+            base_scores: Day scores of the combinations (default: base_scores[day_index])
+            
+        Returns:
+            Array of the surviving combination indices
+        """
+        scores = self.base_scores[day_index] if base_scores is None else base_scores
+        masks = self.masks[day_index]
+        
+        # First combination for every distinct (score, mask) key
+        first_by_key = {}
+        for choice in choices:
+            key = (scores[choice], masks[choice])
+            if key not in first_by_key:
+                first_by_key[key] = choice
+        
+        # A later combination with the same score and more categories can tie with an
+        # earlier one, and the solver keeps the earlier one on ties; only drop a
+        # combination for an equal-score superset when that superset comes first.
+        kept = sorted(first_by_key.values())
+        frontier = array('q')
+        for choice in kept:
+            score, mask = scores[choice], masks[choice]
+            dominated = False
+            for other in kept:
+                other_score, other_mask = scores[other], masks[other]
+                if other == choice or other_mask & mask != mask:
+                    continue
+                if other_score > score:
+                    dominated = True
+                elif other_score == score and other_mask != mask and other < choice:
+                    dominated = True
+                if dominated:
+                    break
+            if not dominated:
+                frontier.append(choice)
+        
+        return frontier
+    
+    @staticmethod
+    def _best_entries(entries: List[Tuple[float, Tuple[int, ...]]], keep: int) -> List[Tuple[float, Tuple[int, ...]]]:
+        """The keep highest-scoring (score, shows) entries, earlier entries first on ties."""
+        return sorted(entries, key=lambda entry: -entry[0])[:keep]
+    
+    @staticmethod
+    def _enumerate_day(early: List[int], late: List[int], columns: Dict[str, List]) -> List[Tuple[int, ...]]:
+        """Enumerate one day's non-empty combinations (one show per slot, same venue)."""
+        main_venue = columns['main_venue']
+        
+        late_by_venue = defaultdict(list)
+        for late_event in late:
+            late_by_venue[main_venue[late_event]].append(late_event)
+        
+        combinations = [(event,) for event in early]
+        combinations.extend((event,) for event in late)
+        
+        for early_event in early:
+            for late_event in late_by_venue.get(main_venue[early_event], []):
+                combinations.append((early_event, late_event))
+        
+        return combinations
+    
+    @staticmethod
+    def _enumerate_day_intervals(
+        events: List[int],
+        columns: Dict[str, List],
+        required: FrozenSet = frozenset(),
+        keep: int = 1
+    ) -> List[Tuple[int, ...]]:
+        """
+        Best non-overlapping show sets per (venue, category mask) for one day.
+        
+        Weighted interval scheduling per venue: shows are sorted by start time and
+        best[j] maps each category mask to the highest total weight that can be
+        attended among shows j.. with exactly those categories. Taking show j jumps to the
+        first show starting after it ends, found by binary search, so a venue with
+        n shows costs O(n log n) times the number of category masks.
+        
+        Required shows can be neither skipped nor jumped over, and venues missing
+        one of them contribute nothing. With keep > 1 every state holds its keep
+        best show sets instead of one, e.g. for the k-best pass.
+        
+        Returns:
+            Up to keep combinations per reachable (venue, non-empty mask), best
+            first, shows in time order
+        """
+        shows_by_venue = defaultdict(list)
+        for event in events:
+            shows_by_venue[columns['main_venue'][event]].append(
+                (columns['start'][event], columns['end'][event], event)
+            )
+        
+        combinations = []
+        for venue_shows in shows_by_venue.values():
+            if not required.issubset(show[2] for show in venue_shows):
+                continue
+            venue_shows.sort(key=lambda show: show[0])
+            starts = [show[0] for show in venue_shows]
+            num_shows = len(venue_shows)
+            
+            # next_required[j]: position of the first required show at j or later
+            next_required = [num_shows] * (num_shows + 1)
+            for j in range(num_shows - 1, -1, -1):
+                next_required[j] = j if venue_shows[j][2] in required else next_required[j + 1]
+            
+            # best[j][mask] = up to keep (score, shows taken) entries, best first
+            best = [None] * num_shows + [{0: [(0, ())]}]
+            for j in range(num_shows - 1, -1, -1):
+                start, end, event = venue_shows[j]
+                next_compatible = bisect.bisect_left(starts, end, j + 1)
+                category = columns['bit'][event]
+                weight = columns['weight'][event]
+                
+                # Skip show j
+                best_j = {} if next_required[j] == j else dict(best[j + 1])
+                
+                # Take show j, then continue from the first compatible show
+                # (unless that jumps over a required show)
+                if next_required[j + 1] >= next_compatible:
+                    for suffix_mask, entries in best[next_compatible].items():
+                        mask = suffix_mask | category
+                        taken = [(score + weight, (event,) + shows) for score, shows in entries]
+                        best_j[mask] = CombinationIndex._best_entries(best_j.get(mask, []) + taken, keep)
+                
+                best[j] = best_j
+            
+            # Only the empty set has mask 0
+            for mask in sorted(best[0]):
+                if mask:
+                    combinations.extend(shows for _, shows in best[0][mask])
+        
+        return combinations
+    
+    @staticmethod
+    def _enumerate_day_travel(
+        events: List[int],
+        columns: Dict[str, List],
+        travel_times: Dict[Tuple[str, str], int],
+        required: FrozenSet = frozenset(),
+        keep: int = 1
+    ) -> List[Tuple[int, ...]]:
+        """
+        Best show sequences per category mask for one day, switching venues allowed.
+        
+        A show can follow another when it starts no earlier than the previous show's
+        end plus the travel time between them: 0 on the same stage, otherwise the
+        travel_times entry for the two main venues (the part after the last comma of
+        the venue, e.g. "Gujarat University"). Pairs missing from the matrix cannot
+        be combined.
+        
+        The DP is memoized over (last show, category mask): chains[j][mask] is the
+        highest total weight attendable in a sequence ending with show j. The last show fixes
+        the current time, so no venue permutations are enumerated; a day with n shows
+        costs O(n^2 * 2^categories). A sequence may not start after, end before or
+        step over a required show. With keep > 1 every state holds its keep best
+        sequences instead of one.
+        
+        Returns:
+            Up to keep combinations per reachable non-empty mask, best first, shows
+            in time order
+        """
+        shows = sorted(
+            (columns['start'][event], columns['end'][event], event, columns['location'][event])
+            for event in events
+        )
+        venue = columns['venue']
+        if not required.issubset(events):
+            return []
+        
+        # required_before[j]: number of required shows among shows[:j]
+        required_before = [0]
+        for show in shows:
+            required_before.append(required_before[-1] + (show[2] in required))
+        
+        # chains[j][mask] = up to keep (score, shows) entries ending with show j, best first
+        chains = []
+        for j, (start, _, event, location) in enumerate(shows):
+            category = columns['bit'][event]
+            weight = columns['weight'][event]
+            chains_j = {} if required_before[j] else {category: [(weight, (event,))]}
+            
+            for i in range(j):
+                if required_before[j] != required_before[i + 1]:
+                    continue
+                _, previous_end, previous_event, previous_location = shows[i]
+                if venue[previous_event] == venue[event]:
+                    travel = 0
+                else:
+                    travel = travel_times.get((previous_location, location))
+                if travel is None or previous_end + travel > start:
+                    continue
+                
+                for previous_mask, entries in chains[i].items():
+                    mask = previous_mask | category
+                    extended = [(score + weight, previous + (event,)) for score, previous in entries]
+                    chains_j[mask] = CombinationIndex._best_entries(chains_j.get(mask, []) + extended, keep)
+            
+            chains.append(chains_j)
+        
+        # Best sequences for every mask over all final shows (earliest wins ties)
+        best_end = {}
+        for j, chains_j in enumerate(chains):
+            if required_before[j + 1] != required_before[-1]:
+                continue
+            for mask, entries in chains_j.items():
+                best_end[mask] = CombinationIndex._best_entries(best_end.get(mask, []) + entries, keep)
+        
+        return [sequence for mask in sorted(best_end) for _, sequence in best_end[mask]]
+
+
+class ScoringModel:
+    """
+    Scoring function for itineraries, built from user preferences.
+    
+    Every performance scores points_per_performance plus the weight of its
+    category, sub-category, main venue and time slot (0 when not listed); every
+    category covered for the first time adds points_per_new_category. Weights can
+    be negative to downvote. With no weights this is the classic scoring.
+    """
+    
+    def __init__(
+        self,
+        points_per_performance: float = POINTS_PER_PERFORMANCE,
+        points_per_new_category: float = POINTS_PER_NEW_CATEGORY,
+        category_weights: Optional[Dict[str, float]] = None,
+        sub_category_weights: Optional[Dict[str, float]] = None,
+        venue_weights: Optional[Dict[str, float]] = None,
+        slot_weights: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize the scoring model.
+        
+        Args:
+            points_per_performance: Points for attending any performance
+            points_per_new_category: Bonus for each category covered for the first time
+            category_weights: Extra points per performance by category
+            sub_category_weights: Extra points per performance by sub-category
+            venue_weights: Extra points per performance by main venue
+            slot_weights: Extra points per performance by time slot ("early"/"late")
+        """
+        self.points_per_performance = points_per_performance
+        self.points_per_new_category = points_per_new_category
+        self.category_weights = dict(category_weights or {})
+        self.sub_category_weights = dict(sub_category_weights or {})
+        self.venue_weights = dict(venue_weights or {})
+        self.slot_weights = dict(slot_weights or {})
+    
+    def cache_key(self) -> Tuple:
+        """Hashable description of the model, for result caches."""
+        return (
+            self.points_per_performance,
+            self.points_per_new_category,
+            tuple(sorted(self.category_weights.items())),
+            tuple(sorted(self.sub_category_weights.items())),
+            tuple(sorted(self.venue_weights.items())),
+            tuple(sorted(self.slot_weights.items())),
+        )
+    
+    def is_default(self) -> bool:
+        """True if this is the classic scoring the CombinationIndex is built with."""
+        return self.cache_key() == ScoringModel().cache_key()
+    
+    def event_weights(self, events: EventTable) -> np.ndarray:
+        """
+        Score of every performance, as one vector over the EventTable.
+        
+        Each weight dictionary becomes a lookup table over the interned values of
+        its column, indexed by the event codes. The result is int64 when all
+        weights are integers and float64 otherwise.
+        
+        Args:
+            events: EventTable of the festival
+            
+        Returns:
+            Array of per-event scores, indexed by event index
+        """
+        weights = np.full(len(events), self.points_per_performance, dtype=np.float64)
+        
+        for table, values, codes in (
+            (self.category_weights, events.categories, events.category_codes),
+            (self.sub_category_weights, events.sub_categories, events.sub_category_codes),
+            (self.venue_weights, events.main_venues, events.main_venue_codes),
+            (self.slot_weights, EventTable.SLOTS, events.slot_codes),
+        ):
+            if table:
+                lookup = np.array([table.get(value, 0) for value in values], dtype=np.float64)
+                weights += lookup[codes]
+        
+        if np.all(weights == np.round(weights)):
+            return weights.astype(np.int64)
+        return weights
+
+
+class SolverStats:
+    """
+    Counters describing the work done by a solver, for diagnosing slow solves.
+    
+    Counts accumulate over solves until reset(). A state is one (day, categories
+    mask) entry of a DP table (or one partial itinerary in a heuristic solver).
+    Tables are reused row by row between solves (see PerformanceOptimizer._build_tables),
+    so every day row that is reused counts as a table hit and every row that is
+    recomputed as a table miss.
+    
+    Attributes:
+        solves: Number of solver calls
+        states_visited: DP states computed
+        combinations_evaluated: (state, combination) transitions scored
+        combinations_pruned: Transitions skipped because the combination was
+            dominated, excluded or missing a must-see event
+        table_hits: Day rows reused from an earlier solve
+        table_misses: Day rows computed
+        peak_table_entries: Largest number of entries held by a DP table
+        day_seconds: Wall time spent computing each day's row, by day index
+    """
+    
+    def __init__(self):
+        """Initialize all counters to zero."""
+        self.reset()
+    
+    def reset(self) -> None:
+        """Set all counters back to zero."""
+        self.solves = 0
+        self.states_visited = 0
+        self.combinations_evaluated = 0
+        self.combinations_pruned = 0
+        self.table_hits = 0
+        self.table_misses = 0
+        self.peak_table_entries = 0
+        self.day_seconds = defaultdict(float)
+    
+    def record_day(self, day_index: int, states: int, evaluated: int, pruned: int, seconds: float) -> None:
+        """Count the work of computing one day's row."""
+        self.states_visited += states
+        self.combinations_evaluated += evaluated
+        self.combinations_pruned += pruned
+        self.table_misses += 1
+        self.day_seconds[day_index] += seconds
+    
+    def record_table(self, reused_days: int, entries: int) -> None:
+        """Count one solve that reused reused_days rows of a table with entries entries."""
+        self.solves += 1
+        self.table_hits += reused_days
+        self.peak_table_entries = max(self.peak_table_entries, entries)
+    
+    @property
+    def hit_rate(self) -> float:
+        """Share of day rows served from earlier solves (0.0 before any solve)."""
+        lookups = self.table_hits + self.table_misses
+        return self.table_hits / lookups if lookups else 0.0
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain-dictionary snapshot of the counters, e.g. for JSON or display."""
+        return {
+            'solves': self.solves,
+            'states_visited': self.states_visited,
+            'combinations_evaluated': self.combinations_evaluated,
+            'combinations_pruned': self.combinations_pruned,
+            'table_hits': self.table_hits,
+            'table_misses': self.table_misses,
+            'hit_rate': self.hit_rate,
+            'peak_table_entries': self.peak_table_entries,
+            'day_seconds': dict(sorted(self.day_seconds.items())),
+        }
+
+
+class PerformanceOptimizer:
+    """
+    Dynamic programming solver for finding the optimal festival itinerary.
+    
+    Constraints:
+    - No repeated performances (tracked by event_id)
+    - No overlapping times on the same day
+    - Venue rules per the CombinationIndex day model: one main venue per day
+      ("slots", "intervals"), or venue switches with enough travel time ("travel")
+    """
+    
+    def __init__(
+        self,
+        events: EventTable,
+        schedule_dict: Dict,
+        dates: List[str],
+        combination_index: Optional[CombinationIndex] = None,
+        scoring: Optional[ScoringModel] = None
+    ):
+        """
+        Initialize the optimizer.
+        
+        Performances are handled as event indices into the EventTable; itineraries
+        are returned as lists of event indices (see EventTable.records for display).
+        
+        Args:
+            events: EventTable with all performances
+            schedule_dict: Day-by-day schedule of event indices
+            dates: Sorted list of all festival dates
+            combination_index: Precomputed CombinationIndex for these dates
+                (built here if not given)
+            scoring: ScoringModel to optimize for (default: the classic scoring)
+        """
+        self.events = events
+        self.schedule_dict = schedule_dict
+        self.dates = dates
+        
+        if combination_index is None or combination_index.dates != list(dates):
+            combination_index = CombinationIndex(events, schedule_dict, dates)
+        # Index built with the classic scoring; set_scoring picks self.index from it
+        self.combination_index = combination_index
+        self.index = combination_index
+        
+        # One bit per category; DP state is (day_index, categories_mask)
+        self.category_bits = self.index.category_bits
+        
+        # Work counters for diagnostics; accumulate until stats.reset()
+        self.stats = SolverStats()
+        
+        # Per-combination scores and frontiers; DP tables are filled lazily by _build_tables
+        self.set_scoring(scoring or ScoringModel())
+    
+    def set_scoring(self, scoring: ScoringModel) -> None:
+        """
+        Switch to another scoring model without rebuilding the CombinationIndex.
+        
+        With the "slots" day model, per-event weights are computed as one vector
+        and summed per combination with array operations; only the Pareto
+        frontiers are recomputed. The "intervals" and "travel" models keep only the
+        best show set per category mask, which depends on the weights, so for them
+        a non-default scoring rebuilds the CombinationIndex with its weights. The
+        DP tables are invalidated.
+        
+        Args:
+            scoring: ScoringModel to optimize for
+        """
+        self.scoring = scoring
+        index = self.combination_index
+        
+        if scoring.is_default():
+            self.event_weights = np.full(len(self.events), scoring.points_per_performance, dtype=np.int64)
+            self.base_scores = index.base_scores
+            self.frontiers = index.frontiers
+        elif index.day_model == "slots":
+            self.event_weights = scoring.event_weights(self.events)
+            self.base_scores = index.combination_scores(self.event_weights)
+            self.frontiers = [
+                index.pareto_frontier(day_index, range(len(day_scores)), day_scores)
+                for day_index, day_scores in enumerate(self.base_scores)
+            ]
+        else:
+            self.event_weights = scoring.event_weights(self.events)
+            index = CombinationIndex(
+                self.events,
+                self.schedule_dict,
+                self.dates,
+                index.day_model,
+                index.travel_times,
+                self.event_weights
+            )
+            self.base_scores = index.base_scores
+            self.frontiers = index.frontiers
+        self.index = index
+        
+        # Interval and travel days re-enumerated under what-if constraints, as
+        # (day_index, excluded, required) -> combination indices; the new
+        # combinations are appended to a copy of the index owned by this optimizer
+        self._constrained_choices = {}
+        self._owns_index = index is not self.combination_index
+        
+        # Only try each day's Pareto-optimal combinations; this relies on covering
+        # more categories never lowering the score
+        self.prune_dominated = scoring.points_per_new_category >= 0
+        
+        self.score_table = None
+        self.choice_table = None
+        self._table_constraints = None
+        self.ranked_table = None
+        self._ranked_constraints = None
+        self._ranked_k = None
+    
+    def get_performances_for_day(self, date: str) -> Dict:
+        """Get all performances (event indices by slot) available on a specific date."""
+        return self.schedule_dict.get(date, {"early": [], "late": []})
+    
+    def extract_categories(self, performances: List[int]) -> FrozenSet:
+        """Extract unique categories from a list of event indices."""
+        categories = self.events.categories
+        return frozenset(categories[code] for code in self.events.category_codes[list(performances)].tolist())
+    
+    def get_valid_combinations(self, date: str) -> List[List[int]]:
+        """
+        Valid combinations of performances for a single day, from the CombinationIndex.
+        
+        Constraints (see CombinationIndex for the day models):
+        - "slots": maximum one performance per time slot (early/late), all at the
+          same main venue; every such combination is returned
+        - "intervals": no overlapping shows, all at the same main venue
+        - "travel": no overlapping shows, with travel time between venues
+        
+        The "intervals" and "travel" models only store the best combination per
+        (venue, category mask), so for them this is not every valid combination.
+        
+        Returns:
+            List of combinations (lists of event indices), the empty one first
+        """
+        day_index = self.index.day_positions.get(date)
+        if day_index is None:
+            return [[]]
+        
+        # Skip the day (empty combination), then the precomputed combinations
+        return [[]] + [list(combination) for combination in self.index.combinations[day_index]]
+    
+    def calculate_score(self, performances: List, categories_before: FrozenSet) -> Tuple[int, FrozenSet]:
+        """
+        Calculate score for a combination of performances.
+        
+        Scoring (see ScoringModel):
+        - points per performance, adjusted by the preference weights
+        - +bonus points for each new category discovered
+        
+        Args:
+            performances: List of event indices
+            categories_before: Categories already covered
+            
+        Returns:
+            Tuple of (score, new_categories_set)
+        """
+        if not performances:
+            return 0, categories_before
+        
+        # Base score: sum of the performances' weights
+        base_score = self.event_weights[list(performances)].sum().item()
+        
+        # Extract new categories
+        new_cats = self.extract_categories(performances)
+        new_categories_found = new_cats - categories_before
+        category_bonus = len(new_categories_found) * self.scoring.points_per_new_category
+        
+        total_score = base_score + category_bonus
+        updated_categories = categories_before | new_cats
+        
+        return total_score, updated_categories
+    
+    def find_best_itinerary(
+        self,
+        day_index: int = 0,
+        categories_seen: FrozenSet = frozenset(),
+        events_seen: FrozenSet = frozenset(),
+        must_see: FrozenSet = frozenset()
+    ) -> Tuple[int, List[int]]:
+        """
+        Find the best itinerary using bottom-up dynamic programming.
+        
+        The DP tables are filled iteratively from the last festival day backwards,
+        so there is no recursion-depth limit on long festivals. Each state keeps a
+        back-pointer (the chosen combination index) instead of a copied path, and the
+        itinerary is rebuilt once at the end.
+        
+        Args:
+            day_index: Current day index in the festival
+            categories_seen: Set of categories already covered
+            events_seen: Set of event_ids already scheduled (never scheduled again)
+            must_see: Set of event_ids that must be part of the itinerary
+            
+        Returns:
+            Tuple of (best_score, list of event indices)
+            
+        Raises:
+            ValueError: If no itinerary contains all must_see events
+        """
+        categories_mask = 0
+        for category in categories_seen:
+            categories_mask |= self.category_bits.get(category, 0)
+        
+        return self.find_best_itinerary_by_mask(day_index, categories_mask, events_seen, must_see)
+    
+    def find_best_itinerary_by_mask(
+        self,
+        day_index: int = 0,
+        categories_mask: int = 0,
+        events_seen: FrozenSet = frozenset(),
+        must_see: FrozenSet = frozenset()
+    ) -> Tuple[int, List[int]]:
+        """
+        Find the best itinerary starting from (day_index, categories_mask).
+        
+        Every event belongs to exactly one date, so once a day has been decided
+        none of its events can come up again. Tracking events_seen in the state
+        therefore never prunes anything; the state is just (day_index, categories_mask),
+        giving at most (len(dates) + 1) * 2^len(categories) table entries.
+        
+        Ties are broken as in the original recursive solver: skipping the day wins
+        unless a combination is strictly better, and earlier combinations win over
+        later ones. A day holding a must-see event cannot be skipped, and only
+        combinations containing all of that day's must-see events are tried.
+        
+        Args:
+            day_index: Day index to start from
+            categories_mask: Bitmask of categories already covered (see category_bits)
+            events_seen: Set of event_ids that must not be scheduled
+            must_see: Set of event_ids that must be part of the itinerary
+            
+        Returns:
+            Tuple of (best_score, list of event indices)
+            
+        Raises:
+            ValueError: If no itinerary contains all must_see events
+        """
+        if day_index >= len(self.dates):
+            return 0, []
+        
+        self._build_tables(frozenset(events_seen), frozenset(must_see))
+        
+        best_score = self.score_table[day_index][categories_mask]
+        if best_score == UNREACHABLE:
+            raise ValueError("No valid itinerary includes all must-see events")
+        return best_score, self._rebuild_path(day_index, categories_mask)
+    
+    def pending_transitions(self, events_seen: FrozenSet = frozenset(), must_see: FrozenSet = frozenset()) -> int:
+        """
+        Work left for find_best_itinerary with these constraints.
+        
+        Counts the (categories mask, combination) transitions of the days whose
+        DP rows cannot be reused from the previous solve (see _build_tables), so
+        it is 0 when the tables are already up to date. Lets callers choose
+        between the exact solver and a time-budgeted one before solving.
+        
+        Args:
+            events_seen: Set of event_ids that must not be scheduled
+            must_see: Set of event_ids that must be part of the itinerary
+            
+        Returns:
+            Upper bound on the number of transitions the DP would evaluate
+            
+        Raises:
+            ValueError: If a must-see event_id is not in the schedule
+        """
+        day_constraints = self._day_constraints(frozenset(events_seen), frozenset(must_see))
+        first_day = self._first_stale_day(self._table_constraints, day_constraints)
+        return self.index.num_masks * sum(
+            len(self.index.combinations[day_index]) for day_index in range(first_day + 1)
+        )
+    
+    def find_best_itinerary_anytime(
+        self,
+        time_budget: float,
+        events_seen: FrozenSet = frozenset(),
+        must_see: FrozenSet = frozenset()
+    ) -> Tuple[int, List[int], float]:
+        """
+        Find the best itinerary that can be found within a time budget.
+        
+        Depth-first branch-and-bound over the days, trying each day's options
+        best immediate gain first, so the first dive is the greedy itinerary and
+        the search always has an answer. A partial itinerary is abandoned when its
+        score plus an upper bound on the remaining days cannot beat the best one
+        found so far, or when another partial itinerary reached the same
+        (day_index, categories_mask) state with at least its score. The bound
+        adds each remaining day's best combination score and the bonus for every
+        uncovered category that still appears in a remaining combination.
+        
+        When the budget runs out, the upper bound is the best bound of the
+        partial itineraries still on the search stack; a finished search proves
+        optimality (upper bound == score). Ties may be broken differently from
+        find_best_itinerary.
+        
+        Args:
+            time_budget: Seconds to search for; the greedy dive always completes
+            events_seen: Set of event_ids that must not be scheduled
+            must_see: Set of event_ids that must be part of the itinerary
+            
+        Returns:
+            Tuple of (best score found, list of event indices, proven upper bound
+            on the optimal score)
+            
+        Raises:
+            ValueError: If no itinerary contains all must_see events
+        """
+        if not self.dates:
+            return 0, [], 0
+        
+        deadline = time.perf_counter() + time_budget
+        day_constraints = self._day_constraints(frozenset(events_seen), frozenset(must_see))
+        num_days = len(self.dates)
+        popcounts = self.index.popcounts
+        category_points = self.scoring.points_per_new_category
+        bonus_points = max(category_points, 0)
+        
+        day_options = [
+            self._day_options(day_index, excluded, required=required)
+            for day_index, (excluded, required) in enumerate(day_constraints)
+        ]
+        
+        # suffix_scores[d]: best combination scores summed over days d, d+1, ...;
+        # suffix_categories[d]: categories any of those days' options can cover
+        suffix_scores = [0] * (num_days + 1)
+        suffix_categories = [0] * (num_days + 1)
+        for day_index in range(num_days - 1, -1, -1):
+            options = day_options[day_index]
+            base_scores = self.base_scores[day_index]
+            masks = self.index.masks[day_index]
+            
+            best_score = max((base_scores[choice] for choice in options), default=UNREACHABLE)
+            if not day_constraints[day_index][1]:
+                best_score = max(best_score, 0)
+            
+            day_categories = 0
+            for choice in options:
+                day_categories |= masks[choice]
+            
+            suffix_scores[day_index] = best_score + suffix_scores[day_index + 1]
+            suffix_categories[day_index] = day_categories | suffix_categories[day_index + 1]
+        
+        if suffix_scores[0] == UNREACHABLE:
+            raise ValueError("No valid itinerary includes all must-see events")
+        
+        def expand(day_index: int, categories_mask: int, score: float) -> List:
+            """Search stack frame: [day, mask, score, upper bound, children, next child]."""
+            masks = self.index.masks[day_index]
+            base_scores = self.base_scores[day_index]
+            children = [] if day_constraints[day_index][1] else [(0, None)]
+            for choice in day_options[day_index]:
+                gain = base_scores[choice] + popcounts[masks[choice] & ~categories_mask] * category_points
+                children.append((gain, choice))
+            # Stable sort: on equal gains skipping and earlier combinations come first
+            children.sort(key=lambda child: -child[0])
+            
+            upper_bound = (
+                score
+                + suffix_scores[day_index]
+                + popcounts[suffix_categories[day_index] & ~categories_mask] * bonus_points
+            )
+            self.stats.states_visited += 1
+            self.stats.combinations_evaluated += len(children)
+            return [day_index, categories_mask, score, upper_bound, children, 0]
+        
+        best_score = UNREACHABLE
+        best_path = None
+        best_at = {}
+        finished = True
+        
+        stack = [expand(0, 0, 0)]
+        while stack:
+            frame = stack[-1]
+            day_index, categories_mask, score, _, children, position = frame
+            if position == len(children):
+                stack.pop()
+                continue
+            frame[5] += 1
+            
+            gain, choice = children[position]
+            next_day = day_index + 1
+            next_score = score + gain
+            next_mask = categories_mask if choice is None else categories_mask | self.index.masks[day_index][choice]
+            
+            if next_day == num_days:
+                if next_score > best_score:
+                    best_score = next_score
+                    best_path = []
+                    for day_frame in stack:
+                        day_choice = day_frame[4][day_frame[5] - 1][1]
+                        if day_choice is not None:
+                            best_path.extend(self.index.combinations[day_frame[0]][day_choice])
+                continue
+            
+            bound = (
+                next_score
+                + suffix_scores[next_day]
+                + popcounts[suffix_categories[next_day] & ~next_mask] * bonus_points
+            )
+            if bound <= best_score or best_at.get((next_day, next_mask), UNREACHABLE) >= next_score:
+                self.stats.combinations_pruned += 1
+                continue
+            
+            if best_path is not None and time.perf_counter() > deadline:
+                finished = False
+                break
+            
+            best_at[(next_day, next_mask)] = next_score
+            stack.append(expand(next_day, next_mask, next_score))
+        
+        self.stats.record_table(0, len(best_at))
+        
+        # Children not yet explored are bounded by their frame's bound
+        upper_bound = best_score
+        if not finished:
+            upper_bound = max([best_score] + [frame[3] for frame in stack])
+        
+        return best_score, best_path, upper_bound
+    
+    def _day_options(
+        self,
+        day_index: int,
+        excluded: Set[int],
+        prune: bool = True,
+        required: FrozenSet = frozenset(),
+        keep: int = 1
+    ) -> List[int]:
+        """
+        Combination indices (into the CombinationIndex) the solver may pick on a day.
+        
+        Combinations containing an event index from excluded, or missing one from
+        required, are left out. With prune, only the Pareto frontier of the remaining
+        combinations is returned (see CombinationIndex.frontiers). With the "intervals"
+        and "travel" models, keep > 1 re-runs the day's DP to get the keep best
+        combinations per category mask, as ranking K itineraries needs.
+        """
+        day_combinations = self.index.combinations[day_index]
+        # The "slots" model stores every combination, so it never needs keep
+        if not excluded and not required and (keep == 1 or self.index.day_model == "slots"):
+            if prune and self.prune_dominated:
+                return self.frontiers[day_index]
+            # Combinations added for what-if constraints come after the enumerated ones
+            return range(int(self.index.day_starts[day_index + 1] - self.index.day_starts[day_index]))
+        
+        if self.index.day_model == "slots":
+            choices = [
+                choice for choice, combination in enumerate(day_combinations)
+                if excluded.isdisjoint(combination) and required.issubset(combination)
+            ]
+        else:
+            choices = self._constrained_options(day_index, excluded, required, keep)
+        if prune and self.prune_dominated:
+            return self.index.pareto_frontier(day_index, choices, self.base_scores[day_index])
+        return choices
+    
+    def _constrained_options(
+        self,
+        day_index: int,
+        excluded: FrozenSet,
+        required: FrozenSet,
+        keep: int = 1
+    ) -> List[int]:
+        """
+        Combination indices meeting a day's constraints with the "intervals" or "travel" model.
+        
+        The stored combinations are only the best per category mask, so the day's
+        DP is re-run under the constraints (see CombinationIndex.constrained_combinations)
+        and its results are added to this optimizer's copy of the index.
+        """
+        key = (day_index, excluded, required, keep)
+        if key not in self._constrained_choices:
+            if not self._owns_index:
+                self.index = self.index.copy()
+                self.base_scores = self.index.base_scores
+                self._owns_index = True
+            combinations = self.index.constrained_combinations(day_index, self.event_weights, excluded, required, keep)
+            self._constrained_choices[key] = self.index.add_combinations(day_index, combinations, self.event_weights)
+        
+        return self._constrained_choices[key]
+    
+    def _events_by_day(self, event_ids: FrozenSet) -> Dict[int, FrozenSet]:
+        """Group event_ids into event indices per day index (unknown IDs are ignored)."""
+        events_by_day = defaultdict(set)
+        for index in self.events.indices_of(event_ids).tolist():
+            day_index = self.index.day_positions.get(self.events.dates[self.events.date_codes[index]])
+            if day_index is not None:
+                events_by_day[day_index].add(index)
+        
+        return {day_index: frozenset(indices) for day_index, indices in events_by_day.items()}
+    
+    def _day_constraints(self, events_seen: FrozenSet, must_see: FrozenSet) -> List[Tuple[FrozenSet, FrozenSet]]:
+        """
+        (excluded, required) event indices for every day.
+        
+        Raises:
+            ValueError: If a must-see event_id is not in the schedule
+        """
+        excluded_by_day = self._events_by_day(events_seen)
+        required_by_day = self._events_by_day(must_see)
+        if sum(len(required) for required in required_by_day.values()) != len(must_see):
+            raise ValueError("Unknown must-see event ID(s)")
+        
+        return [
+            (excluded_by_day.get(day_index, frozenset()), required_by_day.get(day_index, frozenset()))
+            for day_index in range(len(self.dates))
+        ]
+    
+    @staticmethod
+    def _first_stale_day(old_constraints: Optional[List], new_constraints: List) -> int:
+        """
+        Latest day whose constraints changed, or -1 if none did.
+        
+        The DP runs backwards, so tables for days after this one are still valid.
+        """
+        if old_constraints is None:
+            return len(new_constraints) - 1
+        for day_index in range(len(new_constraints) - 1, -1, -1):
+            if old_constraints[day_index] != new_constraints[day_index]:
+                return day_index
+        return -1
+    
+    def _build_tables(self, events_seen: FrozenSet, must_see: FrozenSet = frozenset()) -> None:
+        """
+        Fill score_table and choice_table bottom-up, from the last day to the first.
+        
+        score_table[d][mask] is the best score achievable from day d onwards when the
+        categories in mask are already covered (UNREACHABLE if the must-see events
+        cannot all be attended); choice_table[d][mask] is the index of the winning
+        combination in index.combinations[d], or None to skip.
+        
+        Re-solving is incremental: when the constraints (excluded or must-see events)
+        change only on day d, the rows for later days are kept and only days d, d-1,
+        ..., 0 are recomputed. Pinning or excluding an event late in the festival
+        therefore costs a fraction of a full solve, and one early on almost nothing.
+        """
+        day_constraints = self._day_constraints(events_seen, must_see)
+        
+        num_masks = self.index.num_masks
+        num_days = len(self.dates)
+        popcounts = self.index.popcounts
+        category_points = self.scoring.points_per_new_category
+        
+        if self.score_table is None:
+            score_table = [None] * num_days + [[0] * num_masks]
+            choice_table = [None] * num_days
+        else:
+            score_table = list(self.score_table)
+            choice_table = list(self.choice_table)
+        
+        first_day = self._first_stale_day(self._table_constraints, day_constraints)
+        for day_index in range(first_day, -1, -1):
+            day_start = time.perf_counter()
+            next_scores = score_table[day_index + 1]
+            
+            excluded, required = day_constraints[day_index]
+            options = self._day_options(day_index, excluded, required=required)
+            masks = self.index.masks[day_index]
+            base_scores = self.base_scores[day_index]
+            
+            day_scores = [0] * num_masks
+            day_choices = [None] * num_masks
+            
+            for mask in range(num_masks):
+                # Option 1: Skip this day (not allowed on a day with a must-see event)
+                best_score = UNREACHABLE if required else next_scores[mask]
+                best_choice = None
+                
+                # Option 2: Attend one of the valid combinations
+                for choice in options:
+                    combination_mask = masks[choice]
+                    total_score = (
+                        base_scores[choice]
+                        + popcounts[combination_mask & ~mask] * category_points
+                        + next_scores[mask | combination_mask]
+                    )
+                    if total_score > best_score:
+                        best_score = total_score
+                        best_choice = choice
+                
+                day_scores[mask] = best_score
+                day_choices[mask] = best_choice
+            
+            score_table[day_index] = day_scores
+            choice_table[day_index] = day_choices
+            
+            self.stats.record_day(
+                day_index,
+                num_masks,
+                num_masks * len(options),
+                num_masks * (len(masks) - len(options)),
+                time.perf_counter() - day_start
+            )
+        
+        self.stats.record_table(num_days - 1 - first_day, (num_days + 1) * num_masks)
+        self.score_table = score_table
+        self.choice_table = choice_table
+        self._table_constraints = day_constraints
+    
+    def find_top_k_itineraries(
+        self,
+        k: int,
+        events_seen: FrozenSet = frozenset(),
+        must_see: FrozenSet = frozenset()
+    ) -> List[Tuple[int, List[int]]]:
+        """
+        Find the K best distinct itineraries in a single k-best DP pass.
+        
+        Every (day_index, categories_mask) state keeps its K best continuations as
+        (score, choice, successor_rank) entries. They are produced by a lazy heap merge
+        over the state's options (skip or one combination), each paired with the
+        already-ranked continuations of its successor state, so the work grows
+        linearly with K instead of re-solving K times.
+        
+        Two itineraries differ whenever their per-day choices differ, so all returned
+        schedules are distinct. The first one is the same as find_best_itinerary().
+        The "intervals" and "travel" indexes store only the best combination per
+        category mask, so their days are re-enumerated keeping the K best per mask.
+        Like the DP tables, the ranked table is reused for the days after the last
+        day whose constraints changed since the previous call with the same k.
+        
+        Args:
+            k: Number of itineraries to return
+            events_seen: Set of event_ids that must not be scheduled
+            must_see: Set of event_ids that must be part of every itinerary
+            
+        Returns:
+            List of up to k (score, list of event indices) tuples, best first;
+            empty if no itinerary contains all must_see events
+        """
+        if k <= 0:
+            return []
+        if not self.dates:
+            return [(0, [])]
+        
+        num_masks = self.index.num_masks
+        num_days = len(self.dates)
+        popcounts = self.index.popcounts
+        category_points = self.scoring.points_per_new_category
+        day_constraints = self._day_constraints(frozenset(events_seen), frozenset(must_see))
+        
+        if self.ranked_table is None or self._ranked_k != k:
+            self._ranked_constraints = None
+            ranked_table = [None] * num_days + [[[(0, None, 0)]] * num_masks]
+        else:
+            ranked_table = list(self.ranked_table)
+        
+        first_day = self._first_stale_day(self._ranked_constraints, day_constraints)
+        for day_index in range(first_day, -1, -1):
+            day_start = time.perf_counter()
+            next_ranked = ranked_table[day_index + 1]
+            # Dominated combinations are still valid alternatives, so no pruning here
+            excluded, required = day_constraints[day_index]
+            options = self._day_options(day_index, excluded, prune=False, required=required, keep=k)
+            masks = self.index.masks[day_index]
+            base_scores = self.base_scores[day_index]
+            
+            day_ranked = []
+            for mask in range(num_masks):
+                # (gain, choice, successor continuations) per option, skip first
+                successors = [] if required else [(0, None, next_ranked[mask])]
+                for choice in options:
+                    combination_mask = masks[choice]
+                    gain = base_scores[choice] + popcounts[combination_mask & ~mask] * category_points
+                    successors.append((gain, choice, next_ranked[mask | combination_mask]))
+                
+                # Heap items: (-total_score, option_order, successor_rank); successors
+                # without continuations cannot reach all must-see events
+                heap = [
+                    (-(gain + continuations[0][0]), order, 0)
+                    for order, (gain, _, continuations) in enumerate(successors)
+                    if continuations
+                ]
+                heapq.heapify(heap)
+                
+                ranked = []
+                while heap and len(ranked) < k:
+                    negative_score, order, rank = heapq.heappop(heap)
+                    gain, choice, continuations = successors[order]
+                    ranked.append((-negative_score, choice, rank))
+                    
+                    if rank + 1 < len(continuations):
+                        heapq.heappush(heap, (-(gain + continuations[rank + 1][0]), order, rank + 1))
+                
+                day_ranked.append(ranked)
+            
+            ranked_table[day_index] = day_ranked
+            
+            self.stats.record_day(
+                day_index,
+                num_masks,
+                num_masks * len(options),
+                num_masks * (len(masks) - len(options)),
+                time.perf_counter() - day_start
+            )
+        
+        self.stats.record_table(
+            num_days - 1 - first_day,
+            sum(len(ranked) for day_ranked in ranked_table for ranked in day_ranked)
+        )
+        self.ranked_table = ranked_table
+        self._ranked_constraints = day_constraints
+        self._ranked_k = k
+        
+        itineraries = []
+        for rank, (score, _, _) in enumerate(ranked_table[0][0]):
+            path = []
+            categories_mask = 0
+            entry_rank = rank
+            for day_index in range(num_days):
+                _, choice, entry_rank = ranked_table[day_index][categories_mask][entry_rank]
+                if choice is None:
+                    continue
+                path.extend(self.index.combinations[day_index][choice])
+                categories_mask |= self.index.masks[day_index][choice]
+            itineraries.append((score, path))
+        
+        return itineraries
+    
+    def _rebuild_path(self, day_index: int, categories_mask: int) -> List[int]:
+        """Follow the back-pointers in choice_table to rebuild the itinerary."""
+        path = []
+        
+        for index in range(day_index, len(self.dates)):
+            choice = self.choice_table[index][categories_mask]
+            if choice is None:
+                continue
+            
+            path.extend(self.index.combinations[index][choice])
+            categories_mask |= self.index.masks[index][choice]
+        
+        return path
+
+
+class GreedyOptimizer(PerformanceOptimizer):
+    """
+    Greedy baseline: walk the festival day by day and take the combination with the
+    highest immediate gain (performances plus new-category bonus), skipping a day
+    when nothing gains points.
+    
+    One pass over each day's options, independent of the number of categories, but
+    it can miss better itineraries, e.g. one that saves a category for a day where
+    it comes with more shows. Only find_best_itinerary is greedy; everything else
+    is inherited from PerformanceOptimizer.
+    """
+    
+    def find_best_itinerary_by_mask(
+        self,
+        day_index: int = 0,
+        categories_mask: int = 0,
+        events_seen: FrozenSet = frozenset(),
+        must_see: FrozenSet = frozenset()
+    ) -> Tuple[int, List[int]]:
+        """
+        Build an itinerary greedily starting from (day_index, categories_mask).
+        
+        Args:
+            day_index: Day index to start from
+            categories_mask: Bitmask of categories already covered (see category_bits)
+            events_seen: Set of event_ids that must not be scheduled
+            must_see: Set of event_ids that must be part of the itinerary
+            
+        Returns:
+            Tuple of (score, list of event indices)
+            
+        Raises:
+            ValueError: If a day's must-see events cannot be attended together
+        """
+        day_constraints = self._day_constraints(frozenset(events_seen), frozenset(must_see))
+        popcounts = self.index.popcounts
+        category_points = self.scoring.points_per_new_category
+        
+        total_score = 0
+        path = []
+        
+        for index in range(day_index, len(self.dates)):
+            day_start = time.perf_counter()
+            excluded, required = day_constraints[index]
+            options = self._day_options(index, excluded, required=required)
+            masks = self.index.masks[index]
+            base_scores = self.base_scores[index]
+            
+            best_gain = UNREACHABLE if required else 0
+            best_choice = None
+            for choice in options:
+                gain = base_scores[choice] + popcounts[masks[choice] & ~categories_mask] * category_points
+                if gain > best_gain:
+                    best_gain = gain
+                    best_choice = choice
+            
+            if best_gain == UNREACHABLE:
+                raise ValueError("No valid itinerary includes all must-see events")
+            if best_choice is not None:
+                total_score += best_gain
+                path.extend(self.index.combinations[index][best_choice])
+                categories_mask |= masks[best_choice]
+            
+            self.stats.record_day(
+                index, 1, len(options), len(masks) - len(options), time.perf_counter() - day_start
+            )
+        
+        self.stats.record_table(0, 1)
+        return total_score, path
+
+
+class BeamSearchOptimizer(PerformanceOptimizer):
+    """
+    Beam search: walk the festival day by day, keeping only the beam_width best
+    partial itineraries.
+    
+    Partial itineraries covering the same categories are merged (only the best one
+    can lead to the optimum), so a beam at least as wide as the number of category
+    masks is exact. Narrower beams trade quality for time when there are many
+    categories, where the exact DP's 2^categories states get expensive. Only
+    find_best_itinerary is beam search; everything else is inherited.
+    """
+    
+    def __init__(
+        self,
+        events: EventTable,
+        schedule_dict: Dict,
+        dates: List[str],
+        combination_index: Optional[CombinationIndex] = None,
+        scoring: Optional[ScoringModel] = None,
+        beam_width: int = BEAM_WIDTH
+    ):
+        """
+        Initialize the optimizer.
+        
+        Args:
+            events: EventTable with all performances
+            schedule_dict: Day-by-day schedule of event indices
+            dates: Sorted list of all festival dates
+            combination_index: Precomputed CombinationIndex for these dates
+                (built here if not given)
+            scoring: ScoringModel to optimize for (default: the classic scoring)
+            beam_width: Number of partial itineraries kept after each day
+        """
+        super().__init__(events, schedule_dict, dates, combination_index, scoring)
+        self.beam_width = beam_width
+    
+    def find_best_itinerary_by_mask(
+        self,
+        day_index: int = 0,
+        categories_mask: int = 0,
+        events_seen: FrozenSet = frozenset(),
+        must_see: FrozenSet = frozenset()
+    ) -> Tuple[int, List[int]]:
+        """
+        Build an itinerary by beam search starting from (day_index, categories_mask).
+        
+        Args:
+            day_index: Day index to start from
+            categories_mask: Bitmask of categories already covered (see category_bits)
+            events_seen: Set of event_ids that must not be scheduled
+            must_see: Set of event_ids that must be part of the itinerary
+            
+        Returns:
+            Tuple of (score, list of event indices)
+            
+        Raises:
+            ValueError: If no itinerary in the beam includes all must-see events
+        """
+        day_constraints = self._day_constraints(frozenset(events_seen), frozenset(must_see))
+        popcounts = self.index.popcounts
+        category_points = self.scoring.points_per_new_category
+        
+        # Beam entries map categories_mask -> node; a node is
+        # (score, parent node, day_index, choice) and the root has no parent
+        beam = {categories_mask: (0, None, None, None)}
+        peak_candidates = 1
+        
+        for index in range(day_index, len(self.dates)):
+            day_start = time.perf_counter()
+            excluded, required = day_constraints[index]
+            options = self._day_options(index, excluded, required=required)
+            masks = self.index.masks[index]
+            base_scores = self.base_scores[index]
+            
+            candidates = {} if required else dict(beam)
+            for mask, node in beam.items():
+                for choice in options:
+                    combination_mask = masks[choice]
+                    score = (
+                        node[0]
+                        + base_scores[choice]
+                        + popcounts[combination_mask & ~mask] * category_points
+                    )
+                    new_mask = mask | combination_mask
+                    if new_mask not in candidates or score > candidates[new_mask][0]:
+                        candidates[new_mask] = (score, node, index, choice)
+            
+            if not candidates:
+                raise ValueError("No valid itinerary includes all must-see events")
+            
+            self.stats.record_day(
+                index,
+                len(beam),
+                len(beam) * len(options),
+                len(beam) * (len(masks) - len(options)),
+                time.perf_counter() - day_start
+            )
+            peak_candidates = max(peak_candidates, len(candidates))
+            beam = dict(heapq.nlargest(self.beam_width, candidates.items(), key=lambda item: item[1][0]))
+        
+        self.stats.record_table(0, peak_candidates)
+        node = max(beam.values(), key=lambda item: item[0])
+        best_score = node[0]
+        
+        path = []
+        while node[1] is not None:
+            _, parent, index, choice = node
+            path[:0] = self.index.combinations[index][choice]
+            node = parent
+        
+        return best_score, path
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of solver results shared by all sessions.
+    
+    Keys should identify everything the result depends on, typically
+    (dataset fingerprint, scoring parameters, user constraints). Results are
+    computed outside the lock, so a slow solve never blocks lookups; two
+    sessions missing on the same key at once may both compute it.
+    """
+    
+    def __init__(self, max_size: int):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_size: Maximum number of results kept before evicting the least recently used
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        store_if: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Return the cached result for key, computing and storing it on a miss.
+        
+        Args:
+            key: Hashable description of the request
+            compute: Zero-argument function producing the result
+            store_if: Predicate on a fresh result; results it rejects (e.g. ones
+                that depend on a time budget) are returned but not stored
+            
+        Returns:
+            The cached or freshly computed result
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        
+        result = compute()
+        if store_if is not None and not store_if(result):
+            return result
+        
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        
+        return result
+    
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and size counters."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+
+# ==============================================================================
+# SECTION 3: FESTIVAL LOADING AND PREFERENCE PROFILES
+# ==============================================================================
+
+PROFILE_FIELDS = (
+    "name", "excluded_dates", "excluded_events", "must_see_events",
+    "category_weights", "sub_category_weights", "venue_weights", "slot_weights"
+)
+
+
+def load_festival_data(base_path: str, venue_lock_in: bool = True) -> Tuple:
+    """
+    Load and preprocess the festival CSVs and solve the optimal itinerary.
+    
+    Results are cached on disk under CACHE_DIR, keyed by the CSV contents and the
+    scoring settings, so repeated loads (restarts, CLI runs) only read one file.
+    
+    Args:
+        base_path: Directory containing the data files
+        venue_lock_in: True to stay at one venue per day, False to allow venue
+            switches planned around travel_times.csv
+        
+    Returns:
+        Tuple of (fingerprint, df_processed, events, schedule_dict, dates,
+        combination_index, best_itinerary, df_exhibition), where best_itinerary
+        is (score, list of event indices)
+        
+    Raises:
+        ValueError: If DAY_MODEL is "travel", which is chosen with venue_lock_in instead
+    """
+    if DAY_MODEL not in ("slots", "intervals"):
+        raise ValueError(
+            f'DAY_MODEL must be "slots" or "intervals", not {DAY_MODEL!r}; '
+            'allow venue switches (VENUE_LOCK_IN = False) for the "travel" model'
+        )
+    
+    performances_path = os.path.join(base_path, PERFORMANCES_CSV)
+    exhibition_path = os.path.join(base_path, EXHIBITION_CSV)
+    travel_times_path = os.path.join(base_path, TRAVEL_TIMES_CSV)
+    
+    data_files = [performances_path, exhibition_path]
+    if not venue_lock_in:
+        data_files.append(travel_times_path)
+    settings = {
+        'points_per_performance': POINTS_PER_PERFORMANCE,
+        'points_per_new_category': POINTS_PER_NEW_CATEGORY,
+        'early_slot_end_time': EARLY_SLOT_END_TIME,
+        'default_duration_minutes': DEFAULT_DURATION_MINUTES,
+        'day_model': DAY_MODEL if venue_lock_in else "travel",
+    }
+    fingerprint = compute_data_fingerprint(data_files, settings)
+    cache_dir = os.path.join(base_path, CACHE_DIR)
+    
+    cached = load_disk_cache(cache_dir, fingerprint)
+    if cached is not None:
+        return (fingerprint,) + cached
+    
+    # Load performances
+    df = load_performances_data(performances_path)
+    df_processed, events, schedule_dict = preprocess_performances(df)
+    dates = get_all_dates(schedule_dict)
+    
+    if venue_lock_in:
+        combination_index = CombinationIndex(events, schedule_dict, dates)
+    else:
+        travel_times = load_travel_times(travel_times_path)
+        combination_index = CombinationIndex(events, schedule_dict, dates, "travel", travel_times)
+    
+    # Solve once; the optimal itinerary only depends on the data and settings
+    optimizer = PerformanceOptimizer(events, schedule_dict, dates, combination_index)
+    best_itinerary = optimizer.find_best_itinerary()
+    
+    # Load exhibitions
+    df_exhibition = load_exhibition_data(exhibition_path)
+    
+    data = (df_processed, events, schedule_dict, dates, combination_index, best_itinerary, df_exhibition)
+    save_disk_cache(cache_dir, fingerprint, data)
+    
+    return (fingerprint,) + data
+
+
+def profile_exclusions(profile: Dict, events: EventTable) -> FrozenSet:
+    """
+    Event IDs a preference profile rules out.
+    
+    A profile is a dictionary with any of the PROFILE_FIELDS:
+    - name: label used in the output
+    - excluded_dates: dates (YYYY-MM-DD) the user cannot attend
+    - excluded_events: event IDs the user does not want to see
+    - must_see_events: event IDs the itinerary has to include
+    - category_weights, sub_category_weights, venue_weights, slot_weights:
+      extra points per show (see ScoringModel)
+    
+    Args:
+        profile: Preference profile
+        events: EventTable of the festival
+        
+    Returns:
+        Frozenset of event IDs, suitable as events_seen for the optimizer
+    """
+    unknown = set(profile) - set(PROFILE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown profile field(s): {', '.join(sorted(unknown))}")
+    
+    excluded = set(int(event_id) for event_id in profile.get("excluded_events", []))
+    
+    excluded_dates = set(profile.get("excluded_dates", []))
+    if excluded_dates:
+        date_mask = np.isin(np.asarray(events.dates, dtype=object), list(excluded_dates))
+        on_dates = date_mask[events.date_codes]
+        excluded.update(events.event_ids[on_dates].tolist())
+    
+    return frozenset(excluded)
+
+
+def profile_scoring(profile: Dict) -> ScoringModel:
+    """Scoring model with a preference profile's weights (classic scoring if it has none)."""
+    return ScoringModel(
+        category_weights=profile.get("category_weights"),
+        sub_category_weights=profile.get("sub_category_weights"),
+        venue_weights=profile.get("venue_weights"),
+        slot_weights=profile.get("slot_weights")
+    )
+
+
+def solve_profile(optimizer: PerformanceOptimizer, profile: Dict) -> Tuple[int, List[int]]:
+    """
+    Solve the optimal itinerary for one preference profile.
+    
+    The optimizer is re-weighted for the profile's scoring (the combination index
+    is reused), and its DP tables are reused when consecutive profiles have the
+    same weights, exclusions and must-see events.
+    
+    Args:
+        optimizer: PerformanceOptimizer for the festival
+        profile: Preference profile (see profile_exclusions)
+        
+    Returns:
+        Tuple of (best_score, list of event indices)
+        
+    Raises:
+        ValueError: If the profile is invalid or its must-see events cannot all
+            be attended
+    """
+    events_seen = profile_exclusions(profile, optimizer.events)
+    must_see = frozenset(int(event_id) for event_id in profile.get("must_see_events", []))
+    
+    scoring = profile_scoring(profile)
+    if scoring.cache_key() != optimizer.scoring.cache_key():
+        optimizer.set_scoring(scoring)
+    
+    return optimizer.find_best_itinerary(events_seen=events_seen, must_see=must_see)
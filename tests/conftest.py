@@ -0,0 +1,146 @@
+"""
+Shared fixtures: small seeded festivals and an exhaustive reference solver.
+The reference solver tries every subset of every day's shows, so it checks the
+DP solvers without relying on the CombinationIndex or any pruning.
+"""
+
+import itertools
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import generate_festival
+from optimizer import CombinationIndex, PerformanceOptimizer, ScoringModel, get_all_dates, preprocess_performances
+
+DAY_MODELS = ("slots", "intervals", "travel")
+
+# Travel minutes between the synthetic venues ("Stage s, Venue v")
+TRAVEL_TIMES = {
+    ("Venue 1", "Venue 1"): 5,
+    ("Venue 2", "Venue 2"): 5,
+    ("Venue 1", "Venue 2"): 15,
+    ("Venue 2", "Venue 1"): 15,
+}
+
+
+class Festival:
+    """A preprocessed festival with helpers to build optimizers and check itineraries."""
+    
+    def __init__(self, df):
+        _, self.events, self.schedule_dict = preprocess_performances(df)
+        self.dates = get_all_dates(self.schedule_dict)
+    
+    def index(self, day_model: str) -> CombinationIndex:
+        travel_times = TRAVEL_TIMES if day_model == "travel" else None
+        return CombinationIndex(self.events, self.schedule_dict, self.dates, day_model, travel_times)
+    
+    def optimizer(self, day_model: str, scoring: ScoringModel = None) -> PerformanceOptimizer:
+        return PerformanceOptimizer(self.events, self.schedule_dict, self.dates, self.index(day_model), scoring)
+    
+    def event_index(self, event_id: int) -> int:
+        return int(self.events.indices_of([event_id])[0])
+    
+    def day_is_valid(self, shows, day_model: str) -> bool:
+        """True if one day's shows (event indices) can all be attended."""
+        events = self.events
+        shows = sorted(shows, key=lambda show: (events.start_minutes[show], show))
+        ends = [int(events.start_minutes[show] + events.durations[show]) for show in shows]
+        
+        if day_model != "travel" and len({events.main_venue_codes[show] for show in shows}) > 1:
+            return False
+        if day_model == "slots":
+            # The classic model only looks at slots, not at durations
+            slots = [events.slot_codes[show] for show in shows]
+            return len(slots) == len(set(slots))
+        
+        for (previous, previous_end), show in zip(zip(shows, ends), shows[1:]):
+            travel = 0
+            if day_model == "travel" and events.venue_codes[previous] != events.venue_codes[show]:
+                locations = [events.venues[events.venue_codes[event]].split(',')[-1].strip() for event in (previous, show)]
+                travel = TRAVEL_TIMES.get(tuple(locations))
+                if travel is None:
+                    return False
+            if previous_end + travel > events.start_minutes[show]:
+                return False
+        
+        return True
+    
+    def score(self, itinerary, scoring: ScoringModel):
+        """Score of an itinerary (event indices) under a scoring model."""
+        weights = scoring.event_weights(self.events)
+        categories = {self.events.category_codes[show] for show in itinerary}
+        return weights[list(itinerary)].sum().item() + len(categories) * scoring.points_per_new_category
+    
+    def itinerary_scores(self, day_model: str, scoring: ScoringModel, events_seen=frozenset(), must_see=frozenset()):
+        """
+        Scores of every itinerary, by exhaustive search.
+        
+        Returns:
+            List of scores, best first; empty if no itinerary includes all must_see events
+        """
+        excluded = set(self.events.indices_of(events_seen).tolist())
+        required = set(self.events.indices_of(must_see).tolist())
+        
+        day_options = []
+        for date in self.dates:
+            shows = self.schedule_dict[date]["early"] + self.schedule_dict[date]["late"]
+            day_required = required.intersection(shows)
+            shows = [show for show in shows if show not in excluded]
+            options = [
+                subset
+                for size in range(len(shows) + 1)
+                for subset in itertools.combinations(shows, size)
+                if day_required.issubset(subset) and self.day_is_valid(subset, day_model)
+            ]
+            day_options.append(options)
+        
+        scores = [
+            self.score([show for day in itinerary for show in day], scoring)
+            for itinerary in itertools.product(*day_options)
+        ]
+        return sorted(scores, reverse=True)
+    
+    def brute_force(self, day_model: str, scoring: ScoringModel, events_seen=frozenset(), must_see=frozenset()):
+        """
+        Best score over every itinerary, by exhaustive search.
+        
+        Returns:
+            The optimal score, or None if no itinerary includes all must_see events
+        """
+        scores = self.itinerary_scores(day_model, scoring, events_seen, must_see)
+        return scores[0] if scores else None
+    
+    def check(self, result, day_model: str, scoring: ScoringModel, events_seen=frozenset(), must_see=frozenset()):
+        """Assert that a solver result is valid, scores as claimed and is optimal."""
+        score, itinerary = result
+        seen = set(self.events.event_ids[list(itinerary)].tolist())
+        
+        assert seen.isdisjoint(events_seen)
+        assert seen.issuperset(must_see)
+        for date_code in set(self.events.date_codes[list(itinerary)].tolist()):
+            day = [show for show in itinerary if self.events.date_codes[show] == date_code]
+            assert self.day_is_valid(day, day_model)
+        assert score == pytest.approx(self.score(itinerary, scoring))
+        assert score == pytest.approx(self.brute_force(day_model, scoring, events_seen, must_see))
+
+
+def small_festival(seed: int) -> Festival:
+    """Three days, two venues of two stages, three show times with overlapping durations."""
+    return Festival(generate_festival(
+        num_days=3,
+        num_venues=2,
+        shows_per_slot=2,
+        slot_times=("18:00", "19:15", "20:30"),
+        fill_rate=0.5,
+        weekend_fill_rate=0.5,
+        duration_rate=0.7,
+        seed=seed
+    ))
+
+
+@pytest.fixture(params=[0, 1, 2], ids=lambda seed: f"seed{seed}")
+def festival(request) -> Festival:
+    return small_festival(request.param)
@@ -0,0 +1,45 @@
+"""Anytime search, pending DP work and caching of budget-limited results."""
+
+import pytest
+
+from conftest import DAY_MODELS
+from optimizer import ResultCache, ScoringModel
+
+
+@pytest.mark.parametrize("day_model", DAY_MODELS)
+def test_finished_anytime_search_is_optimal(festival, day_model):
+    optimizer = festival.optimizer(day_model)
+    
+    score, itinerary, upper_bound = optimizer.find_best_itinerary_anytime(60)
+    
+    assert upper_bound == score
+    festival.check((score, itinerary), day_model, ScoringModel())
+
+
+def test_pending_transitions_only_counts_stale_days(festival):
+    optimizer = festival.optimizer("slots")
+    full = optimizer.pending_transitions()
+    assert full > 0
+    
+    optimizer.find_best_itinerary()
+    assert optimizer.pending_transitions() == 0
+    
+    # The DP runs backwards: ruling out a show on the first day only recomputes
+    # that day, on the last day every day
+    first_day = festival.schedule_dict[festival.dates[0]]
+    event_id = int(festival.events.event_ids[(first_day["early"] + first_day["late"])[0]])
+    index = optimizer.index
+    assert optimizer.pending_transitions(frozenset([event_id])) == index.num_masks * len(index.combinations[0])
+    
+    last_day = festival.schedule_dict[festival.dates[-1]]
+    event_id = int(festival.events.event_ids[(last_day["early"] + last_day["late"])[0]])
+    assert optimizer.pending_transitions(frozenset([event_id])) == full
+
+
+def test_result_cache_skips_rejected_results():
+    cache = ResultCache(4)
+    
+    assert cache.get_or_compute("key", lambda: (9, 11), store_if=lambda result: result[0] >= result[1]) == (9, 11)
+    assert cache.get_or_compute("key", lambda: (11, 11), store_if=lambda result: result[0] >= result[1]) == (11, 11)
+    assert cache.get_or_compute("key", lambda: (0, 0)) == (11, 11)
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'size': 1}
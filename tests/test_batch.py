@@ -0,0 +1,46 @@
+"""Batch solving of preference profiles against exhaustive search."""
+
+import pytest
+
+from batch import solve_profiles
+from conftest import DAY_MODELS
+from optimizer import profile_exclusions, profile_scoring
+
+
+def sample_profiles(festival):
+    """Profiles covering weights, excluded dates and events, must-see events and errors."""
+    event_ids = festival.events.event_ids.tolist()
+    return [
+        {"name": "classic"},
+        {"name": "votes", "sub_category_weights": {"Category 1 / Style 1": -3}, "venue_weights": {"Stage 1": 2}},
+        {"name": "busy", "excluded_dates": [festival.dates[1]], "excluded_events": event_ids[:2]},
+        {"name": "fan", "must_see_events": [event_ids[-1]], "category_weights": {"Category 2": 1.5}},
+        {"name": "clash", "must_see_events": [event_ids[0]], "excluded_events": [event_ids[0]]},
+        {"name": "typo", "must_see": [event_ids[0]]},
+        {"name": "classic again"},
+    ]
+
+
+@pytest.mark.parametrize("day_model", DAY_MODELS)
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_batch_results_match_brute_force(festival, day_model, max_workers):
+    profiles = sample_profiles(festival)
+    
+    results = sorted(
+        solve_profiles(festival.optimizer(day_model), profiles, max_workers),
+        key=lambda result: result["position"]
+    )
+    
+    assert [result["profile"] for result in results] == [profile["name"] for profile in profiles]
+    for profile, result in zip(profiles, results):
+        if profile["name"] == "typo":
+            assert "Unknown profile field" in result["error"]
+            continue
+        
+        scoring = profile_scoring(profile)
+        events_seen = profile_exclusions(profile, festival.events)
+        must_see = frozenset(profile.get("must_see_events", []))
+        if festival.brute_force(day_model, scoring, events_seen, must_see) is None:
+            assert "error" in result
+            continue
+        festival.check((result["score"], result["indices"]), day_model, scoring, events_seen, must_see)
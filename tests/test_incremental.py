@@ -0,0 +1,105 @@
+"""What-if edits (must-see and already-seen events) re-solved incrementally."""
+
+import pytest
+
+from conftest import DAY_MODELS, small_festival
+from optimizer import ScoringModel
+
+SCORINGS = {
+    "classic": ScoringModel(),
+    "votes": ScoringModel(sub_category_weights={"Category 1 / Style 1": -3}, venue_weights={"Stage 2": 2}),
+}
+
+
+def what_if_edits(festival):
+    """A sequence of (events_seen, must_see) edits touching every day, as event IDs."""
+    event_ids = festival.events.event_ids.tolist()
+    day_ids = [
+        [int(festival.events.event_ids[show]) for slot in ("early", "late") for show in festival.schedule_dict[date][slot]]
+        for date in festival.dates
+    ]
+    return [
+        (frozenset(), frozenset()),
+        (frozenset(), frozenset([day_ids[-1][0]])),
+        (frozenset([day_ids[0][0]]), frozenset([day_ids[-1][0]])),
+        (frozenset([day_ids[1][0], day_ids[1][-1]]), frozenset([day_ids[0][-1]])),
+        (frozenset(day_ids[2]), frozenset()),
+        (frozenset(event_ids[::3]), frozenset(event_ids[1::5])),
+        (frozenset(), frozenset()),
+    ]
+
+
+@pytest.mark.parametrize("day_model", DAY_MODELS)
+@pytest.mark.parametrize("scoring_name", SCORINGS)
+def test_incremental_edits_match_brute_force(festival, day_model, scoring_name):
+    scoring = SCORINGS[scoring_name]
+    optimizer = festival.optimizer(day_model, scoring)
+    
+    for events_seen, must_see in what_if_edits(festival):
+        expected = festival.brute_force(day_model, scoring, events_seen, must_see)
+        if expected is None:
+            with pytest.raises(ValueError):
+                optimizer.find_best_itinerary(events_seen=events_seen, must_see=must_see)
+            continue
+        
+        result = optimizer.find_best_itinerary(events_seen=events_seen, must_see=must_see)
+        festival.check(result, day_model, scoring, events_seen, must_see)
+        
+        fresh = festival.optimizer(day_model, scoring).find_best_itinerary(events_seen=events_seen, must_see=must_see)
+        assert result == fresh
+
+
+@pytest.mark.parametrize("day_model", DAY_MODELS)
+def test_incremental_top_k_matches_a_fresh_solve(festival, day_model):
+    optimizer = festival.optimizer(day_model)
+    
+    for events_seen, must_see in what_if_edits(festival):
+        ranked = optimizer.find_top_k_itineraries(5, events_seen, must_see)
+        fresh = festival.optimizer(day_model).find_top_k_itineraries(5, events_seen, must_see)
+        assert [score for score, _ in ranked] == [score for score, _ in fresh]
+        
+        if ranked:
+            festival.check(ranked[0], day_model, ScoringModel(), events_seen, must_see)
+
+
+@pytest.mark.parametrize("day_model", DAY_MODELS)
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_top_k_matches_exhaustive_search(day_model, seed):
+    festival = small_festival(seed)
+    optimizer = festival.optimizer(day_model)
+    
+    for events_seen, must_see in what_if_edits(festival):
+        ranked = optimizer.find_top_k_itineraries(8, events_seen, must_see)
+        
+        expected = festival.itinerary_scores(day_model, ScoringModel(), events_seen, must_see)[:8]
+        assert [score for score, _ in ranked] == pytest.approx(expected)
+        assert len({frozenset(itinerary) for _, itinerary in ranked}) == len(ranked)
+        for score, itinerary in ranked:
+            assert score == pytest.approx(festival.score(itinerary, ScoringModel()))
+
+
+def test_edits_reuse_the_rows_of_later_days(festival):
+    optimizer = festival.optimizer("slots")
+    optimizer.find_best_itinerary()
+    first_day = festival.schedule_dict[festival.dates[0]]
+    must_see = frozenset([int(festival.events.event_ids[first_day["early"] + first_day["late"]][0])])
+    
+    optimizer.stats.reset()
+    optimizer.find_best_itinerary(must_see=must_see)
+    
+    assert optimizer.stats.table_misses == 1
+    assert optimizer.stats.table_hits == len(festival.dates) - 1
+
+
+@pytest.mark.parametrize("day_model", DAY_MODELS)
+def test_clashing_must_see_events_raise(festival, day_model):
+    # Two shows at the same time on the same day can never both be attended
+    events = festival.events
+    starts = {}
+    for show in range(len(events)):
+        key = (events.date_codes[show], events.start_minutes[show])
+        starts.setdefault(key, []).append(int(events.event_ids[show]))
+    clashing = next(event_ids for event_ids in starts.values() if len(event_ids) > 1)
+    
+    with pytest.raises(ValueError):
+        festival.optimizer(day_model).find_best_itinerary(must_see=frozenset(clashing[:2]))
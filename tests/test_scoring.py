@@ -0,0 +1,61 @@
+"""Weighted scoring: every day model against exhaustive search."""
+
+import pandas as pd
+import pytest
+
+from conftest import DAY_MODELS, Festival
+from optimizer import ScoringModel
+
+WEIGHTED_SCORINGS = {
+    "votes": ScoringModel(
+        sub_category_weights={"Category 1 / Style 1": -3, "Category 2 / Style 2": 3},
+        venue_weights={"Stage 1": -2},
+        slot_weights={"late": 1}
+    ),
+    "fractional": ScoringModel(
+        points_per_new_category=2.5,
+        category_weights={"Category 3": 1.5},
+        slot_weights={"early": -1.25}
+    ),
+}
+
+
+@pytest.mark.parametrize("day_model", DAY_MODELS)
+@pytest.mark.parametrize("scoring_name", WEIGHTED_SCORINGS)
+def test_weighted_scoring_matches_brute_force(festival, day_model, scoring_name):
+    scoring = WEIGHTED_SCORINGS[scoring_name]
+    optimizer = festival.optimizer(day_model, scoring)
+    
+    festival.check(optimizer.find_best_itinerary(), day_model, scoring)
+
+
+@pytest.mark.parametrize("day_model", DAY_MODELS)
+def test_set_scoring_matches_a_fresh_optimizer(festival, day_model):
+    optimizer = festival.optimizer(day_model)
+    for scoring in list(WEIGHTED_SCORINGS.values()) + [ScoringModel()]:
+        optimizer.set_scoring(scoring)
+        festival.check(optimizer.find_best_itinerary(), day_model, scoring)
+
+
+@pytest.mark.parametrize("day_model", DAY_MODELS)
+def test_downvoted_show_is_dropped_under_every_day_model(day_model):
+    # Both shows fit in one evening, but the downvoted one costs more than it earns
+    festival = Festival(pd.DataFrame({
+        'Event_ID': [1, 2],
+        'Category': ["Music", "Music"],
+        'Sub_Category': ["Pop Rock", "Sufi"],
+        'Event_Name': ["Band - Early Set", "Singer - Late Set"],
+        'Venue': ["Main Stage, Venue 1", "Main Stage, Venue 1"],
+        'City': "Ahmedabad",
+        'Date': ["14-11-2025", "14-11-2025"],
+        'Time': ["18:00", "20:00"],
+        'Duration_Minutes': [60, 60],
+        'Description': "A test performance",
+    }))
+    scoring = ScoringModel(sub_category_weights={"Pop Rock": -3})
+    
+    score, itinerary = festival.optimizer(day_model, scoring).find_best_itinerary()
+    
+    assert score == 11
+    assert itinerary == [festival.event_index(2)]
+    assert festival.brute_force(day_model, scoring) == 11
@@ -0,0 +1,72 @@
+"""Bitmask DP and bottom-up table solvers against exhaustive search and the recursive solver."""
+
+import itertools
+import sys
+
+import pytest
+
+from benchmarks.synthetic import generate_festival
+from conftest import DAY_MODELS, Festival
+from optimizer import ScoringModel
+
+
+@pytest.mark.parametrize("day_model", DAY_MODELS)
+def test_bitmask_solver_matches_brute_force(festival, day_model):
+    optimizer = festival.optimizer(day_model)
+    
+    festival.check(optimizer.find_best_itinerary_by_mask(), day_model, ScoringModel())
+
+
+@pytest.mark.parametrize("day_model", DAY_MODELS)
+def test_categories_already_seen_earn_no_bonus(festival, day_model):
+    optimizer = festival.optimizer(day_model)
+    all_categories = frozenset(festival.events.categories)
+    
+    score, itinerary = optimizer.find_best_itinerary(categories_seen=all_categories)
+    
+    # Starting from the full mask only the performances count
+    assert score == len(itinerary)
+    assert score == festival.brute_force(day_model, ScoringModel(points_per_new_category=0))
+    assert optimizer.find_best_itinerary_by_mask(categories_mask=optimizer.index.num_masks - 1) == (score, itinerary)
+
+
+def recursive_reference(optimizer, day_index, categories_seen, memo):
+    """The original memoized recursive solver, on top of get_valid_combinations and calculate_score."""
+    if day_index >= len(optimizer.dates):
+        return 0, []
+    state = (day_index, categories_seen)
+    if state not in memo:
+        best_score, best_path = recursive_reference(optimizer, day_index + 1, categories_seen, memo)
+        for combination in optimizer.get_valid_combinations(optimizer.dates[day_index]):
+            if combination:
+                day_score, categories = optimizer.calculate_score(combination, categories_seen)
+                future_score, future_path = recursive_reference(optimizer, day_index + 1, categories, memo)
+                if day_score + future_score > best_score:
+                    best_score, best_path = day_score + future_score, combination + future_path
+        memo[state] = (best_score, best_path)
+    return memo[state]
+
+
+@pytest.mark.parametrize("day_model", DAY_MODELS)
+def test_table_solver_matches_the_recursive_solver_in_every_state(festival, day_model):
+    optimizer = festival.optimizer(day_model)
+    categories = festival.events.categories
+    memo = {}
+    
+    for day_index in range(len(festival.dates) + 1):
+        for size in range(len(categories) + 1):
+            for categories_seen in itertools.combinations(categories, size):
+                expected = recursive_reference(optimizer, day_index, frozenset(categories_seen), memo)
+                assert optimizer.find_best_itinerary(day_index, frozenset(categories_seen)) == expected
+
+
+def test_long_calendar_needs_no_recursion():
+    days = sys.getrecursionlimit() + 100
+    festival = Festival(generate_festival(num_days=days, num_venues=1, shows_per_slot=1, seed=3))
+    optimizer = festival.optimizer("slots")
+    
+    score, itinerary = optimizer.find_best_itinerary()
+    
+    # One show per slot and day: attending everything is optimal
+    assert itinerary == sorted(range(len(festival.events)))
+    assert score == festival.score(itinerary, ScoringModel())
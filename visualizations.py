@@ -4,22 +4,164 @@ Creates interactive graphs and network visualizations of performances.
 """
 
 import pandas as pd
-import networkx as nx
-import matplotlib.pyplot as plt
 import plotly.graph_objects as go
-import plotly.express as px
-from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, FrozenSet, Optional
 import streamlit as st
 import numpy as np
 
+from config import FIGURE_CACHE_SIZE, OVERVIEW_NODE_THRESHOLD, WEBGL_NODE_THRESHOLD
+from layout import edge_coordinates, hierarchical_layout, hub_and_spoke_layout
+
+# Node colors, repeated when there are more nodes than colors
+CATEGORY_COLORS = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+VENUE_COLORS = ['#FFE66D', '#95E1D3', '#F38181']
+
+# Network view -> grouping that splits each parent's performances into overview count bubbles
+OVERVIEW_GROUPS = {'hierarchy': 'date', 'category': 'venue', 'venue': 'date', 'date': 'venue'}
+
+
+def _scatter(num_points: int, **kwargs):
+    """
+    Scatter trace that switches to WebGL (go.Scattergl) above WEBGL_NODE_THRESHOLD points.
+    
+    WebGL traces drop the per-point text labels, which are slow to draw in bulk;
+    hover text is kept.
+    """
+    if num_points <= WEBGL_NODE_THRESHOLD:
+        return go.Scatter(**kwargs)
+    kwargs['mode'] = kwargs['mode'].replace('+text', '')
+    return go.Scattergl(**kwargs)
+
+
+def _join_edges(*edges: Tuple[np.ndarray, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate (x, y) edge coordinate arrays into one trace's coordinates."""
+    return np.concatenate([x for x, _ in edges]), np.concatenate([y for _, y in edges])
+
+
+def _padded_range(values: np.ndarray) -> List[float]:
+    """Axis range around values with a 10% margin (at least 0.05)."""
+    low, high = float(np.min(values)), float(np.max(values))
+    margin = max(0.1 * (high - low), 0.05)
+    return [low - margin, high + margin]
+
+
+class FestivalGraph:
+    """
+    Multi-typed festival graph shared by all network views.
+    
+    Node types are categories, main venues, dates, category venues (one per
+    category and main venue that has a show of that category) and performances.
+    Every node type is an array of labels, and every performance stores the code
+    (array index) of the category, venue, date and category venue it belongs to,
+    so edges are implicit. Each network view is a projection: the hierarchy is
+    category → category venue → performance, and the hub networks connect each
+    category, venue or date to its performances.
+    
+    Build it once per dataset and share it; node positions per view are kept in
+    layouts, so they are computed once however the views are styled.
+    """
+    
+    def __init__(self, df: pd.DataFrame):
+        """
+        Build the graph from the performance columns.
+        
+        Args:
+            df: DataFrame with performance data (Main_Venue is derived from Venue if missing)
+        """
+        main_venues = df['Main_Venue'] if 'Main_Venue' in df.columns else df['Venue'].str.split(',').str[0]
+        
+        self.event_ids = df['Event_ID'].to_numpy()
+        self.category_codes, categories = pd.factorize(df['Category'])
+        self.venue_codes, venues = pd.factorize(main_venues)
+        self.date_codes, dates = pd.factorize(df['Date'])
+        self.categories = np.asarray(categories)
+        self.venues = np.asarray(venues)
+        self.dates = np.asarray(dates)
+        self.date_labels = pd.to_datetime(pd.Series(dates)).dt.strftime('%b %d').to_numpy()
+        
+        # Category venues, ordered by category and then by first appearance
+        pairs = pd.DataFrame({'category': self.category_codes, 'venue': self.venue_codes}).drop_duplicates()
+        pairs = pairs.sort_values('category', kind='stable')
+        self.category_venue_categories = pairs['category'].to_numpy()
+        self.category_venue_venues = pairs['venue'].to_numpy()
+        
+        pair_lookup = np.full(len(self.categories) * len(self.venues), -1, dtype=np.int64)
+        pair_lookup[self.category_venue_categories * len(self.venues) + self.category_venue_venues] = np.arange(len(pairs))
+        self.category_venue_codes = pair_lookup[self.category_codes * len(self.venues) + self.venue_codes]
+        
+        # Node positions per view, filled by PerformanceVisualizer
+        self.layouts = {}
+    
+    def __len__(self) -> int:
+        return len(self.event_ids)
+    
+    def hub_codes(self, hub_type: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Hub of every performance in a hub-and-spoke projection.
+        
+        Args:
+            hub_type: 'category', 'venue' or 'date'
+            
+        Returns:
+            Tuple of (hub code of each performance, hub labels)
+        """
+        if hub_type == 'category':
+            return self.category_codes, self.categories
+        if hub_type == 'venue':
+            return self.venue_codes, self.venues
+        return self.date_codes, self.date_labels
+    
+    def leaf_parents(self, view: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Node every performance hangs from in a network view.
+        
+        Args:
+            view: 'hierarchy' (category venues) or a hub type ('category', 'venue' or 'date')
+            
+        Returns:
+            Tuple of (parent code of each performance, parent labels)
+        """
+        if view == 'hierarchy':
+            labels = np.char.add(
+                np.char.add(self.categories[self.category_venue_categories].astype(str), ' · '),
+                self.venues[self.category_venue_venues].astype(str)
+            )
+            return self.category_venue_codes, labels
+        return self.hub_codes(view)
+    
+    def group_counts(self, parent_codes: np.ndarray, group_type: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Count the performances of every (parent, group) pair, e.g. per venue and date.
+        
+        Args:
+            parent_codes: Parent code of every performance (see leaf_parents)
+            group_type: 'category', 'venue' or 'date'
+            
+        Returns:
+            Tuple of (parent code, group code, performance count) of every non-empty
+            pair, ordered by parent and then group
+        """
+        group_codes, groups = self.hub_codes(group_type)
+        pairs, counts = np.unique(parent_codes * len(groups) + group_codes, return_counts=True)
+        return pairs // len(groups), pairs % len(groups), counts
+    
+    def itinerary_mask(self, event_ids: FrozenSet) -> np.ndarray:
+        """Boolean array marking the performances whose event_id is in event_ids."""
+        return np.isin(self.event_ids, list(event_ids))
+
 
 class PerformanceVisualizer:
     """
     Visualizes festival performances as interactive network graphs.
     """
     
-    def __init__(self, df: pd.DataFrame, schedule_dict: Dict, itinerary: List[Dict] = None):
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        schedule_dict: Dict,
+        itinerary: List[Dict] = None,
+        graph: Optional[FestivalGraph] = None
+    ):
         """
         Initialize visualizer with performance data.
         
@@ -27,272 +169,256 @@ class PerformanceVisualizer:
             df: DataFrame with performance data
             schedule_dict: Day-organized performance schedule
             itinerary: Optional list of performances in the generated itinerary
+            graph: FestivalGraph of df to reuse (built on first use if not given)
         """
         self.df = df
         self.schedule_dict = schedule_dict
-        self.graph = None
+        self.graph = graph
         self.itinerary = itinerary or []
         # Create a set of event_ids in the itinerary for faster lookup
         self.itinerary_event_ids = frozenset(perf.get('event_id') for perf in self.itinerary)
     
-    def _compute_hierarchical_layout(self, G: nx.DiGraph, levels: int = 3) -> Dict:
+    def _festival_graph(self) -> FestivalGraph:
+        """The shared FestivalGraph, built on first use unless one was passed in."""
+        if self.graph is None:
+            self.graph = FestivalGraph(self.df)
+        return self.graph
+    
+    def _hierarchy_view(self) -> Dict:
         """
-        Compute hierarchical/layered layout for a directed graph.
-        Places nodes in horizontal layers to avoid tangling.
+        Positions of the Categories → Venues → Performances projection.
+        
+        Computed once per FestivalGraph and kept in its layouts.
         
-        Args:
-            G: Directed graph
-            levels: Number of hierarchical levels
-            
         Returns:
-            Dictionary mapping node names to (x, y) positions
+            Dictionary with the category, venue and performance positions and the
+            coordinates of the category → venue edges
         """
-        pos = {}
-        
-        # Assign nodes to levels based on their type
-        level_nodes = {0: [], 1: [], 2: []}
-        for node in G.nodes():
-            node_type = G.nodes[node].get('node_type', 'performance')
-            if node_type == 'category':
-                level_nodes[0].append(node)
-            elif node_type == 'venue':
-                level_nodes[1].append(node)
-            else:  # performance
-                level_nodes[2].append(node)
-        
-        # Position nodes in each level
-        y_positions = {0: 1.0, 1: 0.5, 2: 0.0}
-        
-        for level, nodes in level_nodes.items():
-            y = y_positions[level]
-            # Spread nodes horizontally
-            num_nodes = len(nodes)
-            if num_nodes == 1:
-                x_positions = [0.5]
-            else:
-                x_positions = [i / (num_nodes - 1) for i in range(num_nodes)]
+        graph = self._festival_graph()
+        if 'hierarchy' not in graph.layouts:
+            num_category_venues = len(graph.category_venue_categories)
+            layout = hierarchical_layout(len(graph.categories), num_category_venues, graph.category_venue_codes)
+            category_x, category_y = layout['category']
+            venue_x, venue_y = layout['venue']
+            venue_categories = graph.category_venue_categories
             
-            # Add some grouping for performances under venues using a sugiyama-like approach
-            if level == 2:  # Performance level
-                # Group performances by their parent venue
-                pos = self._layout_performances_by_venue(G, pos, nodes)
-            else:
-                for node, x_pos in zip(nodes, x_positions):
-                    pos[node] = (x_pos, y)
+            graph.layouts['hierarchy'] = {
+                'category_pos': (category_x, category_y),
+                'venue_pos': (venue_x, venue_y),
+                'perf_pos': layout['performance'],
+                'venue_edges': edge_coordinates(
+                    category_x[venue_categories], category_y[venue_categories], venue_x, venue_y
+                ),
+            }
         
-        return pos
+        return graph.layouts['hierarchy']
     
-    def _layout_performances_by_venue(self, G: nx.DiGraph, pos: Dict, perf_nodes: List) -> Dict:
+    def _hub_view(self, hub_type: str) -> Dict:
         """
-        Layout performance nodes grouped under their parent venues.
-        Creates organized columns for each venue.
+        Positions of a hub-and-spoke projection: one hub per category, venue or date,
+        connected to its performances.
+        
+        Computed once per FestivalGraph and hub type and kept in its layouts.
         
         Args:
-            G: Directed graph
-            pos: Existing position dictionary
-            perf_nodes: List of performance nodes to position
+            hub_type: 'category', 'venue' or 'date'
             
         Returns:
-            Updated position dictionary
+            Dictionary with the hub labels and the hub and leaf positions
         """
-        # Group performances by their parent venue
-        venue_groups = defaultdict(list)
-        for perf_node in perf_nodes:
-            # Find parent venue
-            for pred in G.predecessors(perf_node):
-                if G.nodes[pred].get('node_type') == 'venue':
-                    venue_groups[pred].append(perf_node)
-                    break
-        
-        # Position each group in a column
-        venues_list = list(venue_groups.keys())
-        num_venues = len(venues_list)
-        
-        y_base = 0.0
-        for venue_idx, venue in enumerate(venues_list):
-            # X position based on parent venue's x position
-            if venue in pos:
-                parent_x = pos[venue][0]
-            else:
-                parent_x = venue_idx / max(num_venues - 1, 1)
+        graph = self._festival_graph()
+        if hub_type not in graph.layouts:
+            hub_codes, hubs = graph.hub_codes(hub_type)
+            layout = hub_and_spoke_layout(hub_codes, len(hubs))
             
-            # Y spacing for performances under each venue
-            perfs = venue_groups[venue]
-            num_perfs = len(perfs)
-            
-            for perf_idx, perf in enumerate(perfs):
-                # Slight horizontal jitter to avoid complete overlap
-                x = parent_x + (perf_idx - num_perfs / 2) * 0.02
-                y = y_base - (perf_idx + 1) * 0.1
-                pos[perf] = (x, y)
+            graph.layouts[hub_type] = {
+                'hubs': hubs,
+                'hub_pos': layout['hub'],
+                'leaf_pos': layout['leaf'],
+            }
         
-        return pos
+        return graph.layouts[hub_type]
     
-    def _compute_hub_and_spoke_layout(self, G: nx.DiGraph, hub_type: str) -> Dict:
+    def _view_positions(self, view: str) -> Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+        """(parent node positions, performance positions) of a network view ('hierarchy' or a hub type)."""
+        if view == 'hierarchy':
+            hierarchy = self._hierarchy_view()
+            return hierarchy['venue_pos'], hierarchy['perf_pos']
+        network = self._hub_view(view)
+        return network['hub_pos'], network['leaf_pos']
+    
+    def _overview_view(self, view: str) -> Dict:
         """
-        Compute hub-and-spoke layout where hub nodes are arranged in a circle
-        and leaf nodes radiate outward.
+        Count bubbles that stand in for the performances of a network view at overview level.
+        
+        Each parent node's performances are grouped by OVERVIEW_GROUPS[view] (e.g. one
+        bubble per category venue and date in the hierarchy), and the bubbles are laid
+        out like performances. Computed once per FestivalGraph and view and kept in
+        its layouts.
         
         Args:
-            G: Directed graph
-            hub_type: Type of hub nodes ('category', 'venue', 'date')
+            view: 'hierarchy' or a hub type
             
         Returns:
-            Dictionary mapping node names to (x, y) positions
+            Dictionary with the parent code, performance count, hover label and
+            position of every bubble
         """
-        pos = {}
-        
-        # Separate hub and leaf nodes
-        hub_nodes = []
-        leaf_nodes = defaultdict(list)
-        
-        for node in G.nodes():
-            node_type = G.nodes[node].get('node_type', 'performance')
-            if node_type == hub_type:
-                hub_nodes.append(node)
+        graph = self._festival_graph()
+        key = (view, 'overview')
+        if key not in graph.layouts:
+            parent_codes, parent_labels = graph.leaf_parents(view)
+            group_type = OVERVIEW_GROUPS[view]
+            _, group_labels = graph.hub_codes(group_type)
+            parents, groups, counts = graph.group_counts(parent_codes, group_type)
+            
+            if view == 'hierarchy':
+                positions = hierarchical_layout(len(graph.categories), len(parent_labels), parents)['performance']
             else:
-                # Find parent hub
-                for pred in G.predecessors(node):
-                    if G.nodes[pred].get('node_type') == hub_type:
-                        leaf_nodes[pred].append(node)
-                        break
-        
-        # Position hub nodes in a circle
-        num_hubs = len(hub_nodes)
-        hub_radius = 0.3
-        
-        for i, hub in enumerate(hub_nodes):
-            angle = 2 * 3.14159 * i / max(num_hubs, 1)
-            x = 0.5 + hub_radius * np.cos(angle)
-            y = 0.5 + hub_radius * np.sin(angle)
-            pos[hub] = (x, y)
-        
-        # Position leaf nodes radiating from their hub
-        for hub, leaves in leaf_nodes.items():
-            hub_x, hub_y = pos[hub]
-            num_leaves = len(leaves)
-            leaf_radius = 0.15
+                positions = hub_and_spoke_layout(parents, len(parent_labels))['leaf']
             
-            for j, leaf in enumerate(leaves):
-                angle = 2 * 3.14159 * j / max(num_leaves, 1)
-                # Radiate outward from hub
-                leaf_x = hub_x + leaf_radius * np.cos(angle)
-                leaf_y = hub_y + leaf_radius * np.sin(angle)
-                pos[leaf] = (leaf_x, leaf_y)
-        
-        return pos
+            graph.layouts[key] = {
+                'parents': parents,
+                'counts': counts,
+                'labels': np.array([
+                    f"<b>{parent_labels[parent]}</b><br>{group_labels[group]}: {count} performances"
+                    for parent, group, count in zip(parents, groups, counts)
+                ]),
+                'pos': positions,
+            }
+        
+        return graph.layouts[key]
     
-    def create_hierarchical_network(self) -> go.Figure:
+    def _leaf_level(
+        self,
+        view: str,
+        overview: bool,
+        drill_down: Optional[int] = None,
+        always_show: Optional[np.ndarray] = None
+    ) -> Dict:
         """
-        Create hierarchical network: Categories → Venues → Performances
+        What to draw below the parent nodes of a network view at a level of detail.
+        
+        In full detail every performance is drawn. In overview, performances are
+        replaced by the count bubbles of _overview_view, except those of the
+        drill_down parent (drawn individually and zoomed to) and those in always_show.
         
+        Args:
+            view: 'hierarchy' or a hub type
+            overview: Aggregate performances into count bubbles
+            drill_down: Parent code whose performances are drawn individually in overview
+            always_show: Boolean mask of performances drawn individually in overview
+            
         Returns:
-            Interactive Plotly figure with full hierarchy
+            Dictionary with 'shown' (mask of the performances drawn individually),
+            'edges' (coordinates of the edges to them, in performance order),
+            'bubbles' (counts, labels, positions and edges of the bubbles to draw, or
+            None) and 'focus' (x and y axis ranges of the drill-down, or None)
         """
-        # Create directed graph
-        G = nx.DiGraph()
-        
-        # Extract main venues
-        self.df['Main_Venue'] = self.df['Venue'].str.split(',').str[0]
-        
-        # Level 1: Add category nodes (ROOT)
-        categories = self.df['Category'].unique()
-        for category in categories:
-            G.add_node(f"CAT_{category}", node_type='category', label=category, size=50)
-        
-        # Level 2: Add venue nodes as sub-parents under categories
-        for category in categories:
-            venues_in_category = self.df[self.df['Category'] == category]['Main_Venue'].unique()
-            for venue in venues_in_category:
-                venue_key = f"VEN_{venue}_{category}"
-                G.add_node(venue_key, node_type='venue', label=venue, size=35)
-                # Connect venue to its category
-                G.add_edge(f"CAT_{category}", venue_key)
-        
-        # Level 3: Add performance nodes (LEAF)
-        for idx, row in self.df.iterrows():
-            perf_key = f"PERF_{row['Event_ID']}"
-            perf_label = f"{row['Event_Name'][:15]}...\n{row['Time']}"
-            G.add_node(
-                perf_key, 
-                node_type='performance', 
-                label=perf_label,
-                size=12,
-                category=row['Category'],
-                venue=row['Main_Venue']
+        graph = self._festival_graph()
+        parent_codes, _ = graph.leaf_parents(view)
+        (parent_x, parent_y), (perf_x, perf_y) = self._view_positions(view)
+        
+        if not overview:
+            shown = np.ones(len(graph), dtype=bool)
+        elif drill_down is None:
+            shown = np.zeros(len(graph), dtype=bool)
+        else:
+            shown = parent_codes == drill_down
+        if overview and always_show is not None:
+            shown |= always_show
+        
+        shown_parents = parent_codes[shown]
+        level = {
+            'shown': shown,
+            'edges': edge_coordinates(parent_x[shown_parents], parent_y[shown_parents], perf_x[shown], perf_y[shown]),
+            'bubbles': None,
+            'focus': None,
+        }
+        if not overview:
+            return level
+        
+        bubbles = self._overview_view(view)
+        keep = bubbles['parents'] != drill_down if drill_down is not None else slice(None)
+        bubble_parents = bubbles['parents'][keep]
+        bubble_x, bubble_y = bubbles['pos'][0][keep], bubbles['pos'][1][keep]
+        level['bubbles'] = {
+            'counts': bubbles['counts'][keep],
+            'labels': bubbles['labels'][keep],
+            'pos': (bubble_x, bubble_y),
+            'edges': edge_coordinates(parent_x[bubble_parents], parent_y[bubble_parents], bubble_x, bubble_y),
+        }
+        
+        if drill_down is not None:
+            drilled = parent_codes == drill_down
+            level['focus'] = (
+                _padded_range(np.append(perf_x[drilled], parent_x[drill_down])),
+                _padded_range(np.append(perf_y[drilled], parent_y[drill_down]))
             )
-            
-            # Connect performance to its venue
-            venue_key = f"VEN_{row['Main_Venue']}_{row['Category']}"
-            G.add_edge(venue_key, perf_key)
-        
-        # Use proper hierarchical layout
-        pos = self._compute_hierarchical_layout(G)
-        
-        # Extract edges
-        edge_x = []
-        edge_y = []
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
-        
-        edge_trace = go.Scatter(
-            x=edge_x, y=edge_y,
-            mode='lines',
-            line=dict(width=1, color='#aaa'),
-            hoverinfo='none',
-            showlegend=False
-        )
-        
-        # Extract node data by type
-        category_x, category_y, category_text, category_hover = [], [], [], []
-        venue_x, venue_y, venue_text, venue_hover = [], [], [], []
-        perf_x, perf_y, perf_text, perf_hover = [], [], [], []
         
-        # Color mapping for categories
-        color_map = {'Music': '#FF6B6B', 'Dance': '#4ECDC4', 'Theater': '#45B7D1'}
-        
-        for node in G.nodes():
-            x, y = pos[node]
-            node_data = G.nodes[node]
-            node_type = node_data['node_type']
-            label = node_data['label']
-            
-            if node_type == 'category':
-                category_x.append(x)
-                category_y.append(y)
-                category_text.append(label)
-                perf_count = len(self.df[self.df['Category'] == label])
-                category_hover.append(f"<b>{label}</b><br>Performances: {perf_count}")
-                
-            elif node_type == 'venue':
-                venue_x.append(x)
-                venue_y.append(y)
-                venue_text.append(label.split(',')[0] if ',' in label else label)
-                category = label.split('_')[-1] if '_' in label else 'Mixed'
-                perf_count = len(self.df[self.df['Main_Venue'] == label.replace(f'_{category}', '')])
-                venue_hover.append(f"<b>{label}</b><br>Performances: {perf_count}")
-                
-            elif node_type == 'performance':
-                perf_x.append(x)
-                perf_y.append(y)
-                perf_text.append('•')  # Bullet point annotation
-                perf_hover.append(label)
+        return level
+    
+    @staticmethod
+    def _level_edges(level: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """Edges to the performances and bubbles of a level, as one trace's coordinates."""
+        if level['bubbles'] is None:
+            return level['edges']
+        return _join_edges(level['edges'], level['bubbles']['edges'])
+    
+    @staticmethod
+    def _bubble_traces(level: Dict, color: str) -> List:
+        """Count bubble trace of an overview level (none in full detail); marker area grows with the count."""
+        bubbles = level['bubbles']
+        if bubbles is None:
+            return []
+        
+        bubble_x, bubble_y = bubbles['pos']
+        counts = bubbles['counts']
+        return [_scatter(
+            len(counts),
+            x=bubble_x, y=bubble_y,
+            mode='markers',
+            hovertext=bubbles['labels'],
+            hoverinfo='text',
+            marker=dict(
+                size=6 + 24 * np.sqrt(counts / counts.max(initial=1)),
+                color=color,
+                opacity=0.8,
+                line=dict(width=1, color='white')
+            ),
+            name='Performance counts'
+        )]
+    
+    @staticmethod
+    def _apply_focus(fig: go.Figure, level: Dict) -> None:
+        """Zoom the figure to the drilled-down performances of a level, if any."""
+        if level['focus'] is not None:
+            x_range, y_range = level['focus']
+            fig.update_xaxes(range=x_range)
+            fig.update_yaxes(range=y_range)
+    
+    def _hierarchy_traces(self) -> Tuple[go.Scatter, go.Scatter]:
+        """Category and venue node traces of the hierarchy, shared by its plain and highlighted views."""
+        graph = self._festival_graph()
+        hierarchy = self._hierarchy_view()
+        category_x, category_y = hierarchy['category_pos']
+        venue_x, venue_y = hierarchy['venue_pos']
+        venue_labels = graph.venues[graph.category_venue_venues]
         
         # Category nodes (TOP LEVEL - largest)
         category_trace = go.Scatter(
             x=category_x, y=category_y,
             mode='markers+text',
-            text=category_text,
+            text=graph.categories,
             textposition='middle center',
             textfont=dict(size=12, color='white', family='Arial Black'),
-            hovertext=category_hover,
+            hovertext=[
+                f"<b>{label}</b><br>Performances: {count}"
+                for label, count in zip(graph.categories, np.bincount(graph.category_codes))
+            ],
             hoverinfo='text',
             marker=dict(
                 size=55,
-                color=['#FF6B6B', '#4ECDC4', '#45B7D1'],
+                color=np.resize(CATEGORY_COLORS, len(category_x)),
                 line=dict(width=3, color='white'),
                 symbol='circle'
             ),
@@ -303,28 +429,62 @@ class PerformanceVisualizer:
         venue_trace = go.Scatter(
             x=venue_x, y=venue_y,
             mode='markers+text',
-            text=venue_text,
+            text=venue_labels,
             textposition='middle center',
             textfont=dict(size=9, color='white'),
-            hovertext=venue_hover,
+            hovertext=[
+                f"<b>{label}</b><br>Performances: {count}"
+                for label, count in zip(venue_labels, np.bincount(graph.category_venue_codes))
+            ],
             hoverinfo='text',
             marker=dict(
                 size=35,
-                color=['#FFE66D', '#95E1D3', '#F38181'] * len(venue_x),
+                color=np.resize(VENUE_COLORS, len(venue_x)),
                 line=dict(width=2, color='white'),
                 symbol='diamond'
             ),
             name='Venues'
         )
         
+        return category_trace, venue_trace
+    
+    def create_hierarchical_network(self, overview: bool = False, drill_down: Optional[int] = None) -> go.Figure:
+        """
+        Create hierarchical network: Categories → Venues → Performances
+        
+        Args:
+            overview: Show count bubbles (per venue and date) instead of individual performances
+            drill_down: Category venue code whose performances are shown individually in overview
+            
+        Returns:
+            Interactive Plotly figure with full hierarchy
+        """
+        hierarchy = self._hierarchy_view()
+        perf_x, perf_y = hierarchy['perf_pos']
+        level = self._leaf_level('hierarchy', overview, drill_down)
+        shown = level['shown']
+        edge_x, edge_y = _join_edges(hierarchy['venue_edges'], self._level_edges(level))
+        
+        edge_trace = _scatter(
+            len(edge_x) // 3,
+            x=edge_x, y=edge_y,
+            mode='lines',
+            line=dict(width=1, color='#aaa'),
+            hoverinfo='none',
+            showlegend=False
+        )
+        
+        category_trace, venue_trace = self._hierarchy_traces()
+        
         # Performance nodes (LEAF LEVEL - small)
-        perf_trace = go.Scatter(
-            x=perf_x, y=perf_y,
+        perf_trace = _scatter(
+            shown.sum(),
+            x=perf_x[shown], y=perf_y[shown],
             mode='markers+text',
-            text=perf_text,
+            text=np.full(shown.sum(), '•'),  # Bullet point annotation
             textposition='middle center',
             textfont=dict(size=8, color='white', family='Arial'),
-            hovertext=perf_hover,
+            hovertext=(self.df['Event_Name'].str[:15] + '...\n' + self.df['Time']).to_numpy()[shown],
             hoverinfo='text',
             marker=dict(
                 size=10,
@@ -336,7 +496,7 @@ class PerformanceVisualizer:
         )
         
         # Create figure
-        fig = go.Figure(data=[edge_trace, category_trace, venue_trace, perf_trace])
+        fig = go.Figure(data=[edge_trace, *self._bubble_traces(level, '#B19CD9'), category_trace, venue_trace, perf_trace])
         
         fig.update_layout(
             title={
@@ -363,91 +523,58 @@ class PerformanceVisualizer:
             ]
         )
         
+        self._apply_focus(fig, level)
+        
         return fig
 
-    def create_category_network(self) -> go.Figure:
+    def create_category_network(self, overview: bool = False, drill_down: Optional[int] = None) -> go.Figure:
         """
         Create network showing performances connected by categories.
 
+        Args:
+            overview: Show count bubbles (per category and venue) instead of individual performances
+            drill_down: Category code whose performances are shown individually in overview
+            
         Returns:
             Interactive Plotly figure
         """
-        # Create directed graph
-        G = nx.DiGraph()
-
-        # Add nodes for categories
-        categories = self.df['Category'].unique()
-        for category in categories:
-            G.add_node(category, node_type='category', size=40)
-
-        # Add nodes for performances and edges
-        for idx, row in self.df.iterrows():
-            perf_label = f"{row['Event_Name'][:20]}...\n({row['Time']})"
-            G.add_node(perf_label, node_type='performance', size=20)
-
-            # Connect performance to its category
-            G.add_edge(row['Category'], perf_label)
-
-        # Calculate layout - use hierarchical for clarity
-        pos = self._compute_hub_and_spoke_layout(G, 'category')
-
-        # Extract edge traces
-        edge_x = []
-        edge_y = []
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
-
-        edge_trace = go.Scatter(
+        network = self._hub_view('category')
+        category_x, category_y = network['hub_pos']
+        perf_x, perf_y = network['leaf_pos']
+        level = self._leaf_level('category', overview, drill_down)
+        shown = level['shown']
+        edge_x, edge_y = self._level_edges(level)
+        
+        edge_trace = _scatter(
+            len(edge_x) // 3,
             x=edge_x, y=edge_y,
             mode='lines',
             line=dict(width=0.5, color='#888'),
             hoverinfo='none',
             showlegend=False
         )
-
-        # Extract node traces (separate for categories and performances)
-        category_x = []
-        category_y = []
-        category_text = []
-
-        perf_x = []
-        perf_y = []
-        perf_text = []
-
-        for node in G.nodes():
-            x, y = pos[node]
-            if G.nodes[node]['node_type'] == 'category':
-                category_x.append(x)
-                category_y.append(y)
-                category_text.append(node)
-            else:
-                perf_x.append(x)
-                perf_y.append(y)
-                perf_text.append(node)
-
+        
         # Category nodes
         category_trace = go.Scatter(
             x=category_x, y=category_y,
             mode='markers+text',
-            text=category_text,
+            text=network['hubs'],
             textposition='top center',
             hoverinfo='text',
             marker=dict(
                 size=30,
-                color=['#FF6B6B', '#4ECDC4', '#45B7D1'],
+                color=np.resize(CATEGORY_COLORS, len(category_x)),
                 line=dict(width=2, color='white')
             ),
             name='Categories'
         )
-
+        
         # Performance nodes
-        perf_trace = go.Scatter(
-            x=perf_x, y=perf_y,
+        perf_trace = _scatter(
+            shown.sum(),
+            x=perf_x[shown], y=perf_y[shown],
             mode='markers',
-            text=perf_text,
+            text=(self.df['Event_Name'].str[:20] + '...\n(' + self.df['Time'] + ')').to_numpy()[shown],
             hoverinfo='text',
             marker=dict(
                 size=10,
@@ -456,9 +583,9 @@ class PerformanceVisualizer:
             ),
             name='Performances'
         )
-
+        
         # Create figure
-        fig = go.Figure(data=[edge_trace, category_trace, perf_trace])
+        fig = go.Figure(data=[edge_trace, *self._bubble_traces(level, '#95E1D3'), category_trace, perf_trace])
 
         fig.update_layout(
             title='Festival Performances Network - By Category',
@@ -472,47 +599,30 @@ class PerformanceVisualizer:
             height=700
         )
 
+        self._apply_focus(fig, level)
+
         return fig
 
-    def create_venue_network(self) -> go.Figure:
+    def create_venue_network(self, overview: bool = False, drill_down: Optional[int] = None) -> go.Figure:
         """
         Create network showing performances connected by venues.
         
+        Args:
+            overview: Show count bubbles (per venue and date) instead of individual performances
+            drill_down: Venue code whose performances are shown individually in overview
+            
         Returns:
             Interactive Plotly figure
         """
-        # Create graph
-        G = nx.DiGraph()
-        
-        # Add venue nodes
-        venues = self.df['Venue'].unique()
-        for venue in venues:
-            # Extract main venue
-            main_venue = venue.split(',')[0]
-            G.add_node(main_venue, node_type='venue', size=40)
-        
-        # Add performance nodes
-        for idx, row in self.df.iterrows():
-            perf_label = f"{row['Event_Name'][:15]}...\n{row['Category']}"
-            G.add_node(perf_label, node_type='performance', size=15)
-            
-            # Connect to venue
-            main_venue = row['Venue'].split(',')[0]
-            G.add_edge(main_venue, perf_label)
-        
-        # Calculate layout - use hub and spoke for clarity
-        pos = self._compute_hub_and_spoke_layout(G, 'venue')
-        
-        # Extract edges
-        edge_x = []
-        edge_y = []
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
-        
-        edge_trace = go.Scatter(
+        network = self._hub_view('venue')
+        venue_x, venue_y = network['hub_pos']
+        perf_x, perf_y = network['leaf_pos']
+        level = self._leaf_level('venue', overview, drill_down)
+        shown = level['shown']
+        edge_x, edge_y = self._level_edges(level)
+        
+        edge_trace = _scatter(
+            len(edge_x) // 3,
             x=edge_x, y=edge_y,
             mode='lines',
             line=dict(width=0.5, color='#888'),
@@ -520,41 +630,27 @@ class PerformanceVisualizer:
             showlegend=False
         )
         
-        # Extract venue and performance nodes
-        venue_x, venue_y, venue_text = [], [], []
-        perf_x, perf_y, perf_text = [], [], []
-        
-        for node in G.nodes():
-            x, y = pos[node]
-            if G.nodes[node]['node_type'] == 'venue':
-                venue_x.append(x)
-                venue_y.append(y)
-                venue_text.append(node)
-            else:
-                perf_x.append(x)
-                perf_y.append(y)
-                perf_text.append(node)
-        
         # Venue nodes
         venue_trace = go.Scatter(
             x=venue_x, y=venue_y,
             mode='markers+text',
-            text=venue_text,
+            text=network['hubs'],
             textposition='top center',
             hoverinfo='text',
             marker=dict(
                 size=35,
-                color=['#FFE66D', '#95E1D3', '#F38181'],
+                color=np.resize(VENUE_COLORS, len(venue_x)),
                 line=dict(width=2, color='white')
             ),
             name='Venues'
         )
         
         # Performance nodes
-        perf_trace = go.Scatter(
-            x=perf_x, y=perf_y,
+        perf_trace = _scatter(
+            shown.sum(),
+            x=perf_x[shown], y=perf_y[shown],
             mode='markers',
-            text=perf_text,
+            text=(self.df['Event_Name'].str[:15] + '...\n' + self.df['Category']).to_numpy()[shown],
             hoverinfo='text',
             marker=dict(
                 size=8,
@@ -564,7 +660,7 @@ class PerformanceVisualizer:
             name='Performances'
         )
         
-        fig = go.Figure(data=[edge_trace, venue_trace, perf_trace])
+        fig = go.Figure(data=[edge_trace, *self._bubble_traces(level, '#C7CEEA'), venue_trace, perf_trace])
         
         fig.update_layout(
             title='Festival Performances Network - By Venue',
@@ -578,46 +674,30 @@ class PerformanceVisualizer:
             height=700
         )
         
+        self._apply_focus(fig, level)
+        
         return fig
     
-    def create_date_network(self) -> go.Figure:
+    def create_date_network(self, overview: bool = False, drill_down: Optional[int] = None) -> go.Figure:
         """
         Create network showing performances connected by dates.
         
+        Args:
+            overview: Show count bubbles (per date and venue) instead of individual performances
+            drill_down: Date code whose performances are shown individually in overview
+            
         Returns:
             Interactive Plotly figure
         """
-        # Create graph
-        G = nx.DiGraph()
-        
-        # Add date nodes
-        dates = self.df['Date'].unique()
-        for date in dates:
-            date_str = pd.to_datetime(date).strftime('%b %d')
-            G.add_node(date_str, node_type='date', size=40)
-        
-        # Add performance nodes
-        for idx, row in self.df.iterrows():
-            perf_label = f"{row['Event_Name'][:12]}...\n{row['Time']}"
-            G.add_node(perf_label, node_type='performance', size=15)
-            
-            # Connect to date
-            date_str = pd.to_datetime(row['Date']).strftime('%b %d')
-            G.add_edge(date_str, perf_label)
-        
-        # Calculate layout - use hub and spoke for clarity
-        pos = self._compute_hub_and_spoke_layout(G, 'date')
-        
-        # Extract edges
-        edge_x = []
-        edge_y = []
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
-        
-        edge_trace = go.Scatter(
+        network = self._hub_view('date')
+        date_x, date_y = network['hub_pos']
+        perf_x, perf_y = network['leaf_pos']
+        level = self._leaf_level('date', overview, drill_down)
+        shown = level['shown']
+        edge_x, edge_y = self._level_edges(level)
+        
+        edge_trace = _scatter(
+            len(edge_x) // 3,
             x=edge_x, y=edge_y,
             mode='lines',
             line=dict(width=0.5, color='#888'),
@@ -625,26 +705,11 @@ class PerformanceVisualizer:
             showlegend=False
         )
         
-        # Extract date and performance nodes
-        date_x, date_y, date_text = [], [], []
-        perf_x, perf_y, perf_text = [], [], []
-        
-        for node in G.nodes():
-            x, y = pos[node]
-            if G.nodes[node]['node_type'] == 'date':
-                date_x.append(x)
-                date_y.append(y)
-                date_text.append(node)
-            else:
-                perf_x.append(x)
-                perf_y.append(y)
-                perf_text.append(node)
-        
         # Date nodes
         date_trace = go.Scatter(
             x=date_x, y=date_y,
             mode='markers+text',
-            text=date_text,
+            text=network['hubs'],
             textposition='top center',
             hoverinfo='text',
             marker=dict(
@@ -656,10 +721,11 @@ class PerformanceVisualizer:
         )
         
         # Performance nodes
-        perf_trace = go.Scatter(
-            x=perf_x, y=perf_y,
+        perf_trace = _scatter(
+            shown.sum(),
+            x=perf_x[shown], y=perf_y[shown],
             mode='markers',
-            text=perf_text,
+            text=(self.df['Event_Name'].str[:12] + '...\n' + self.df['Time']).to_numpy()[shown],
             hoverinfo='text',
             marker=dict(
                 size=8,
@@ -669,7 +735,7 @@ class PerformanceVisualizer:
             name='Performances'
         )
         
-        fig = go.Figure(data=[edge_trace, date_trace, perf_trace])
+        fig = go.Figure(data=[edge_trace, *self._bubble_traces(level, '#FFB6C1'), date_trace, perf_trace])
         
         fig.update_layout(
             title='Festival Performances Network - By Date',
@@ -683,6 +749,8 @@ class PerformanceVisualizer:
             height=700
         )
         
+        self._apply_focus(fig, level)
+        
         return fig
     
     def create_category_distribution(self) -> go.Figure:
@@ -708,9 +776,8 @@ class PerformanceVisualizer:
     
     def create_venue_distribution(self) -> go.Figure:
         """Create bar chart of performances by venue."""
-        # Extract main venues
-        self.df['Main_Venue'] = self.df['Venue'].str.split(',').str[0]
-        venue_counts = self.df['Main_Venue'].value_counts().sort_values(ascending=True)
+        graph = self._festival_graph()
+        venue_counts = pd.Series(np.bincount(graph.venue_codes), index=graph.venues).sort_values(ascending=True)
         
         fig = go.Figure(data=[go.Bar(
             x=venue_counts.values,
@@ -736,25 +803,18 @@ class PerformanceVisualizer:
         """
         Create sunburst chart showing category->subcategory hierarchy.
         """
-        # Prepare data
-        data = []
-        for idx, row in self.df.iterrows():
-            data.append({
-                'Category': row['Category'],
-                'SubCategory': row['Sub_Category'],
-                'Count': 1
-            })
-        
-        df_hier = pd.DataFrame(data)
-        
         # Group and count
-        grouped = df_hier.groupby(['Category', 'SubCategory']).size().reset_index(name='Count')
+        grouped = (
+            self.df.groupby(['Category', 'Sub_Category']).size()
+            .reset_index(name='Count')
+            .rename(columns={'Sub_Category': 'SubCategory'})
+        )
+        category_totals = grouped.groupby('Category')['Count'].sum()
         
         fig = go.Figure(go.Sunburst(
-            labels=['All'] + grouped['Category'].unique().tolist() + grouped['SubCategory'].tolist(),
-            parents=[''] + ['All'] * len(grouped['Category'].unique()) + grouped['Category'].tolist(),
-            values=[len(df_hier)] + [grouped[grouped['Category'] == cat]['Count'].sum() 
-                                     for cat in grouped['Category'].unique()] + grouped['Count'].tolist(),
+            labels=['All'] + category_totals.index.tolist() + grouped['SubCategory'].tolist(),
+            parents=[''] + ['All'] * len(category_totals) + grouped['Category'].tolist(),
+            values=[len(self.df)] + category_totals.tolist() + grouped['Count'].tolist(),
             marker=dict(
                 colorscale='RdBu',
                 line=dict(color='white', width=2)
@@ -843,7 +903,7 @@ class PerformanceVisualizer:
         return display_df
 
 
-    def create_itinerary_highlighted_network(self) -> go.Figure:
+    def create_itinerary_highlighted_network(self, overview: bool = False, drill_down: Optional[int] = None) -> go.Figure:
         """
         Create the hierarchical network with itinerary performances HIGHLIGHTED.
         
@@ -852,77 +912,40 @@ class PerformanceVisualizer:
         - Itinerary performances highlighted with bold colors and larger size
         - Edges connecting to itinerary performances are highlighted in bold
         
+        In overview, the other performances are replaced by count bubbles and only
+        the itinerary (and the drill-down) is drawn individually.
+        
+        Args:
+            overview: Show count bubbles (per venue and date) instead of individual performances
+            drill_down: Category venue code whose performances are shown individually in overview
+            
         Returns:
             Interactive Plotly figure with highlighted itinerary path
         """
         if not self.itinerary:
             st.warning("No itinerary to visualize. Generate an itinerary first.")
-            return self.create_hierarchical_network()
-        
-        # Create directed graph
-        G = nx.DiGraph()
-        
-        # Extract main venues
-        self.df['Main_Venue'] = self.df['Venue'].str.split(',').str[0]
-        
-        # Level 1: Add category nodes (ROOT)
-        categories = self.df['Category'].unique()
-        for category in categories:
-            G.add_node(f"CAT_{category}", node_type='category', label=category, size=50)
-        
-        # Level 2: Add venue nodes as sub-parents under categories
-        for category in categories:
-            venues_in_category = self.df[self.df['Category'] == category]['Main_Venue'].unique()
-            for venue in venues_in_category:
-                venue_key = f"VEN_{venue}_{category}"
-                G.add_node(venue_key, node_type='venue', label=venue, size=35)
-                # Connect venue to its category
-                G.add_edge(f"CAT_{category}", venue_key)
-        
-        # Level 3: Add performance nodes (LEAF)
-        for idx, row in self.df.iterrows():
-            perf_key = f"PERF_{row['Event_ID']}"
-            perf_label = f"{row['Event_Name'][:15]}...\n{row['Time']}"
-            G.add_node(
-                perf_key, 
-                node_type='performance', 
-                label=perf_label,
-                size=12,
-                category=row['Category'],
-                venue=row['Main_Venue'],
-                event_id=row['Event_ID'],
-                in_itinerary=(row['Event_ID'] in self.itinerary_event_ids)
-            )
-            
-            # Connect performance to its venue
-            venue_key = f"VEN_{row['Main_Venue']}_{row['Category']}"
-            G.add_edge(venue_key, perf_key)
-        
-        # Use proper hierarchical layout
-        pos = self._compute_hierarchical_layout(G)
-        
-        # Extract edges - separate highlighted and regular
-        regular_edge_x = []
-        regular_edge_y = []
-        highlighted_edge_x = []
-        highlighted_edge_y = []
-        
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            
-            # Check if this edge leads to an itinerary performance
-            edge_to_node = G.nodes[edge[1]]
-            if edge_to_node.get('node_type') == 'performance' and edge_to_node.get('in_itinerary', False):
-                highlighted_edge_x.extend([x0, x1, None])
-                highlighted_edge_y.extend([y0, y1, None])
-            else:
-                regular_edge_x.extend([x0, x1, None])
-                regular_edge_y.extend([y0, y1, None])
+            return self.create_hierarchical_network(overview, drill_down)
+        
+        # Only the styling depends on the itinerary; graph and layout are shared
+        hierarchy = self._hierarchy_view()
+        perf_x, perf_y = hierarchy['perf_pos']
+        in_itinerary = self._festival_graph().itinerary_mask(self.itinerary_event_ids)
+        level = self._leaf_level('hierarchy', overview, drill_down, always_show=in_itinerary)
+        shown = level['shown']
+        
+        # Split the performance edges: highlight those leading to an itinerary
+        # performance (each edge is 3 coordinates)
+        perf_edge_x, perf_edge_y = level['edges']
+        highlighted = in_itinerary[shown].repeat(3)
+        regular_edges = [hierarchy['venue_edges'], (perf_edge_x[~highlighted], perf_edge_y[~highlighted])]
+        if level['bubbles'] is not None:
+            regular_edges.append(level['bubbles']['edges'])
+        edge_x, edge_y = _join_edges(*regular_edges)
         
         # Regular edge trace (light)
-        edge_trace_regular = go.Scatter(
-            x=regular_edge_x, y=regular_edge_y,
+        edge_trace_regular = _scatter(
+            len(edge_x) // 3,
+            x=edge_x, y=edge_y,
             mode='lines',
             line=dict(width=0.5, color='#ddd'),
             hoverinfo='none',
@@ -931,7 +954,7 @@ class PerformanceVisualizer:
         
         # Highlighted edge trace (bold)
         edge_trace_highlighted = go.Scatter(
-            x=highlighted_edge_x, y=highlighted_edge_y,
+            x=perf_edge_x[highlighted], y=perf_edge_y[highlighted],
             mode='lines',
             line=dict(width=2.5, color='#FF6B6B'),
             hoverinfo='none',
@@ -939,106 +962,40 @@ class PerformanceVisualizer:
             name='Itinerary Path'
         )
         
-        # Extract node data by type
-        category_x, category_y, category_text, category_hover = [], [], [], []
-        venue_x, venue_y, venue_text, venue_hover = [], [], [], []
-        perf_x, perf_y, perf_text, perf_hover, perf_colors = [], [], [], [], []
-        
-        # Color mapping for categories
-        color_map = {'Music': '#FF6B6B', 'Dance': '#4ECDC4', 'Theater': '#45B7D1'}
-        
-        for node in G.nodes():
-            x, y = pos[node]
-            node_data = G.nodes[node]
-            node_type = node_data['node_type']
-            label = node_data['label']
-            
-            if node_type == 'category':
-                category_x.append(x)
-                category_y.append(y)
-                category_text.append(label)
-                perf_count = len(self.df[self.df['Category'] == label])
-                category_hover.append(f"<b>{label}</b><br>Performances: {perf_count}")
-                
-            elif node_type == 'venue':
-                venue_x.append(x)
-                venue_y.append(y)
-                venue_text.append(label.split(',')[0] if ',' in label else label)
-                category = label.split('_')[-1] if '_' in label else 'Mixed'
-                perf_count = len(self.df[self.df['Main_Venue'] == label.replace(f'_{category}', '')])
-                venue_hover.append(f"<b>{label}</b><br>Performances: {perf_count}")
-                
-            elif node_type == 'performance':
-                perf_x.append(x)
-                perf_y.append(y)
-                perf_text.append('•')
-                
-                in_itinerary = node_data.get('in_itinerary', False)
-                if in_itinerary:
-                    # Highlight this performance
-                    perf_colors.append('#FF6B6B')
-                    perf_hover.append(f"<b>✓ IN ITINERARY</b><br>{label}")
-                else:
-                    # Regular performance
-                    perf_colors.append('#D3D3D3')
-                    perf_hover.append(label)
+        category_trace, venue_trace = self._hierarchy_traces()
         
-        # Category nodes (TOP LEVEL - largest)
-        category_trace = go.Scatter(
-            x=category_x, y=category_y,
+        # Performance nodes (LEAF LEVEL - small, larger and red for the itinerary)
+        perf_labels = (self.df['Event_Name'].str[:15] + '...\n' + self.df['Time']).to_numpy()[shown]
+        shown_in_itinerary = in_itinerary[shown]
+        perf_trace = _scatter(
+            shown.sum(),
+            x=perf_x[shown], y=perf_y[shown],
             mode='markers+text',
-            text=category_text,
-            textposition='middle center',
-            textfont=dict(size=12, color='white', family='Arial Black'),
-            hovertext=category_hover,
-            hoverinfo='text',
-            marker=dict(
-                size=55,
-                color=['#FF6B6B', '#4ECDC4', '#45B7D1'],
-                line=dict(width=3, color='white'),
-                symbol='circle'
-            ),
-            name='Categories'
-        )
-        
-        # Venue nodes (MIDDLE LEVEL - medium)
-        venue_trace = go.Scatter(
-            x=venue_x, y=venue_y,
-            mode='markers+text',
-            text=venue_text,
-            textposition='middle center',
-            textfont=dict(size=9, color='white'),
-            hovertext=venue_hover,
-            hoverinfo='text',
-            marker=dict(
-                size=35,
-                color=['#FFE66D', '#95E1D3', '#F38181'] * len(venue_x),
-                line=dict(width=2, color='white'),
-                symbol='diamond'
-            ),
-            name='Venues'
-        )
-        
-        # Performance nodes (LEAF LEVEL - small, with highlighting)
-        perf_trace = go.Scatter(
-            x=perf_x, y=perf_y,
-            mode='markers+text',
-            text=perf_text,
+            text=np.full(shown.sum(), '•'),
             textposition='middle center',
             textfont=dict(size=8, color='white', family='Arial'),
-            hovertext=perf_hover,
+            hovertext=np.where(
+                shown_in_itinerary, np.char.add("<b>✓ IN ITINERARY</b><br>", perf_labels.astype(str)), perf_labels
+            ),
             hoverinfo='text',
             marker=dict(
-                size=[15 if c == '#FF6B6B' else 10 for c in perf_colors],  # Larger for itinerary
-                color=perf_colors,
-                line=dict(width=[3 if c == '#FF6B6B' else 1 for c in perf_colors], color='#333'),
+                size=np.where(shown_in_itinerary, 15, 10),
+                # Numeric colors validate much faster than one color string per node
+                color=shown_in_itinerary.astype(np.int8),
+                colorscale=[[0, '#D3D3D3'], [1, '#FF6B6B']],
+                cmin=0,
+                cmax=1,
+                line=dict(width=np.where(shown_in_itinerary, 3, 1), color='#333'),
                 symbol='circle'
             ),
             name='Performances'
         )
         
         # Create figure
-        fig = go.Figure(data=[edge_trace_regular, edge_trace_highlighted, category_trace, venue_trace, perf_trace])
+        fig = go.Figure(data=[
+            edge_trace_regular, *self._bubble_traces(level, '#D3D3D3'), edge_trace_highlighted,
+            category_trace, venue_trace, perf_trace
+        ])
         
         fig.update_layout(
             title={
@@ -1058,76 +1015,186 @@ class PerformanceVisualizer:
             height=700
         )
         
+        self._apply_focus(fig, level)
+        
         return fig
 
 
-def display_visualization_dashboard(df: pd.DataFrame, schedule_dict: Dict, itinerary: List[Dict] = None):
+# Figure kind -> PerformanceVisualizer method building it
+FIGURE_BUILDERS = {
+    'itinerary': 'create_itinerary_highlighted_network',
+    'hierarchical': 'create_hierarchical_network',
+    'category': 'create_category_network',
+    'venue': 'create_venue_network',
+    'date': 'create_date_network',
+    'category_distribution': 'create_category_distribution',
+    'venue_distribution': 'create_venue_distribution',
+    'sunburst': 'create_subcategory_sunburst',
+    'table': 'create_performance_comparison_table',
+}
+
+# Network figure kind -> view whose parent nodes its drill-down codes refer to
+NETWORK_VIEWS = {
+    'itinerary': 'hierarchy',
+    'hierarchical': 'hierarchy',
+    'category': 'category',
+    'venue': 'venue',
+    'date': 'date',
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_graph(fingerprint: str, _df: pd.DataFrame) -> FestivalGraph:
+    """One FestivalGraph per dataset, shared by every figure and session."""
+    return FestivalGraph(_df)
+
+
+def _build_figure(viz: PerformanceVisualizer, kind: str, overview: bool, drill_down: Optional[int]):
+    """Call the FIGURE_BUILDERS method of kind, passing the level of detail to network figures."""
+    builder = getattr(viz, FIGURE_BUILDERS[kind])
+    return builder(overview, drill_down) if kind in NETWORK_VIEWS else builder()
+
+
+@st.cache_resource(max_entries=FIGURE_CACHE_SIZE, show_spinner=False)
+def _cached_figure(fingerprint: str, itinerary_ids: FrozenSet, kind: str, overview: bool,
+                   drill_down: Optional[int], _df: pd.DataFrame, _schedule_dict: Dict, _itinerary: List[Dict]):
+    """Build one figure; Streamlit keys the cache on the arguments without a leading underscore."""
+    viz = PerformanceVisualizer(_df, _schedule_dict, _itinerary, _cached_graph(fingerprint, _df))
+    return _build_figure(viz, kind, overview, drill_down)
+
+
+def get_graph(df: pd.DataFrame, fingerprint: Optional[str] = None) -> FestivalGraph:
+    """
+    FestivalGraph of df, shared across reruns and sessions when a fingerprint is given.
+    
+    Args:
+        df: Performance DataFrame
+        fingerprint: Dataset fingerprint; without one a new graph is built
+        
+    Returns:
+        FestivalGraph of df
+    """
+    if fingerprint is None:
+        return FestivalGraph(df)
+    return _cached_graph(fingerprint, df)
+
+
+def get_figure(kind: str, df: pd.DataFrame, schedule_dict: Dict, itinerary: List[Dict] = None,
+               fingerprint: Optional[str] = None, overview: bool = False, drill_down: Optional[int] = None):
+    """
+    Build a figure (or the detailed table) of the given kind, memoized across reruns and sessions.
+    
+    Figures are cached by (dataset fingerprint, itinerary event IDs, kind, level of
+    detail). Only the itinerary view depends on the itinerary, so the other views are
+    keyed on an empty set and survive generating a new itinerary. Cached figures are
+    shared; callers must not modify them.
+    
+    Args:
+        kind: Key of FIGURE_BUILDERS
+        df: Performance DataFrame
+        schedule_dict: Schedule dictionary
+        itinerary: Optional list of performances in the generated itinerary
+        fingerprint: Dataset fingerprint (see optimizer.compute_data_fingerprint);
+            without one the figure is built uncached
+        overview: For network figures, show count bubbles instead of individual performances
+        drill_down: For network figures in overview, parent node code (see
+            FestivalGraph.leaf_parents of NETWORK_VIEWS[kind]) whose performances are
+            shown individually
+        
+    Returns:
+        Plotly figure, or a DataFrame for the 'table' kind
+    """
+    itinerary = (itinerary or []) if kind == 'itinerary' else []
+    if kind not in NETWORK_VIEWS or not overview:
+        overview, drill_down = False, None
+    if fingerprint is None:
+        return _build_figure(PerformanceVisualizer(df, schedule_dict, itinerary), kind, overview, drill_down)
+    
+    itinerary_ids = frozenset(perf.get('event_id') for perf in itinerary)
+    return _cached_figure(fingerprint, itinerary_ids, kind, overview, drill_down, df, schedule_dict, itinerary)
+
+
+def display_visualization_dashboard(df: pd.DataFrame, schedule_dict: Dict, itinerary: List[Dict] = None,
+                                    fingerprint: Optional[str] = None):
     """
     Display full visualization dashboard in Streamlit.
     
+    Only the selected view is built, and figures come from get_figure's cache,
+    so reruns that do not change the data or the itinerary do no graph work.
+    Network views of large catalogs open at the count-bubble overview, with a
+    drill-down into the individual performances of one parent node.
+    
     Args:
         df: Performance DataFrame
         schedule_dict: Schedule dictionary
         itinerary: Optional list of performances in the generated itinerary
+        fingerprint: Dataset fingerprint used as the figure cache key
     """
     st.header("📊 Performance Network Visualization")
     
-    # Initialize visualizer with optional itinerary
-    viz = PerformanceVisualizer(df, schedule_dict, itinerary)
+    def figure(kind: str):
+        return get_figure(kind, df, schedule_dict, itinerary, fingerprint)
+    
+    def network_figure(kind: str):
+        """Network figure at the level of detail picked in the controls above it."""
+        _, parent_labels = get_graph(df, fingerprint).leaf_parents(NETWORK_VIEWS[kind])
+        overview = st.toggle(
+            "Overview (count bubbles)",
+            value=len(df) > OVERVIEW_NODE_THRESHOLD,
+            key=f"network_overview_{kind}",
+            help="Group performances into bubbles sized by their count; drill down to see individual performances"
+        )
+        drill_down = None
+        if overview:
+            drill_down = st.selectbox(
+                "Drill down into",
+                [None, *range(len(parent_labels))],
+                format_func=lambda code: "Nothing (counts only)" if code is None else parent_labels[code],
+                key=f"network_drill_down_{kind}"
+            )
+        return get_figure(kind, df, schedule_dict, itinerary, fingerprint, overview, drill_down)
     
-    # Add tab for itinerary visualization if provided
+    views = [
+        "🎭 Complete Hierarchy",
+        "🌐 Category Network",
+        "📍 Venue Network",
+        "📅 Date Network",
+        "🎭 Category Distribution",
+        "🏢 Venue Distribution",
+        "🌳 Hierarchy View",
+        "📋 Detailed View"
+    ]
+    # Add a view for itinerary visualization if provided (with itinerary first)
     if itinerary:
-        # Create tabs for different visualizations (with itinerary first)
-        tab0, tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
-            "🎪 Your Itinerary",
-            "🎭 Complete Hierarchy",
-            "🌐 Category Network",
-            "📍 Venue Network",
-            "📅 Date Network",
-            "🎭 Category Distribution",
-            "🏢 Venue Distribution",
-            "🌳 Hierarchy View",
-            "📋 Detailed View"
-        ])
+        views.insert(0, "🎪 Your Itinerary")
+    
+    view = st.radio("View:", views, horizontal=True, key="network_view")
+    
+    if view == "🎪 Your Itinerary":
+        st.subheader("🎪 Your Optimal Itinerary (Highlighted)")
+        st.info(f"""
+        **Your personalized itinerary includes {len(itinerary)} performances across {len(set(p.get('date') for p in itinerary))} days!**
         
-        with tab0:
-            st.subheader("🎪 Your Optimal Itinerary (Highlighted)")
-            st.info(f"""
-            **Your personalized itinerary includes {len(itinerary)} performances across {len(set(p.get('date') for p in itinerary))} days!**
-            
-            - **Red nodes (●):** Performances in your itinerary (LARGER and more prominent)
-            - **Red edges:** Connections to your selected performances
-            - **Gray elements:** Other available performances
-            
-            Hover over red nodes to see details. This visualization shows your optimal path through the festival!
-            """)
-            fig = viz.create_itinerary_highlighted_network()
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Add itinerary summary
-            st.subheader("📋 Itinerary Summary")
-            itin_col1, itin_col2, itin_col3 = st.columns(3)
-            with itin_col1:
-                st.metric("Total Performances", len(itinerary))
-            with itin_col2:
-                st.metric("Festival Days", len(set(p.get('date') for p in itinerary)))
-            with itin_col3:
-                categories = set(p.get('category') for p in itinerary)
-                st.metric("Categories", len(categories))
-    else:
-        # Create tabs without itinerary
-        tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
-            "🎭 Complete Hierarchy",
-            "🌐 Category Network",
-            "📍 Venue Network",
-            "📅 Date Network",
-            "🎭 Category Distribution",
-            "🏢 Venue Distribution",
-            "🌳 Hierarchy View",
-            "📋 Detailed View"
-        ])
+        - **Red nodes (●):** Performances in your itinerary (LARGER and more prominent)
+        - **Red edges:** Connections to your selected performances
+        - **Gray elements:** Other available performances
+        
+        Hover over red nodes to see details. This visualization shows your optimal path through the festival!
+        """)
+        st.plotly_chart(network_figure('itinerary'), use_container_width=True)
+        
+        # Add itinerary summary
+        st.subheader("📋 Itinerary Summary")
+        itin_col1, itin_col2, itin_col3 = st.columns(3)
+        with itin_col1:
+            st.metric("Total Performances", len(itinerary))
+        with itin_col2:
+            st.metric("Festival Days", len(set(p.get('date') for p in itinerary)))
+        with itin_col3:
+            categories = set(p.get('category') for p in itinerary)
+            st.metric("Categories", len(categories))
     
-    with tab1:
+    elif view == "🎭 Complete Hierarchy":
         st.subheader("Complete Festival Hierarchy Network")
         st.info("""
         🎭 **Hierarchical Structure:** Categories → Venues → Performances
@@ -1138,8 +1205,7 @@ def display_visualization_dashboard(df: pd.DataFrame, schedule_dict: Dict, itine
         
         **Interact:** Hover over nodes to see performance counts, zoom in/out, and explore relationships!
         """)
-        fig = viz.create_hierarchical_network()
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(network_figure('hierarchical'), use_container_width=True)
         
         # Add statistics
         st.subheader("📊 Hierarchy Statistics")
@@ -1152,29 +1218,25 @@ def display_visualization_dashboard(df: pd.DataFrame, schedule_dict: Dict, itine
         with col3:
             st.metric("Total Performances", len(df))
     
-    with tab2:
+    elif view == "🌐 Category Network":
         st.subheader("Performances Connected by Category")
         st.info("Each category is connected to its performances. Larger nodes represent categories, smaller nodes represent performances.")
-        fig = viz.create_category_network()
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(network_figure('category'), use_container_width=True)
     
-    with tab3:
+    elif view == "📍 Venue Network":
         st.subheader("Performances Connected by Venue")
         st.info("Each venue is connected to performances happening there. Explore which performances are at each location.")
-        fig = viz.create_venue_network()
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(network_figure('venue'), use_container_width=True)
     
-    with tab4:
+    elif view == "📅 Date Network":
         st.subheader("Performances Connected by Date")
         st.info("Each date is connected to performances scheduled on that day. See temporal distribution.")
-        fig = viz.create_date_network()
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(network_figure('date'), use_container_width=True)
     
-    with tab5:
+    elif view == "🎭 Category Distribution":
         st.subheader("Category Distribution")
         st.info("Pie chart showing the percentage breakdown of performances by category.")
-        fig = viz.create_category_distribution()
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(figure('category_distribution'), use_container_width=True)
         
         # Show stats
         col1, col2, col3 = st.columns(3)
@@ -1189,23 +1251,22 @@ def display_visualization_dashboard(df: pd.DataFrame, schedule_dict: Dict, itine
         with col3:
             st.metric("🎭 Theater", theater_count)
     
-    with tab6:
+    elif view == "🏢 Venue Distribution":
         st.subheader("Venue Distribution")
         st.info("Bar chart showing the number of performances at each venue.")
-        fig = viz.create_venue_distribution()
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(figure('venue_distribution'), use_container_width=True)
     
-    with tab7:
+    elif view == "🌳 Hierarchy View":
         st.subheader("Performance Hierarchy")
         st.info("Interactive sunburst chart showing the hierarchy from Category to Sub-Category.")
-        fig = viz.create_subcategory_sunburst()
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(figure('sunburst'), use_container_width=True)
     
-    with tab8:
+    elif view == "📋 Detailed View":
         st.subheader("Detailed Performance Table")
         st.info("Browse all performances in a detailed table format. Click column headers to sort.")
         
-        display_df = viz.create_performance_comparison_table()
+        # Shared with other sessions through the cache, so only filtered copies are changed
+        display_df = figure('table')
         
         # Add filtering
         col1, col2 = st.columns(2)
@@ -1220,7 +1281,7 @@ def display_visualization_dashboard(df: pd.DataFrame, schedule_dict: Dict, itine
         with col2:
             selected_venue = st.multiselect(
                 "Filter by Venue:",
-                options=['All'] + df['Main_Venue'].unique().tolist(),
+                options=['All'] + df['Venue'].str.split(',').str[0].unique().tolist(),
                 default=['All']
             )
         
@@ -1231,9 +1292,7 @@ def display_visualization_dashboard(df: pd.DataFrame, schedule_dict: Dict, itine
             filtered_df = filtered_df[filtered_df['Category'].isin(selected_category)]
         
         if 'All' not in selected_venue:
-            df['Main_Venue'] = df['Venue'].str.split(',').str[0]
-            display_df['Venue'] = df['Main_Venue']
-            filtered_df = filtered_df[filtered_df['Venue'].isin(selected_venue)]
+            filtered_df = filtered_df[filtered_df['Venue'].str.split(',').str[0].isin(selected_venue)]
         
         # Display table
         st.dataframe(
@@ -1253,4 +1312,3 @@ def display_visualization_dashboard(df: pd.DataFrame, schedule_dict: Dict, itine
         
         # Show summary
         st.success(f"Showing {len(filtered_df)} of {len(display_df)} performances")
-